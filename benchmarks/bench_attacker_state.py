@@ -0,0 +1,75 @@
+"""Time the attacker hull state pullback: string merge_asof vs. combatant codes.
+
+Normalizes the synthetic 1M-event GVS from bench_gvs (and a 60k-event cut of
+it) up to the attacker state step, then attaches attacker_hull_percentage
+once through the previous participants-plus-history merge_asof on the
+(name, ship, alliance) strings and once through the coded state walk.
+
+Usage: python -m benchmarks.bench_attacker_state
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from benchmarks.bench_gvs import synthetic_gvs
+from benchmarks.common import best_of
+from stfc_parser.algebra.NonNormalizedGVS import NonNormalizedGVS
+from stfc_parser.algebra.NormalizedGVS import NormalizedGVS
+
+SIZES = (60_000, 1_000_000)
+
+
+def legacy_attacker_state(df: pd.DataFrame) -> pd.DataFrame:
+    """The previous pullback: a backward merge_asof keyed by the attacker strings."""
+    df = df.copy()
+    df["time_key"] = df["round"] * 1_000_000 + df["battle_event"] * 1_000 + df["shot_index"]
+    state_history = df[
+        ["time_key", "target_name", "target_ship", "target_alliance", "current_hull_percentage"]
+    ].copy()
+    state_history.columns = ["time_key", "name", "ship", "alliance", "hp_pct"]
+    participants = pd.concat(
+        [
+            df[[f"{role}_{field}" for field in ("name", "ship", "alliance")]].set_axis(
+                ["name", "ship", "alliance"], axis=1
+            )
+            for role in ("attacker", "target")
+        ]
+    ).drop_duplicates()
+    participants["time_key"] = -1
+    participants["hp_pct"] = 1.0
+    full_history = pd.concat([participants, state_history]).sort_values("time_key")
+    df = pd.merge_asof(
+        df.sort_values("time_key"),
+        full_history,
+        on="time_key",
+        left_by=["attacker_name", "attacker_ship", "attacker_alliance"],
+        right_by=["name", "ship", "alliance"],
+        direction="backward",
+        allow_exact_matches=False,
+    )
+    df = df.rename(columns={"hp_pct": "attacker_hull_percentage"})
+    df["attacker_hull_percentage"] = df["attacker_hull_percentage"].fillna(1.0)
+    return df
+
+
+def normalized_events(rows: int) -> pd.DataFrame:
+    """Return the normalized frame just before the attacker state step."""
+    gvs = synthetic_gvs(rows)
+    full = NormalizedGVS.from_non_normalized(NonNormalizedGVS(gvs.df.assign(initial_hull_health=1e8)))
+    return full.df.drop(columns=["time_key", "name", "ship", "alliance", "attacker_hull_percentage"])
+
+
+def main() -> None:
+    for rows in SIZES:
+        df = normalized_events(rows)
+        print(f"{rows} attack events, attacker_hull_percentage")
+        legacy_s = best_of(lambda: legacy_attacker_state(df), repeat=3)
+        coded_s = best_of(lambda: NormalizedGVS._annotate_attacker_state(df), repeat=3)
+        print(f"  merge_asof on strings  {legacy_s * 1e3:8.1f} ms")
+        print(f"  coded state walk       {coded_s * 1e3:8.1f} ms  ({legacy_s / coded_s:.1f}x)")
+        assert NormalizedGVS._annotate_attacker_state(df).equals(legacy_attacker_state(df))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Measure per-operation overhead of carrying side frames in ``DataFrame.attrs``.
+
+Usage: python -m benchmarks.bench_attrs
+"""
+
+from __future__ import annotations
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.core.FilterCombatDataframeByCombatant import FilterCombatDataframeByCombatant
+from stfc_parser.parser_stub import parse_battle
+from stfc_parser.rough.derive_metrics import add_shot_index
+from stfc_parser.schemas import CombatSchema, normalize_dataframe_for_schema
+
+
+def main() -> None:
+    quiet()
+    path = smoketest_logs()[0]
+    battle = parse_battle(path.read_bytes(), path.name)
+    bare = battle.combat_df
+    legacy = battle.to_combat_df()
+    spec = ShipSpecifier(name=str(bare["attacker_name"].dropna().iloc[0]), alliance=None, ship=None)
+    operations = {
+        "boolean filter": lambda df: df[df["round"] == 1],
+        "copy()": lambda df: df.copy(),
+        "column arithmetic": lambda df: df["round"] + 1,
+        "filter by attacker spec": lambda df: FilterCombatDataframeByCombatant._get_combat_df_filtered_by_specs(
+            df, [spec], "attacker"
+        ),
+        "add_shot_index": add_shot_index,
+        "normalize_dataframe_for_schema": lambda df: normalize_dataframe_for_schema(df, CombatSchema),
+    }
+    print(f"{path.name}: {len(bare)} combat rows")
+    print(f"{'operation':32} {'attrs (us)':>12} {'ParsedBattle (us)':>18}")
+    for name, op in operations.items():
+        with_attrs = best_of(lambda: op(legacy), repeat=20)
+        without = best_of(lambda: op(bare), repeat=20)
+        print(f"{name:32} {with_attrs * 1e6:12.0f} {without * 1e6:18.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Measure parse_many throughput (files/sec) against worker count.
+
+Usage: python -m benchmarks.bench_batch [max_workers]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+from benchmarks.common import quiet, smoketest_logs
+from stfc_parser.batch import parse_many
+
+
+def main() -> None:
+    quiet()
+    paths = smoketest_logs()
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    print(f"corpus: {len(paths)} files, cpu_count={os.cpu_count()}")
+    workers = 1
+    while workers <= max_workers:
+        for chunksize in (1, 4):
+            start = time.perf_counter()
+            failures = sum(not result.ok for result in parse_many(paths, workers=workers, chunksize=chunksize))
+            elapsed = time.perf_counter() - start
+            print(
+                f"workers={workers:2d} chunksize={chunksize}: {len(paths) / elapsed:6.1f} files/sec"
+                f" ({elapsed:.2f} s, {failures} failures)"
+            )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
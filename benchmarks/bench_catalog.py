@@ -0,0 +1,43 @@
+"""Compare a header-only scan with a full parse, and time building a catalog.
+
+Usage: python -m benchmarks.bench_catalog [workers]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.catalog import build_catalog, scan_header
+from stfc_parser.parser_stub import parse_battle
+
+
+def main() -> None:
+    quiet()
+    paths = smoketest_logs()
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    largest = paths[0]
+    full = best_of(lambda: parse_battle(largest.read_bytes(), largest.name))
+    header = best_of(lambda: scan_header(largest))
+    print(f"largest log ({largest.stat().st_size / 1024:.0f} KiB):")
+    print(f"  parse_battle {full * 1e3:7.1f} ms   scan_header {header * 1e3:6.1f} ms")
+
+    start = time.perf_counter()
+    for path in paths:
+        parse_battle(path.read_bytes(), path.name)
+    full = time.perf_counter() - start
+    start = time.perf_counter()
+    catalog = build_catalog(paths, workers=1)
+    serial = time.perf_counter() - start
+    start = time.perf_counter()
+    build_catalog(paths, workers=workers)
+    pooled = time.perf_counter() - start
+    print(f"corpus ({len(catalog)} files):")
+    print(f"  parse_battle      {full:6.2f} s  ({len(paths) / full:6.1f} files/sec)")
+    print(f"  catalog, serial   {serial:6.2f} s  ({len(paths) / serial:6.1f} files/sec)")
+    print(f"  catalog, pooled   {pooled:6.2f} s  ({len(paths) / pooled:6.1f} files/sec)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""Report per-column memory savings of the compact combat dtypes.
+
+Usage: python -m benchmarks.bench_compact
+"""
+
+from __future__ import annotations
+
+from benchmarks.common import quiet, smoketest_logs
+from stfc_parser.compact import compact_combat_df, memory_report
+from stfc_parser.parser_stub import parse_battle
+
+
+def main() -> None:
+    quiet()
+    paths = smoketest_logs()
+    largest = parse_battle(paths[0].read_bytes(), paths[0].name).combat_df
+    report = memory_report(largest, compact_combat_df(largest))
+    print(f"{paths[0].name}: {len(largest)} rows")
+    print(report.to_string())
+    before = report["bytes_before"].sum()
+    after = report["bytes_after"].sum()
+    print(f"total: {before / 2**20:.2f} MiB -> {after / 2**20:.2f} MiB ({after / before:.0%})")
+
+    corpus_before = corpus_after = 0
+    for path in paths:
+        combat_df = parse_battle(path.read_bytes(), path.name).combat_df
+        corpus_before += combat_df.memory_usage(deep=True).sum()
+        corpus_after += compact_combat_df(combat_df).memory_usage(deep=True).sum()
+    print(
+        f"corpus ({len(paths)} files): {corpus_before / 2**20:.1f} MiB -> "
+        f"{corpus_after / 2**20:.1f} MiB ({corpus_after / corpus_before:.0%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
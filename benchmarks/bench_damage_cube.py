@@ -0,0 +1,67 @@
+"""Time dashboard damage questions: one groupby each vs. a prebuilt damage cube.
+
+Answers four questions (hull damage per round and attacker, every metric per
+attacker and target, the apex/iso/normal mitigation split per target, and the
+running hull damage per target by round) on the largest smoketest log's GVS
+and on the synthetic 1M-event GVS from bench_gvs. The previous route runs a
+pandas groupby per question; the cube route builds the DamageCube once
+(cold) and then answers from it (warm).
+
+Usage: python -m benchmarks.bench_damage_cube
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from benchmarks.bench_gvs import synthetic_gvs
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.algebra.DamageCube import DamageCube
+from stfc_parser.algebra.NonNormalizedGVS import NonNormalizedGVS
+from stfc_parser.parser_stub import parse_battle_file
+
+ATTACKER = ["attacker_name", "attacker_alliance", "attacker_ship"]
+TARGET = ["target_name", "target_alliance", "target_ship"]
+MITIGATION = ["mitigated_apex", "mitigated_iso", "mitigated_normal"]
+
+
+def groupby_answers(gvs: NonNormalizedGVS) -> list:
+    df = gvs.df.fillna({column: "" for column in ATTACKER + TARGET})
+    return [
+        df.groupby(["round", *ATTACKER])["hull_damage"].sum(),
+        df.groupby(ATTACKER + TARGET)[list(DamageCube.METRICS[1:])].sum(),
+        df.groupby(TARGET)[MITIGATION].sum(),
+        df.groupby(["round", *TARGET])["hull_damage"].sum().groupby(TARGET).cumsum(),
+    ]
+
+
+def cube_answers(cube: DamageCube) -> list:
+    return [
+        cube.marginal("round", "attacker", metric="hull_damage"),
+        cube.marginal("attacker", "target"),
+        cube.marginal("target")[:, [cube.index_of("metric", metric) for metric in MITIGATION]],
+        cube.cumulative[..., cube.index_of("metric", "hull_damage")].sum(axis=1),
+    ]
+
+
+def main() -> None:
+    quiet()
+    battle = parse_battle_file(smoketest_logs()[0])
+    logged = NonNormalizedGVS.from_parser_outputs(battle.combat_df, battle.players_df)
+    for label, gvs in (("largest smoketest log", logged), ("synthetic", synthetic_gvs())):
+        print(f"{label}: {len(gvs.df)} attack events, four damage questions")
+        cube = DamageCube.from_non_normalized(gvs)
+        legacy_s = best_of(lambda: groupby_answers(gvs), repeat=3)
+        cold_s = best_of(lambda: cube_answers(DamageCube.from_non_normalized(gvs)), repeat=3)
+        warm_s = best_of(lambda: cube_answers(cube), repeat=3)
+        print(f"  groupby per question   {legacy_s * 1e3:8.2f} ms")
+        print(f"  cube, build + answer   {cold_s * 1e3:8.2f} ms  ({legacy_s / cold_s:.1f}x)")
+        print(f"  cube, answer only      {warm_s * 1e3:8.2f} ms  ({legacy_s / warm_s:.1f}x)")
+        print(f"  cube size              {cube.values.nbytes / 1e6:8.2f} MB")
+
+        hull = groupby_answers(gvs)[0]
+        assert np.isclose(cube_answers(cube)[0].sum(), hull.sum())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Compare parse time and resident memory of the C and pyarrow section engines.
+
+Each engine runs in its own subprocess so peak RSS is not shared. The child
+parses the whole corpus once, keeping every ParsedBattle alive, and reports
+wall time plus ru_maxrss before and after.
+
+Usage: python -m benchmarks.bench_engine
+"""
+
+from __future__ import annotations
+
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks.common import ROOT, best_of, quiet, smoketest_logs
+from stfc_parser.StartsWhen import pyarrow_available, resolve_engine
+
+
+def _max_rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_child(engine: str) -> None:
+    from stfc_parser.parser_stub import parse_battle
+
+    quiet()
+    payloads = [(path.read_bytes(), path.name) for path in smoketest_logs()]
+    parse_battle(*payloads[-1], engine=engine)  # warm imports and caches
+    rss_before = _max_rss_mib()
+    start = time.perf_counter()
+    battles = [parse_battle(*payload, engine=engine) for payload in payloads]
+    elapsed = time.perf_counter() - start
+    rss_after = _max_rss_mib()
+    largest = best_of(lambda: parse_battle(*payloads[0], engine=engine), repeat=3)
+    print(
+        json.dumps(
+            {
+                "engine": resolve_engine(engine),
+                "files": len(battles),
+                "corpus_s": elapsed,
+                "largest_ms": largest * 1e3,
+                "rss_before_mib": rss_before,
+                "rss_after_mib": rss_after,
+            }
+        )
+    )
+
+
+def main() -> None:
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        run_child(sys.argv[2])
+        return
+    engines = ["c"]
+    if pyarrow_available():
+        engines.append("pyarrow")
+    else:
+        print("pyarrow is not installed; only the C engine is measured.")
+    print(
+        f"{'engine':8} {'files':>5} {'corpus (s)':>11} {'largest (ms)':>13}"
+        f" {'rss before (MiB)':>17} {'rss after (MiB)':>16}"
+    )
+    for engine in engines:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_engine", "--child", engine],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        stats = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{stats['engine']:8} {stats['files']:5d} {stats['corpus_s']:11.2f}"
+            f" {stats['largest_ms']:13.1f} {stats['rss_before_mib']:17.1f}"
+            f" {stats['rss_after_mib']:16.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
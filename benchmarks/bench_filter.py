@@ -0,0 +1,77 @@
+"""Time combatant filtering with per-call masks vs. the per-role index.
+
+Filters the largest smoketest log once per spec, the way a dashboard builds
+one panel per ship, for 50+ specs mixing full and partially-specified ones.
+
+Usage: python -m benchmarks.bench_filter
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import pandas as pd
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.SessionInfo import SessionInfo
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.parser_stub import parse_battle_file
+
+
+def masked_filter(df: pd.DataFrame, specs: Sequence[ShipSpecifier], role: str) -> pd.DataFrame:
+    """The previous implementation: one boolean mask over the frame per spec."""
+    mask = pd.Series(False, index=df.index)
+    for spec in specs:
+        spec_mask = pd.Series(True, index=df.index)
+        if spec.name:
+            spec_mask &= df[f"{role}_name"] == spec.name
+        if spec.alliance:
+            spec_mask &= df[f"{role}_alliance"] == spec.alliance
+        if spec.ship:
+            spec_mask &= df[f"{role}_ship"] == spec.ship
+        mask |= spec_mask
+    return df.loc[mask]
+
+
+def bench_specs(session: SessionInfo, minimum: int = 50) -> list[ShipSpecifier]:
+    ships = sorted(session.get_every_ship(), key=str)
+    specs = list(ships)
+    specs += [ShipSpecifier(ship.name, None, None) for ship in ships]
+    specs += [ShipSpecifier(None, None, ship.ship) for ship in ships]
+    specs += [ShipSpecifier(None, ship.alliance, None) for ship in ships if ship.alliance]
+    while len(specs) < minimum:
+        specs.append(ShipSpecifier(f"missing-{len(specs)}", None, None))
+    return specs
+
+
+def main() -> None:
+    quiet()
+    path = smoketest_logs()[0]
+    battle = parse_battle_file(path)
+    session = SessionInfo(battle)
+    specs = bench_specs(session)
+    rows = len(battle.combat_df)
+    print(f"{path.name}: {rows} rows, {len(specs)} specs, one filter call per spec and role")
+
+    def masked() -> None:
+        for role in ("attacker", "target"):
+            for spec in specs:
+                masked_filter(battle.combat_df, [spec], role)
+
+    def indexed() -> None:
+        for role in ("attacker", "target"):
+            for spec in specs:
+                session.combatant_filter.filter_by_specs([spec], role)
+
+    def cold_index() -> None:
+        SessionInfo(battle).combatant_filter.filter_by_specs(specs, "attacker")
+
+    masked_s = best_of(masked)
+    indexed_s = best_of(indexed)
+    print(f"  masked   {masked_s * 1e3:8.1f} ms")
+    print(f"  indexed  {indexed_s * 1e3:8.1f} ms  ({masked_s / indexed_s:.1f}x)")
+    print(f"  building the attacker index + one all-spec call: {best_of(cold_index) * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Time per-round and per-target GVS projections: masked copies vs. partition views.
+
+Builds a synthetic NonNormalizedGVS of 1M attack events over 200 rounds and
+50 targets, then walks every round and every target the way the per-round
+charts do, once through by_round/for_target on the previous mask-and-copy
+path and once through the partitioned views.
+
+Usage: python -m benchmarks.bench_gvs
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import best_of
+from stfc_parser.algebra.NonNormalizedGVS import NonNormalizedGVS
+
+ROWS = 1_000_000
+ROUNDS = 200
+TARGETS = 50
+
+
+def synthetic_gvs(rows: int = ROWS, seed: int = 0) -> NonNormalizedGVS:
+    rng = np.random.default_rng(seed)
+    rounds = np.sort(rng.integers(1, ROUNDS + 1, rows))
+    names = np.array([f"Target {i}" for i in range(TARGETS)], dtype=object)
+    df = pd.DataFrame(
+        {
+            "round": rounds,
+            "battle_event": np.arange(rows),
+            "shot_index": pd.array(rng.integers(1, 6, rows), dtype="Int64"),
+            "event_type": "Attack",
+            "attacker_name": names[rng.integers(0, TARGETS, rows)],
+            "attacker_ship": "Ship",
+            "attacker_alliance": "",
+            "target_name": names[rng.integers(0, TARGETS, rows)],
+            "target_ship": "Ship",
+            "target_alliance": "",
+            "is_crit": rng.random(rows) < 0.2,
+        }
+    )
+    for column in NonNormalizedGVS.OFFENSIVE_COLS[1:] + NonNormalizedGVS.DEFENSIVE_COLS:
+        df[column] = rng.random(rows) * 1e6
+    df["initial_hull_health"] = 1e9
+    return NonNormalizedGVS(df)
+
+
+def masked_rounds(gvs: NonNormalizedGVS) -> None:
+    """The previous by_round: a full boolean scan and a copy per round."""
+    for k in gvs.df["round"].unique():
+        NonNormalizedGVS(gvs.df[gvs.df["round"] == k].copy())
+
+
+def masked_targets(gvs: NonNormalizedGVS) -> None:
+    """The previous for_target: a full boolean scan and a copy per target."""
+    for name in gvs.df["target_name"].unique():
+        NonNormalizedGVS(gvs.df[gvs.df["target_name"] == name].copy())
+
+
+def main() -> None:
+    gvs = synthetic_gvs()
+    print(f"{len(gvs.df)} events, {ROUNDS} rounds, {TARGETS} targets")
+
+    def fresh_rounds() -> None:
+        for _ in NonNormalizedGVS(gvs.df).iter_rounds():
+            pass
+
+    def fresh_targets() -> None:
+        for _ in NonNormalizedGVS(gvs.df).iter_targets():
+            pass
+
+    def warm_rounds() -> None:
+        for _ in gvs.iter_rounds():
+            pass
+
+    def warm_targets() -> None:
+        for _ in gvs.iter_targets():
+            pass
+
+    for label, masked, fresh, warm in (
+        ("all rounds", masked_rounds, fresh_rounds, warm_rounds),
+        ("all targets", masked_targets, fresh_targets, warm_targets),
+    ):
+        masked_s = best_of(lambda: masked(gvs), repeat=3)
+        fresh_s = best_of(fresh, repeat=3)
+        warm_s = best_of(warm, repeat=3)
+        print(label)
+        print(f"  masked copies             {masked_s * 1e3:8.1f} ms")
+        print(f"  views, building partition {fresh_s * 1e3:8.1f} ms  ({masked_s / fresh_s:.1f}x)")
+        print(f"  views, partition built    {warm_s * 1e3:8.1f} ms  ({masked_s / warm_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Time health reconstruction: masked combat scans vs. the HealthLedger.
+
+Works on the largest smoketest log and on that log's combat rows tiled to
+60k rows (each copy shifted past the previous one's last round). Times the
+hull damage each ship took as FixPlayersDataframe used to read it (a combat
+mask per player ship) against the ledger, and 200 "state of X at round r,
+event e" questions as a masked sum each against ledger point queries. Cold
+timings build the ledger; warm ones reuse a built (session) ledger.
+
+Usage: python -m benchmarks.bench_health
+"""
+
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.core.HealthLedger import HealthLedger
+from stfc_parser.parser_stub import parse_battle_file
+
+TILED_ROWS = 60_000
+QUERIES = 200
+
+
+def tiled(combat_df: pd.DataFrame, rows: int) -> pd.DataFrame:
+    """Repeat the combat rows until there are ``rows`` of them, shifting rounds per copy."""
+    span = int(combat_df["round"].max()) + 1
+    copies = -(-rows // len(combat_df))
+    frames = [combat_df.assign(round=combat_df["round"] + copy * span) for copy in range(copies)]
+    return pd.concat(frames, ignore_index=True).iloc[:rows]
+
+
+def legacy_hull_taken(combat_df: pd.DataFrame, ships: list[str]) -> list[float]:
+    """The previous reconstruction: one combat scan per player ship."""
+    return [combat_df[combat_df["target_ship"] == ship]["hull_damage"].sum() for ship in ships]
+
+
+def ledger_hull_taken(ledger: HealthLedger, ships: list[str]) -> list[float]:
+    damage_by_ship = (
+        ledger.total_damage().query("ship != ''").groupby("ship")["hull_damage"].sum()
+    )
+    return [damage_by_ship.get(ship, 0.0) for ship in ships]
+
+
+def masked_queries(combat_df: pd.DataFrame, questions: list[tuple]) -> list[tuple[float, float]]:
+    """Answer each question with a mask over the whole combat frame."""
+    names = combat_df["target_name"].fillna("")
+    alliances = combat_df["target_alliance"].fillna("")
+    ships = combat_df["target_ship"].fillna("")
+    answers = []
+    for spec, k, event in questions:
+        hit = (names == spec.name) & (alliances == spec.alliance) & (ships == spec.ship)
+        hit &= (combat_df["round"] < k) | ((combat_df["round"] == k) & (combat_df["battle_event"] <= event))
+        answers.append((combat_df.loc[hit, "shield_damage"].sum(), combat_df.loc[hit, "hull_damage"].sum()))
+    return answers
+
+
+def ledger_queries(ledger: HealthLedger, questions: list[tuple]) -> list[tuple[float, float]]:
+    return [ledger.damage_taken(spec, k, event) for spec, k, event in questions]
+
+
+def main() -> None:
+    quiet()
+    battle = parse_battle_file(smoketest_logs()[0])
+    rng = random.Random(0)
+    for label, combat_df in (
+        ("largest smoketest log", battle.combat_df),
+        ("tiled", tiled(battle.combat_df, TILED_ROWS)),
+    ):
+        ledger = HealthLedger(combat_df)
+        specs = ledger.registry.specs
+        ships = sorted({spec.ship for spec in specs if spec.ship})
+        rounds = combat_df["round"].unique().tolist()
+        events = combat_df["battle_event"].to_numpy()
+        questions = [
+            (rng.choice(specs), rng.choice(rounds), int(rng.choice(events))) for _ in range(QUERIES)
+        ]
+        print(f"{label}: {len(combat_df)} combat rows, {len(specs)} combatants")
+
+        legacy_s = best_of(lambda: legacy_hull_taken(combat_df, ships), repeat=3)
+        cold_s = best_of(lambda: ledger_hull_taken(HealthLedger(combat_df), ships), repeat=3)
+        warm_s = best_of(lambda: ledger_hull_taken(ledger, ships), repeat=3)
+        print(f"  hull taken, {len(ships)} ship scans        {legacy_s * 1e3:8.2f} ms")
+        print(f"  hull taken, build + ledger         {cold_s * 1e3:8.2f} ms  ({legacy_s / cold_s:.1f}x)")
+        print(f"  hull taken, ledger only            {warm_s * 1e3:8.2f} ms  ({legacy_s / warm_s:.1f}x)")
+        np.testing.assert_allclose(ledger_hull_taken(ledger, ships), legacy_hull_taken(combat_df, ships))
+
+        legacy_s = best_of(lambda: masked_queries(combat_df, questions), repeat=3)
+        cold_s = best_of(lambda: ledger_queries(HealthLedger(combat_df), questions), repeat=3)
+        warm_s = best_of(lambda: ledger_queries(ledger, questions), repeat=3)
+        print(f"  {QUERIES} point queries, masked sums     {legacy_s * 1e3:8.2f} ms")
+        print(f"  {QUERIES} point queries, build + ledger  {cold_s * 1e3:8.2f} ms  ({legacy_s / cold_s:.1f}x)")
+        print(f"  {QUERIES} point queries, ledger only     {warm_s * 1e3:8.2f} ms  ({legacy_s / warm_s:.1f}x)")
+        np.testing.assert_allclose(ledger_queries(ledger, questions), masked_queries(combat_df, questions))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""Report per-section parse timings from LazyParsedBattle.
+
+Usage: python -m benchmarks.bench_lazy
+"""
+
+from __future__ import annotations
+
+from benchmarks.common import quiet, smoketest_logs
+from stfc_parser.LazyParsedBattle import LazyParsedBattle
+
+
+def main() -> None:
+    quiet()
+    sections = ("combat", "raw_combat", "players", "fleets", "loot")
+    print(f"{'log':44} " + " ".join(f"{name:>10}" for name in sections) + "   (ms)")
+    for path in smoketest_logs()[:5]:
+        battle = LazyParsedBattle(path.read_bytes())
+        battle.materialize()
+        cells = " ".join(f"{battle.timings.get(name, 0.0) * 1e3:10.1f}" for name in sections)
+        print(f"{path.name:44} {cells}")
+
+    path = smoketest_logs()[0]
+    battle = LazyParsedBattle(path.read_bytes())
+    battle.players_df
+    print(f"\nplayers only on {path.name}: paid for {sorted(battle.timings)}, "
+          f"{sum(battle.timings.values()) * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Report peak RSS for parsing the smoketest corpus from bytes vs. memory maps.
+
+Each mode runs in a fresh interpreter so peaks do not bleed into each other.
+
+Usage: python -m benchmarks.bench_mmap
+"""
+
+from __future__ import annotations
+
+import resource
+import subprocess
+import sys
+import time
+
+from benchmarks.common import quiet, smoketest_logs
+
+MODES = ("read_bytes", "mmap")
+
+
+def _peak_rss_mib() -> float:
+    # ru_maxrss is KiB on Linux (bytes on macOS).
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 2**20
+
+
+def run(mode: str) -> None:
+    """Parse the corpus in this process and print baseline and peak RSS."""
+    from stfc_parser.parser_stub import parse_battle, parse_battle_file
+
+    quiet()
+    paths = smoketest_logs()
+    baseline = _peak_rss_mib()
+    start = time.perf_counter()
+    for path in paths:
+        if mode == "mmap":
+            parse_battle_file(path)
+        else:
+            parse_battle(path.read_bytes(), path.name)
+    elapsed = time.perf_counter() - start
+    peak = _peak_rss_mib()
+    print(f"{mode:>10}: peak RSS {peak:6.1f} MiB (+{peak - baseline:5.1f} over imports), {elapsed:5.2f} s")
+
+
+def main() -> None:
+    paths = smoketest_logs()
+    size = sum(path.stat().st_size for path in paths)
+    print(f"corpus: {len(paths)} files, {size / 2**20:.1f} MiB")
+    for mode in MODES:
+        subprocess.run([sys.executable, "-m", "benchmarks.bench_mmap", mode], check=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run(sys.argv[1])
+    else:
+        main()
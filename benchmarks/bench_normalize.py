@@ -0,0 +1,73 @@
+"""Time NormalizedGVS normalization: per-column Series math vs. the fused block.
+
+Builds the synthetic GVS from bench_gvs at 10k, 100k and 1M attack events and
+times the normalization step (the *_norm columns, damage_pct and the target
+hull trajectory) on the previous per-column path, then the whole
+from_non_normalized on the previous path (with the merge_asof pullback from
+bench_attacker_state) and on the current one.
+
+Usage: python -m benchmarks.bench_normalize
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_attacker_state import legacy_attacker_state
+from benchmarks.bench_gvs import synthetic_gvs
+from benchmarks.common import best_of
+from stfc_parser.algebra.NonNormalizedGVS import NonNormalizedGVS
+from stfc_parser.algebra.NormalizedGVS import NormalizedGVS, _combatant_codes
+from stfc_parser.frames import shallow_copy
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+
+def legacy_normalize(nn: NonNormalizedGVS) -> pd.DataFrame:
+    """The previous normalization: a division, replace and fillna per column."""
+    df = nn.df.copy()
+    df["initial_hull_health"] = pd.to_numeric(df["initial_hull_health"], errors="coerce").fillna(0.0)
+    df["damage_pct"] = (df["hull_damage"] / df["initial_hull_health"]).replace([np.inf, -np.inf], 0).fillna(0)
+    for col in NormalizedGVS.NORM_COLS:
+        df[f"{col}_norm"] = (df[col] / df["initial_hull_health"]).replace([np.inf, -np.inf], 0).fillna(0)
+    df["cumulative_hull_damage_norm"] = (
+        df.groupby(NormalizedGVS.TARGET_COLS)["hull_damage_norm"].cumsum()
+    )
+    df["current_hull_percentage"] = 1.0 - df["cumulative_hull_damage_norm"]
+    return df
+
+
+def legacy_from_non_normalized(nn: NonNormalizedGVS) -> pd.DataFrame:
+    df = legacy_attacker_state(legacy_normalize(nn))
+    if (df.filter(like="_norm") < 0).any().any():
+        raise ValueError("Negative normalized values detected")
+    return df
+
+
+def fused_normalize(nn: NonNormalizedGVS) -> pd.DataFrame:
+    df = shallow_copy(nn.df)
+    df["initial_hull_health"] = pd.to_numeric(df["initial_hull_health"], errors="coerce").fillna(0.0)
+    _, targets, null_ids = _combatant_codes(df)
+    return NormalizedGVS._normalize_block(df, targets, null_ids)
+
+
+def main() -> None:
+    for rows in SIZES:
+        gvs = synthetic_gvs(rows)
+        nn = NonNormalizedGVS(gvs.df.assign(initial_hull_health=np.where(np.arange(rows) % 50, 1e8, 0.0)))
+        repeat = 3 if rows >= 1_000_000 else 5
+        print(f"{rows} attack events")
+        legacy_s = best_of(lambda: legacy_normalize(nn), repeat=repeat)
+        fused_s = best_of(lambda: fused_normalize(nn), repeat=repeat)
+        print(f"  normalize, per column      {legacy_s * 1e3:8.1f} ms")
+        print(f"  normalize, fused block     {fused_s * 1e3:8.1f} ms  ({legacy_s / fused_s:.1f}x)")
+        legacy_s = best_of(lambda: legacy_from_non_normalized(nn), repeat=repeat)
+        current_s = best_of(lambda: NormalizedGVS.from_non_normalized(nn), repeat=repeat)
+        print(f"  from_non_normalized, prev  {legacy_s * 1e3:8.1f} ms")
+        print(f"  from_non_normalized, now   {current_s * 1e3:8.1f} ms  ({legacy_s / current_s:.1f}x)")
+        assert NormalizedGVS.from_non_normalized(nn).df.equals(legacy_from_non_normalized(nn))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Time outcome lookups built row by row vs. the vectorized batch builder.
+
+Builds the lookup for the largest smoketest log, for a combat frame tiled to
+60k+ rows, and for the whole smoketest corpus one session at a time and in a
+single batch.
+
+Usage: python -m benchmarks.bench_outcome
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.core.Outcome import Outcome
+from stfc_parser.parser_stub import parse_battle_file
+
+TILED_ROWS = 60_000
+
+
+def legacy_alliances(combat_df: pd.DataFrame) -> dict[tuple[str, str], set[str]]:
+    """The previous alliance scan: a Python lambda over every cell, then a groupby."""
+    subset = combat_df.loc[:, ["attacker_name", "attacker_ship", "attacker_alliance"]].astype(object)
+    subset = subset.map(lambda x: str(x).strip() if pd.notna(x) else "")
+    subset = subset[(subset != "").all(axis=1)]
+    grouped = subset.groupby(["attacker_name", "attacker_ship"])["attacker_alliance"].agg(set)
+    return grouped.to_dict()
+
+
+def legacy_lookup(players_df: pd.DataFrame, combat_df: pd.DataFrame) -> dict[tuple[str, str, str], object]:
+    """The previous builder: two iterrows passes with per-row normalization."""
+    lookup: dict[tuple[str, str, str], object] = {}
+    alliances = legacy_alliances(combat_df)
+    npc_row = players_df.iloc[-1]
+    npc_name = Outcome.normalize_text(npc_row.get("Player Name"))
+    npc_outcome = Outcome.normalize_outcome(npc_row.get("Outcome"))
+    inferred = Outcome.infer_player_outcome(npc_outcome)
+
+    def spec_keys(name: str, alliance: str, ship: str) -> list[tuple[str, str, str]]:
+        keys = [(name, alliance, ship)]
+        if not alliance:
+            keys += [(name, other, ship) for other in alliances.get((name, ship), set())]
+        return keys
+
+    rows = []
+    for _, row in players_df.iterrows():
+        name = Outcome.normalize_text(row.get("Player Name"))
+        ship = Outcome.normalize_text(row.get("Ship Name"))
+        alliance = ""
+        for column in ("Alliance", "Player Alliance"):
+            alliance = alliance or Outcome.normalize_text(row.get(column))
+        if any([name, ship, alliance]):
+            rows.append((name, alliance, ship, row.get("Outcome")))
+    for name, alliance, ship, outcome in rows:
+        if Outcome.is_determinate_outcome(outcome):
+            for key in spec_keys(name, alliance, ship):
+                lookup.setdefault(key, outcome)
+    if npc_name and npc_outcome:
+        for name, alliance, ship, _ in rows:
+            fallback = npc_outcome if name == npc_name else inferred
+            if (name, alliance, ship) not in lookup and fallback:
+                for key in spec_keys(name, alliance, ship):
+                    lookup.setdefault(key, fallback)
+    return lookup
+
+
+def main() -> None:
+    quiet()
+    battles = [parse_battle_file(path) for path in smoketest_logs()]
+    largest = battles[0]
+    tiled = pd.concat(
+        [largest.combat_df] * (TILED_ROWS // len(largest.combat_df) + 1), ignore_index=True
+    )
+    cases = [
+        (f"largest log ({len(largest.combat_df)} rows)", largest.players_df, largest.combat_df),
+        (f"tiled combat frame ({len(tiled)} rows)", largest.players_df, tiled),
+    ]
+    for label, players_df, combat_df in cases:
+        assert legacy_lookup(players_df, combat_df) == Outcome(players_df, combat_df).build_outcome_lookup()
+        legacy_s = best_of(lambda: legacy_lookup(players_df, combat_df))
+        vectorized_s = best_of(lambda: Outcome(players_df, combat_df).build_outcome_lookup())
+        print(label)
+        print(f"  row by row  {legacy_s * 1e3:8.1f} ms")
+        print(f"  vectorized  {vectorized_s * 1e3:8.1f} ms  ({legacy_s / vectorized_s:.1f}x)")
+
+    pairs = [(battle.players_df, battle.combat_df) for battle in battles]
+    legacy_s = best_of(lambda: [legacy_lookup(*pair) for pair in pairs], repeat=3)
+    single_s = best_of(lambda: [Outcome(*pair).build_outcome_lookup() for pair in pairs], repeat=3)
+    batch_s = best_of(lambda: Outcome.build_outcome_lookups(pairs), repeat=3)
+    print(f"smoketest corpus ({len(pairs)} sessions)")
+    print(f"  row by row        {legacy_s * 1e3:8.1f} ms")
+    print(f"  one per session   {single_s * 1e3:8.1f} ms  ({legacy_s / single_s:.1f}x)")
+    print(f"  one batch         {batch_s * 1e3:8.1f} ms  ({legacy_s / batch_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
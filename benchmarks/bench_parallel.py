@@ -0,0 +1,116 @@
+"""Measure combat parse time against worker count on synthetic large logs.
+
+Synthetic logs repeat the combat rows of the largest smoketest log, shifting
+the Round column on every repeat so rounds stay distinct. With --calibrate,
+measures the constants of BattleSectionParser's parallel cost model on this
+machine instead and prints them next to the ones in the code.
+
+Usage: python -m benchmarks.bench_parallel [max_rows] [max_workers]
+       python -m benchmarks.bench_parallel --calibrate
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.BattleSectionParser import (
+    BattleSectionParser,
+    _parse_combat_chunk,
+    split_combat_section,
+)
+from stfc_parser.StartsWhen import tokenize_sections
+from stfc_parser.rough.derive_metrics import continue_shot_index
+
+
+def synthetic_log(rows: int) -> bytes:
+    """Return a combat-only export with ``rows`` combat rows."""
+    combat = tokenize_sections(smoketest_logs()[0].read_bytes())["combat"]
+    header, *lines = bytes(combat).rstrip().split(b"\n")
+    split = [line.split(b"\t", 1) for line in lines]
+    last_round = max(int(float(round_)) for round_, _ in split)
+    out = [header]
+    offset = 0
+    while len(out) <= rows:
+        out.extend(b"%d\t%s" % (int(float(round_)) + offset, rest) for round_, rest in split)
+        offset += last_round
+    return b"\n".join(out[: rows + 1]) + b"\n"
+
+
+def calibrate() -> None:
+    """Measure the parallel cost model's constants and print them beside the coded ones."""
+    small = bytes(tokenize_sections(synthetic_log(10_000))["combat"])
+    large = bytes(tokenize_sections(synthetic_log(100_000))["combat"])
+    mib = (len(large) - len(small)) / 2**20
+    serial = (
+        best_of(lambda: _parse_combat_chunk(large, "c", False), repeat=3)
+        - best_of(lambda: _parse_combat_chunk(small, "c", False), repeat=3)
+    ) / mib
+
+    header, pieces = split_combat_section(memoryview(large), 2)
+    frames = [_parse_combat_chunk(header + bytes(piece), "c", False) for piece in pieces]
+    blobs = [pickle.dumps(frame, protocol=5) for frame in frames]
+
+    def stitch() -> pd.DataFrame:
+        shot_counts: dict[tuple[object, ...], int] = {}
+        loaded = [continue_shot_index(pickle.loads(blob), shot_counts) for blob in blobs]
+        return pd.concat(loaded, ignore_index=True)
+
+    large_mib = len(large) / 2**20
+    worker = best_of(lambda: [pickle.dumps(frame, protocol=5) for frame in frames], repeat=3) / large_mib
+    parent = best_of(stitch, repeat=3) / large_mib
+
+    tiny = bytes(tokenize_sections(synthetic_log(200))["combat"])
+
+    def pooled() -> None:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            list(pool.map(_parse_combat_chunk, [tiny], ["c"], [False]))
+
+    start_method = multiprocessing.get_start_method()
+    start_up = best_of(pooled, repeat=3) - best_of(lambda: _parse_combat_chunk(tiny, "c", False))
+
+    model = BattleSectionParser
+    print(f"{'constant':28} {'measured':>10} {'in code':>10}")
+    for name, measured, coded in (
+        ("SERIAL_SECONDS_PER_MIB", serial, model.SERIAL_SECONDS_PER_MIB),
+        ("WORKER_SECONDS_PER_MIB", worker, model.WORKER_SECONDS_PER_MIB),
+        ("PARENT_SECONDS_PER_MIB", parent, model.PARENT_SECONDS_PER_MIB),
+        (f"POOL_START_SECONDS[{start_method}]", start_up, model.POOL_START_SECONDS.get(start_method)),
+    ):
+        print(f"{name:28} {measured:10.4f} {coded:10.4f}")
+
+
+def main() -> None:
+    quiet()
+    if sys.argv[1:] == ["--calibrate"]:
+        calibrate()
+        return
+    max_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    print(f"cpu_count={os.cpu_count()}")
+    rows = 10_000
+    while rows <= max_rows:
+        file_bytes = synthetic_log(rows)
+        print(f"{rows:>9,d} rows ({len(file_bytes) / 2**20:.1f} MiB)")
+        serial = None
+        workers = 1
+        while workers <= max_workers:
+            parser = BattleSectionParser(file_bytes, workers=workers)
+            start = time.perf_counter()
+            parser.parse()
+            elapsed = time.perf_counter() - start
+            serial = serial or elapsed
+            print(f"  workers={workers:2d}: {elapsed:7.2f} s  ({serial / elapsed:4.2f}x)")
+            workers *= 2
+        rows *= 10
+
+
+if __name__ == "__main__":
+    main()
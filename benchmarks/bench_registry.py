@@ -0,0 +1,96 @@
+"""Time string-keyed combatant handling vs. the integer-coded registry.
+
+On the largest smoketest log and a copy tiled to 60k+ rows, compares the
+previous per-cell ship roster and per-role string groupbys behind the
+combatant filter with one registry serving all three, and recomputed vs.
+precomputed ShipSpecifier keys.
+
+Usage: python -m benchmarks.bench_registry
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.core.CombatantRegistry import CombatantRegistry
+from stfc_parser.core.Ships import Ships
+from stfc_parser.parser_stub import parse_battle_file
+
+TILED_ROWS = 60_000
+COLUMNS = ["attacker_name", "attacker_alliance", "attacker_ship"]
+
+
+def legacy_every_ship(combat_df: pd.DataFrame) -> set[ShipSpecifier]:
+    """The previous roster: a Python lambda over every attacker cell."""
+    combos = combat_df.loc[:, COLUMNS].dropna(how="all")
+    combos = combos.map(lambda x: "" if x is None or pd.isna(x) else str(x)).drop_duplicates()
+    return {
+        ShipSpecifier(name=row["attacker_name"], alliance=row["attacker_alliance"], ship=row["attacker_ship"])
+        for row in combos.to_dict(orient="records")
+    }
+
+
+def legacy_role_index(combat_df: pd.DataFrame, role: str) -> dict[tuple[object, ...], object]:
+    """The previous filter index: row positions grouped by the role's three string columns."""
+    columns = CombatantRegistry.role_columns(role)
+    return combat_df[columns].groupby(columns, dropna=False, sort=False, observed=True).indices
+
+
+def legacy_setup(combat_df: pd.DataFrame) -> None:
+    legacy_every_ship(combat_df)
+    for role in CombatantRegistry.ROLES:
+        legacy_role_index(combat_df, role)
+
+
+def registry_indexes(combat_df: pd.DataFrame) -> None:
+    registry = CombatantRegistry(combat_df)
+    for role in CombatantRegistry.ROLES:
+        registry.rows_by_id(role)
+
+
+def registry_setup(combat_df: pd.DataFrame) -> None:
+    registry = CombatantRegistry(combat_df)
+    Ships(combat_df, registry).get_every_ship()
+    for role in CombatantRegistry.ROLES:
+        registry.rows_by_id(role)
+
+
+def main() -> None:
+    quiet()
+    battle = parse_battle_file(smoketest_logs()[0])
+    combat_df = battle.combat_df
+    tiled = pd.concat([combat_df] * (TILED_ROWS // len(combat_df) + 1), ignore_index=True)
+
+    for df in (combat_df, tiled):
+        assert legacy_every_ship(df) == Ships(df).get_every_ship()
+        print(f"{len(df)} combat rows")
+        cases = [
+            ("ship roster, per cell", lambda: legacy_every_ship(df)),
+            ("ship roster, registry", lambda: Ships(df).get_every_ship()),
+            ("role indexes, strings", lambda: [legacy_role_index(df, r) for r in CombatantRegistry.ROLES]),
+            ("role indexes, ids", lambda: registry_indexes(df)),
+            ("roster + indexes, before", lambda: legacy_setup(df)),
+            ("roster + indexes, registry", lambda: registry_setup(df)),
+        ]
+        for label, fn in cases:
+            print(f"  {label:27s} {best_of(fn) * 1e3:8.1f} ms")
+
+    specs = list(CombatantRegistry(combat_df).specs) * 1000
+
+    def recomputed() -> None:
+        for spec in specs:
+            ShipSpecifier.normalize_key(spec.name, spec.alliance, spec.ship)
+
+    def precomputed() -> None:
+        for spec in specs:
+            spec.normalized_key()
+
+    print(f"{len(specs)} normalized_key calls")
+    print(f"  recomputed                  {best_of(recomputed) * 1e3:8.1f} ms")
+    print(f"  precomputed                 {best_of(precomputed) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
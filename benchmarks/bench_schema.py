@@ -0,0 +1,72 @@
+"""Per-log schema overhead: legacy per-call metadata lookup vs compiled SchemaPlan.
+
+Usage: python -m benchmarks.bench_schema
+"""
+
+from __future__ import annotations
+
+import importlib
+
+import pandas as pd
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.BattleSectionParser import BattleSectionParser
+from stfc_parser.StartsWhen import tokenize_sections
+from stfc_parser.columns import add_alias_columns
+from stfc_parser.schemas import CombatSchema, normalize_dataframe_for_schema, reorder_columns
+
+
+def legacy_normalize(df: pd.DataFrame, schema) -> pd.DataFrame:
+    """The pre-SchemaPlan implementation, kept here for comparison."""
+    updated = df.copy()
+    updated.attrs = df.attrs.copy()
+    mod = importlib.import_module(schema.__module__)
+    prefix = schema.__name__.removesuffix("Schema").upper()
+    renames = dict(getattr(mod, f"{prefix}_COLUMN_RENAMES", {}) or {})
+    aliases = dict(getattr(mod, f"{prefix}_COLUMN_ALIASES", {}) or {})
+    order = list(getattr(mod, f"{prefix}_COLUMN_ORDER", []) or [])
+    updated = updated.rename(columns=renames, inplace=False)
+    updated = add_alias_columns(updated, aliases=aliases or None)
+    return reorder_columns(updated, order)
+
+
+def legacy_missing_columns(df: pd.DataFrame, schema) -> pd.DataFrame:
+    schema_obj = schema.to_schema()
+    updated = df.copy()
+    for name, column in schema_obj.columns.items():
+        if column.required and name not in updated.columns:
+            updated[name] = pd.NA
+    return updated
+
+
+def main() -> None:
+    quiet()
+    print(f"{'log':44} {'rows':>6} {'legacy (ms)':>12} {'plan (ms)':>10}")
+    for path in smoketest_logs()[:5]:
+        parser = BattleSectionParser(path.read_bytes())
+        raw = parser.read_raw(tokenize_sections(path.read_bytes()))
+        cleaned = parser._coerce_numeric_columns(
+            parser._normalize_dataframe(raw), parser.RAW_NUMERIC_COLUMNS
+        )
+
+        def legacy() -> None:
+            frame = legacy_normalize(cleaned, CombatSchema)
+            frame = legacy_normalize(frame, CombatSchema)
+            frame = legacy_normalize(frame, CombatSchema)
+            legacy_missing_columns(frame, CombatSchema)
+            legacy_normalize(frame, CombatSchema)
+
+        def planned() -> None:
+            frame = normalize_dataframe_for_schema(cleaned, CombatSchema)
+            frame = normalize_dataframe_for_schema(frame, CombatSchema)
+            frame = normalize_dataframe_for_schema(frame, CombatSchema)
+            normalize_dataframe_for_schema(frame, CombatSchema)
+
+        print(
+            f"{path.name:44} {len(raw):6d} {best_of(legacy, 20) * 1e3:12.2f}"
+            f" {best_of(planned, 20) * 1e3:10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
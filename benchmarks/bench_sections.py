@@ -0,0 +1,48 @@
+"""Compare the single-pass section tokenizer with the legacy two-pass split.
+
+Usage: python -m benchmarks.bench_sections
+"""
+
+from __future__ import annotations
+
+import io
+
+import pandas as pd
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.StartsWhen import (
+    NA_TOKENS,
+    StartsWhen,
+    extract_sections,
+    read_section_csv,
+    tokenize_sections,
+)
+
+
+def two_pass(file_bytes: bytes) -> pd.DataFrame:
+    text = file_bytes.decode("utf-8", errors="replace")
+    extract_sections(text)
+    wrapped = StartsWhen(io.StringIO(text), "Round\t")
+    return pd.read_csv(wrapped, sep="\t", dtype=str, na_values=NA_TOKENS)
+
+
+def single_pass(file_bytes: bytes) -> pd.DataFrame:
+    sections = tokenize_sections(file_bytes)
+    return read_section_csv(sections["combat"], dtype=str, na_values=NA_TOKENS)
+
+
+def main() -> None:
+    quiet()
+    corpus = [path.read_bytes() for path in smoketest_logs()]
+    total_mb = sum(len(data) for data in corpus) / 1e6
+    split_old = best_of(lambda: [extract_sections(d.decode("utf-8", "replace")) for d in corpus])
+    split_new = best_of(lambda: [tokenize_sections(d) for d in corpus])
+    full_old = best_of(lambda: [two_pass(d) for d in corpus], repeat=3)
+    full_new = best_of(lambda: [single_pass(d) for d in corpus], repeat=3)
+    print(f"corpus: {len(corpus)} files, {total_mb:.1f} MB")
+    print(f"section split      two-pass {split_old * 1e3:8.1f} ms   single-pass {split_new * 1e3:8.1f} ms")
+    print(f"split + combat csv two-pass {full_old * 1e3:8.1f} ms   single-pass {full_new * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
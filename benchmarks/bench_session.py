@@ -0,0 +1,63 @@
+"""Time a 200-call SessionInfo "page render" with and without memoized queries.
+
+Usage: python -m benchmarks.bench_session
+"""
+
+from __future__ import annotations
+
+from itertools import cycle, islice
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.SessionInfo import SessionInfo
+from stfc_parser.parser_stub import parse_battle_file
+
+
+def page_calls(session: SessionInfo, *, memoized: bool) -> list:
+    """Return 200 query calls, through the memoized session or straight to its helpers."""
+    ships = sorted(session.get_every_ship(), key=str)
+    if memoized:
+        combatants = crew = ships_helper = outcome = session
+    else:
+        combatants, crew, ships_helper, outcome = (
+            session.combatants,
+            session.crew,
+            session.ships,
+            session.outcome,
+        )
+    calls = [
+        combatants.combatant_names,
+        combatants.alliance_names,
+        outcome.build_outcome_lookup,
+        *(lambda s=s: ships_helper.get_ships(s.name) for s in ships),
+        *(lambda s=s: crew.get_bridge_crew(s.name, s.ship) for s in ships),
+        *(lambda s=s: crew.all_officer_names(s.name, s.ship) for s in ships),
+    ]
+    return list(islice(cycle(calls), 200))
+
+
+def main() -> None:
+    quiet()
+    path = smoketest_logs()[0]
+    battle = parse_battle_file(path)
+
+    def uncached() -> None:
+        session = SessionInfo(battle)
+        for call in page_calls(session, memoized=False):
+            call()
+
+    def memoized() -> None:
+        session = SessionInfo(battle)
+        for call in page_calls(session, memoized=True):
+            call()
+
+    session = SessionInfo(battle)
+    for call in page_calls(session, memoized=True):
+        call()
+    totals = session.query_cache.totals()
+    print(f"{path.name}: 200 calls, {totals.misses} computed, {totals.hits} served from cache")
+    print(f"  uncached      {best_of(uncached) * 1e3:7.1f} ms")
+    print(f"  memoized      {best_of(memoized) * 1e3:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
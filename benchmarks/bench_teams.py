@@ -0,0 +1,73 @@
+"""Time per-round team damage from per-row key lookups vs. team code columns.
+
+On the largest smoketest log and a copy tiled to 60k+ rows, the previous
+route looks every row's attacker and target up in the team keys in Python and
+groups by the result. The new route resolves the same keys once per
+combatant, tags rows through the combatant registry, and sums with bincount.
+
+Usage: python -m benchmarks.bench_teams
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.core.TeamMembership import TeamMembership
+from stfc_parser.parser_stub import parse_battle_file
+
+TILED_ROWS = 60_000
+
+
+def legacy_damage_by_round(players_df: pd.DataFrame, combat_df: pd.DataFrame) -> pd.DataFrame:
+    """The same team keys, looked up in Python once per row and role."""
+    keys = TeamMembership(players_df, combat_df).team_by_key
+
+    def teams(role: str) -> list[int]:
+        columns = [combat_df[f"{role}_{field}"] for field in ("name", "alliance", "ship")]
+        return [keys.get(ShipSpecifier.normalize_key(*values), 0) for values in zip(*columns)]
+
+    frame = pd.DataFrame(
+        {
+            "round": combat_df["round"],
+            "attacker_team": teams("attacker"),
+            "target_team": teams("target"),
+            "damage": combat_df["applied_damage"].fillna(0.0),
+        }
+    )
+    return pd.concat(
+        {
+            "dealt": frame.groupby(["round", "attacker_team"])["damage"].sum(),
+            "received": frame.groupby(["round", "target_team"])["damage"].sum(),
+        },
+        axis=1,
+    )
+
+
+def main() -> None:
+    quiet()
+    battle = parse_battle_file(smoketest_logs()[0])
+    combat_df = battle.combat_df
+    tiled = pd.concat([combat_df] * (TILED_ROWS // len(combat_df) + 1), ignore_index=True)
+
+    for df in (combat_df, tiled):
+        print(f"{len(df)} combat rows, damage dealt/received per round and team")
+        cold = lambda: TeamMembership(battle.players_df, df).damage_by_round()  # noqa: E731
+        warm_membership = TeamMembership(battle.players_df, df)
+        warm_membership.damage_by_round()
+        legacy_s = best_of(lambda: legacy_damage_by_round(battle.players_df, df))
+        cold_s = best_of(cold)
+        warm_s = best_of(warm_membership.damage_by_round)
+        print(f"  per-row key lookups    {legacy_s * 1e3:8.1f} ms")
+        print(f"  team codes, cold       {cold_s * 1e3:8.1f} ms  ({legacy_s / cold_s:.1f}x)")
+        print(f"  team codes, tagged     {warm_s * 1e3:8.1f} ms  ({legacy_s / warm_s:.1f}x)")
+
+    legacy = legacy_damage_by_round(battle.players_df, combat_df)
+    current = TeamMembership(battle.players_df, combat_df).damage_by_round()
+    assert np.allclose(current.loc[legacy.index].to_numpy(), legacy.fillna(0.0).to_numpy())
+
+
+if __name__ == "__main__":
+    main()
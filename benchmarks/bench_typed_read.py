@@ -0,0 +1,37 @@
+"""Compare combat parse time with schema-typed read_csv vs the string-first read.
+
+Usage: python -m benchmarks.bench_typed_read
+"""
+
+from __future__ import annotations
+
+from benchmarks.common import best_of, quiet, smoketest_logs
+from stfc_parser.BattleSectionParser import BattleSectionParser
+from stfc_parser.StartsWhen import tokenize_sections
+
+
+class StringFirstParser(BattleSectionParser):
+    """Read every combat column as a string and coerce afterwards (the previous behavior)."""
+
+    def read_typed(self, sections):
+        return self.read_raw(sections)
+
+
+def main() -> None:
+    quiet()
+    print(f"{'log':44} {'rows':>6} {'string (ms)':>12} {'typed (ms)':>11}")
+    for path in smoketest_logs()[:6]:
+        file_bytes = path.read_bytes()
+        sections = tokenize_sections(file_bytes)
+        rows = len(BattleSectionParser(file_bytes).read_raw(sections))
+        string_first = best_of(
+            lambda: StringFirstParser(file_bytes)._parse_sections(sections, soft=False)
+        )
+        typed = best_of(
+            lambda: BattleSectionParser(file_bytes)._parse_sections(sections, soft=False)
+        )
+        print(f"{path.name:44} {rows:6d} {string_first * 1e3:12.1f} {typed * 1e3:11.1f}")
+
+
+if __name__ == "__main__":
+    main()
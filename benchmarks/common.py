@@ -0,0 +1,31 @@
+"""Shared helpers for the benchmark scripts."""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+SMOKETEST_DIR = ROOT / "tests" / "smoketest-logs"
+
+
+def smoketest_logs() -> list[Path]:
+    """Return the smoketest corpus, largest files first."""
+    return sorted(SMOKETEST_DIR.glob("*.csv"), key=lambda p: p.stat().st_size, reverse=True)
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Return the fastest wall-clock time in seconds over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def quiet() -> None:
+    """Silence parser logging so it does not skew timings."""
+    logging.disable(logging.CRITICAL)
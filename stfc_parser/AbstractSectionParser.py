@@ -7,7 +7,8 @@ from typing import IO, Any
 
 import pandas as pd
 
-from stfc_parser.StartsWhen import NA_TOKENS as STARTSWHEN_NA_TOKENS
+from stfc_parser.StartsWhen import NA_TOKENS as STARTSWHEN_NA_TOKENS, as_buffer
+from stfc_parser.frames import shallow_copy
 
 logger = logging.getLogger(__name__)
 
@@ -30,33 +31,53 @@ class AbstractSectionParser:
             return str(content)
         return str(file_bytes)
 
+    def _read_buffer(self, file_bytes: bytes | str | IO[Any]) -> memoryview:
+        """Return a byte view of a bytes, str, or file-like input without decoding it."""
+        if isinstance(file_bytes, (bytes, bytearray, memoryview, str)):
+            return as_buffer(file_bytes)
+        if hasattr(file_bytes, "read"):
+            content = file_bytes.read()
+            if isinstance(content, (bytes, str)):
+                return as_buffer(content)
+            return as_buffer(str(content))
+        return as_buffer(str(file_bytes))
+
+    # The helpers below return a shallow copy and only ever replace whole columns,
+    # so the input frame is never modified and unchanged columns are not copied.
+
     def _normalize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Return a cleaned copy of the dataframe with trimmed strings and NA tokens."""
-        cleaned = df.copy()
+        cleaned = shallow_copy(df)
+        na_tokens = list(self.NA_TOKENS)
         for column in cleaned.columns:
-            if pd.api.types.is_object_dtype(cleaned[column]) or pd.api.types.is_string_dtype(
-                cleaned[column]
-            ):
-                cleaned[column] = cleaned[column].astype("string").str.strip()
-        cleaned = cleaned.replace(list(self.NA_TOKENS), pd.NA)
+            series = cleaned[column]
+            if pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+                # Arrow-backed strings already support .str; keep them Arrow-backed.
+                if not isinstance(series.dtype, pd.ArrowDtype):
+                    series = series.astype("string")
+                cleaned[column] = series.str.strip().replace(na_tokens, pd.NA)
         return cleaned
 
     def _coerce_numeric_columns(self, df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
         """Return a copy of the dataframe with numeric columns coerced to numbers."""
-        updated = df.copy()
+        updated = shallow_copy(df)
         for column in columns:
             if column not in updated.columns:
                 continue
+            if pd.api.types.is_numeric_dtype(updated[column]):
+                continue
             cleaned = updated[column].astype("string").str.replace(",", "", regex=False).str.strip()
             updated[column] = pd.to_numeric(cleaned, errors="coerce")
         return updated
 
     def _coerce_yes_no_columns(self, df: pd.DataFrame, columns: tuple[str, ...]) -> pd.DataFrame:
         """Return a copy of the dataframe with YES/NO strings mapped to booleans."""
-        updated = df.copy()
+        updated = shallow_copy(df)
         for column in columns:
             if column not in updated.columns:
                 continue
+            if pd.api.types.is_bool_dtype(updated[column]):
+                continue
             cleaned = updated[column].astype("string").str.strip().str.upper()
             updated[column] = cleaned.map({"YES": True, "NO": False}).astype("boolean")
         return updated
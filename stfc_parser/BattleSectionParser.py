@@ -4,21 +4,123 @@ from __future__ import annotations
 
 import io
 import logging
-from typing import IO, Any
+import multiprocessing
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import cache, partial
+from typing import IO, Any, Callable, Iterator
 
+import numpy as np
 import pandas as pd
 
 from stfc_parser.AbstractSectionParser import AbstractSectionParser
-from stfc_parser.StartsWhen import StartsWhen, extract_sections
+from stfc_parser.StartsWhen import (
+    SECTION_HEADERS,
+    SectionIndex,
+    SectionText,
+    StartsWhen,
+    map_file,
+    read_section_csv,
+    tokenize_sections,
+    unmap_file,
+)
 from stfc_parser.columns import resolve_event_type
-from stfc_parser.rough.derive_metrics import add_shot_index
-from stfc_parser.schemas import CombatSchema, normalize_dataframe_for_schema, validate_dataframe
+from stfc_parser.rough.derive_metrics import add_shot_index, continue_shot_index
+from stfc_parser.schemas import (
+    CombatSchema,
+    get_schema_plan,
+    normalize_dataframe_for_schema,
+    validate_dataframe,
+)
 
 logger = logging.getLogger(__name__)
 
 
+@cache
+def combat_read_dtypes() -> dict[str, str]:
+    """
+    Return read_csv dtypes for the raw combat columns, derived from CombatSchema.
+
+    Numeric schema columns (ints included, so the C parser can apply the
+    thousands separator) are read as float64 and boolean columns as nullable
+    booleans; everything else stays a string. Validation coerces to the final
+    schema dtypes.
+    """
+    plan = get_schema_plan(CombatSchema)
+    dtypes: dict[str, str] = {}
+    for raw_column, column in plan.renames.items():
+        target = str(plan.dtypes.get(column, "")).lower()
+        if target.startswith(("float", "int")):
+            dtypes[raw_column] = "float64"
+        elif target.startswith("bool"):
+            dtypes[raw_column] = "boolean"
+    return dtypes
+
+
+_NEWLINE = re.compile(rb"\n")
+
+
+def _line_start_after(section: memoryview, pos: int, end: int) -> int:
+    """Return the start of the first line beginning at or after ``pos`` (``end`` if none)."""
+    if pos == 0 or section[pos - 1 : pos] == b"\n":
+        return pos
+    match = _NEWLINE.search(section, pos, end)
+    return end if match is None else match.end()
+
+
+def _round_start_after(section: memoryview, pos: int, end: int) -> int | None:
+    """Return the start of the first line after ``pos`` in a new round, if one begins before ``end``."""
+    line_end = _line_start_after(section, pos + 1, end)
+    current, tab, _ = bytes(section[pos:line_end]).partition(b"\t")
+    if not tab:
+        return None
+    match = re.compile(rb"\n(?!" + re.escape(current) + rb"\t)").search(section, pos, end)
+    return None if match is None else match.end()
+
+
+def split_combat_section(section: memoryview, parts: int) -> tuple[bytes, list[memoryview]]:
+    """
+    Cut a combat section into its header line and up to ``parts`` row ranges.
+
+    Cuts land on line boundaries, moved forward to the next round boundary when
+    one occurs before the following cut, so rounds usually stay whole. The row
+    ranges are zero-copy views of ``section`` and together cover every row.
+    """
+    end = len(section)
+    while end and section[end - 1 : end] in (b"\n", b"\r", b" ", b"\t"):
+        end -= 1
+    body_start = _line_start_after(section, 1, end) if end else 0
+    header = bytes(section[:body_start])
+    targets = [body_start + (end - body_start) * i // parts for i in range(1, parts)]
+    cuts = [body_start]
+    for i, target in enumerate(targets):
+        limit = targets[i + 1] if i + 1 < len(targets) else end
+        cut = _line_start_after(section, max(target, cuts[-1]), end)
+        if cut < end:
+            cut = _round_start_after(section, cut, limit) or cut
+        if cuts[-1] < cut < end:
+            cuts.append(cut)
+    cuts.append(end)
+    return header, [section[start:stop] for start, stop in zip(cuts, cuts[1:])]
+
+
+def _parse_combat_chunk(chunk: bytes, engine: str, soft: bool) -> pd.DataFrame:
+    """Worker entry point: normalize and validate one header-prefixed piece of combat rows."""
+    parser = BattleSectionParser(chunk, engine=engine)
+    return parser._parse_sections(tokenize_sections(chunk), soft=soft)
+
+
 class BattleSectionParser(AbstractSectionParser):
-    """Parse and normalize the combat section of a battle log."""
+    """
+    Parse and normalize the combat section of a battle log.
+
+    With ``workers`` above 1 (``None`` for the CPU count) a large combat
+    section is parsed in pieces across up to that many processes, when
+    ``parallel_parts`` predicts that beats the serial parse.
+    """
 
     POOL_DAMAGE_COLUMNS = ("Shield Damage", "Hull Damage")
     RAW_NUMERIC_COLUMNS = (
@@ -43,29 +145,242 @@ class BattleSectionParser(AbstractSectionParser):
         "hull_damage",
     )
     COMBAT_BOOLEAN_COLUMNS = ("is_crit", "attacker_is_armada", "target_is_armada")
+    TRUE_VALUES = ("YES",)
+    FALSE_VALUES = ("NO",)
+    # Parallel parse cost model, measured with benchmarks.bench_parallel
+    # --calibrate. Per MiB of combat rows: the serial parse, the pickling each
+    # worker adds, and the unpickling and stitching left to the parent. Pool
+    # start-up depends on how workers are started: fork inherits the loaded
+    # parser, forkserver and spawn re-import pandas in every worker.
+    SERIAL_SECONDS_PER_MIB = 0.050
+    WORKER_SECONDS_PER_MIB = 0.002
+    PARENT_SECONDS_PER_MIB = 0.004
+    POOL_START_SECONDS = {"fork": 0.025, "forkserver": 0.42, "spawn": 0.58}
 
-    def __init__(self, file_bytes: bytes | str | IO[Any]) -> None:
+    def __init__(
+        self, file_bytes: bytes | str | IO[Any], *, engine: str = "c", workers: int | None = 1
+    ) -> None:
         self.file_bytes = file_bytes
+        self.engine = engine
+        self.workers = workers
 
     def parse(self, *, soft: bool = False) -> tuple[pd.DataFrame, pd.DataFrame]:
         """Return the validated combat dataframe plus a raw copy."""
-        text = self._read_text(self.file_bytes)
-        wrapped = StartsWhen(io.StringIO(text), "Round\t")
-        df = pd.read_csv(wrapped, sep="\t", dtype=str, na_values=self.NA_TOKENS)
-        raw_df = df.copy()
-        df = self._normalize_combat_df(df)
-        df = add_shot_index(df)
-        df = validate_dataframe(df, CombatSchema, soft=soft, context="combat section")
-        return df, raw_df
+        sections = tokenize_sections(self._read_buffer(self.file_bytes))
+        return self._parse_sections(sections, soft=soft), self.read_raw(sections)
 
     def parse_with_sections(
         self, *, soft: bool = False
-    ) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, str]]:
-        """Return the validated combat dataframe, raw copy, and extracted sections."""
-        text = self._read_text(self.file_bytes)
-        sections = extract_sections(text)
-        df, raw_df = BattleSectionParser(text).parse(soft=soft)
-        return df, raw_df, sections
+    ) -> tuple[pd.DataFrame, pd.DataFrame, SectionText]:
+        """Return the validated combat dataframe, raw copy, and extracted section text.
+
+        Sections are decoded from the shared export buffer on access.
+        """
+        df, sections = self._parse_with_index(soft=soft)
+        return df, self.read_raw(sections), SectionText(sections)
+
+    def _parse_with_index(self, *, soft: bool = False) -> tuple[pd.DataFrame, SectionIndex]:
+        """Return the validated combat dataframe and the located sections.
+
+        The export is scanned once; the returned index hands out zero-copy views
+        of the players, rewards, and fleets sections. No raw copy is read; pass
+        ``raw_reader(sections)`` on to read one when it is asked for.
+        """
+        sections = tokenize_sections(self._read_buffer(self.file_bytes))
+        return self._parse_sections(sections, soft=soft), sections
+
+    def read_raw(self, sections: SectionIndex) -> pd.DataFrame:
+        """Return the combat section exactly as read, before any normalization."""
+        combat = sections.get("combat", b"")
+        return read_section_csv(combat, engine=self.engine, dtype=str, na_values=self.NA_TOKENS)
+
+    def raw_reader(self, sections: SectionIndex) -> Callable[[], pd.DataFrame]:
+        """
+        Return a zero-argument callable that runs ``read_raw`` on ``sections``.
+
+        It reads from the export buffer the sections point into, keeping that
+        buffer alive instead of copying the combat section out of it.
+        """
+        return partial(self.read_raw, sections)
+
+    @classmethod
+    def read_raw_file(cls, path: str | os.PathLike[str], *, engine: str = "c") -> pd.DataFrame:
+        """Return ``read_raw`` of an export on disk, mapping the file only while it is read."""
+        view = map_file(path)
+        try:
+            return cls(view, engine=engine).read_raw(tokenize_sections(view))
+        finally:
+            unmap_file(view)
+
+    def read_typed(self, sections: SectionIndex) -> pd.DataFrame:
+        """
+        Return the combat section with numbers, NA tokens, and YES/NO parsed at read time.
+
+        Falls back to the all-string read when a typed column does not parse
+        cleanly; normalization then coerces it as before.
+        """
+        combat = sections.get("combat", b"")
+        try:
+            return read_section_csv(
+                combat,
+                engine=self.engine,
+                dtype=defaultdict(lambda: str, combat_read_dtypes()),
+                na_values=self.NA_TOKENS,
+                thousands=",",
+                true_values=list(self.TRUE_VALUES),
+                false_values=list(self.FALSE_VALUES),
+                float_precision="round_trip",
+            )
+        except (ValueError, TypeError) as exc:
+            logger.warning("Typed combat read failed (%s); falling back to string read.", exc)
+            return self.read_raw(sections)
+
+    @contextmanager
+    def _combat_stream(self) -> Iterator[IO[Any] | None]:
+        """Yield a stream positioned at the combat header, or None without one.
+
+        File-like inputs are wrapped in ``StartsWhen`` and read as they go;
+        in-memory inputs get a reader over the tokenized combat section.
+        """
+        if not hasattr(self.file_bytes, "read"):
+            yield tokenize_sections(self._read_buffer(self.file_bytes)).reader("combat")
+            return
+        handle = self.file_bytes
+        wrapper = None
+        if not isinstance(handle, io.TextIOBase):
+            wrapper = io.TextIOWrapper(handle, encoding="utf-8", errors="replace")
+            handle = wrapper
+        try:
+            yield StartsWhen(handle, SECTION_HEADERS["combat"])
+        finally:
+            if wrapper is not None:
+                wrapper.detach()  # leave the caller's handle open
+
+    def iter_rounds(self, chunk_rows: int = 10_000, *, soft: bool = False) -> Iterator[pd.DataFrame]:
+        """
+        Yield the validated combat frame one round at a time.
+
+        The combat section is read ``chunk_rows`` rows at a time and rows are
+        held only until their round is complete, so memory is bounded by the
+        largest round plus one chunk rather than the whole log; no raw copy is
+        kept. ``shot_index`` numbering carries across rounds, and concatenating
+        the yielded frames reproduces ``parse()``'s combat frame, index included.
+        Chunked reads always use the C engine.
+        """
+        if chunk_rows < 1:
+            raise ValueError("chunk_rows must be at least 1")
+        shot_counts: dict[tuple[object, ...], int] = {}
+        pending: list[pd.DataFrame] = []
+        pending_round: object = None
+        with self._combat_stream() as source:
+            if source is None:
+                return
+            if not isinstance(source, io.TextIOBase):
+                source = io.TextIOWrapper(source, encoding="utf-8", errors="replace")
+            try:
+                chunks = pd.read_csv(
+                    source, sep="\t", dtype=str, na_values=self.NA_TOKENS, chunksize=chunk_rows
+                )
+            except pd.errors.EmptyDataError:
+                return  # StartsWhen never found the combat header
+            with chunks:
+                for chunk in chunks:
+                    # Split the chunk into runs of consecutive rows from the same round.
+                    rounds = chunk["Round"].fillna("")
+                    starts = np.flatnonzero(rounds.ne(rounds.shift()).to_numpy()).tolist()
+                    for start, end in zip(starts, [*starts[1:], len(chunk)]):
+                        run_round = rounds.iat[start]
+                        if pending and run_round != pending_round:
+                            yield self._parse_round(pending, shot_counts, soft=soft)
+                            pending = []
+                        pending.append(chunk.iloc[start:end])
+                        pending_round = run_round
+        if pending:
+            yield self._parse_round(pending, shot_counts, soft=soft)
+
+    def _parse_round(
+        self, frames: list[pd.DataFrame], shot_counts: dict[tuple[object, ...], int], *, soft: bool
+    ) -> pd.DataFrame:
+        df = frames[0] if len(frames) == 1 else pd.concat(frames)
+        df = self._normalize_combat_df(df)
+        df = add_shot_index(df, shot_counts)
+        return validate_dataframe(df, CombatSchema, soft=soft, context="combat section")
+
+    def _parse_sections(self, sections: SectionIndex, *, soft: bool) -> pd.DataFrame:
+        df = self._parse_parallel(sections, soft=soft)
+        if df is None:
+            df = self.read_typed(sections)
+            df = self._normalize_combat_df(df)
+            df = add_shot_index(df)
+            df = validate_dataframe(df, CombatSchema, soft=soft, context="combat section")
+        return df
+
+    @classmethod
+    def parallel_parts(
+        cls,
+        section_bytes: int,
+        workers: int,
+        *,
+        cpus: int | None = None,
+        start_method: str | None = None,
+    ) -> int:
+        """
+        Return how many pieces the cost model parses a combat section in; 1 is serial.
+
+        Picks the piece count, up to ``workers`` and the CPU count, with the
+        lowest predicted time: pool start-up, then the pieces' parse and
+        pickling side by side, then the parent's share. With fork, splitting
+        pays off from about 1.3 MiB of combat rows on 2 CPUs, 0.8 MiB on 4,
+        and never below about 0.6 MiB; forkserver needs 9 to 21 MiB and spawn
+        13 to 29 MiB. Below that, ``workers`` has no effect.
+        """
+        cpus = cpus or os.cpu_count() or 1
+        start_method = start_method or multiprocessing.get_start_method()
+        start_up = cls.POOL_START_SECONDS.get(start_method, max(cls.POOL_START_SECONDS.values()))
+        mib = section_bytes / 2**20
+        best_parts, best_seconds = 1, cls.SERIAL_SECONDS_PER_MIB * mib
+        for parts in range(2, min(workers, cpus) + 1):
+            seconds = start_up + mib * (
+                (cls.SERIAL_SECONDS_PER_MIB + cls.WORKER_SECONDS_PER_MIB) / parts
+                + cls.PARENT_SECONDS_PER_MIB
+            )
+            if seconds < best_seconds:
+                best_parts, best_seconds = parts, seconds
+        return best_parts
+
+    def _parse_parallel(self, sections: SectionIndex, *, soft: bool) -> pd.DataFrame | None:
+        """
+        Parse the combat section in pieces over a process pool, or return None.
+
+        The section is cut at round boundaries (see ``split_combat_section``) into
+        the number of pieces ``parallel_parts`` picks. Workers normalize and
+        validate their piece independently; ``shot_index`` is then renumbered
+        across pieces in log order, so the stitched frame equals the serial
+        parse. Returns None when the model picks a serial parse.
+        """
+        workers = self.workers or os.cpu_count() or 1
+        combat = sections.get("combat")
+        if workers <= 1 or combat is None:
+            return None
+        parts = self.parallel_parts(len(combat), workers)
+        if parts <= 1:
+            return None
+        header, pieces = split_combat_section(combat, parts)
+        if len(pieces) <= 1:
+            return None
+
+        with ProcessPoolExecutor(max_workers=len(pieces)) as pool:
+            frames = list(
+                pool.map(
+                    _parse_combat_chunk,
+                    [header + piece for piece in pieces],
+                    [self.engine] * len(pieces),
+                    [soft] * len(pieces),
+                )
+            )
+        shot_counts: dict[tuple[object, ...], int] = {}
+        frames = [continue_shot_index(frame, shot_counts) for frame in frames]
+        return pd.concat(frames, ignore_index=True)
 
     def _normalize_combat_df(self, df: pd.DataFrame) -> pd.DataFrame:
         cleaned = self._normalize_dataframe(df)
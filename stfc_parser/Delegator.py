@@ -1,57 +1,127 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
+from typing import Iterable
 
+from stfc_parser.LazyParsedBattle import LazyParsedBattle
+from stfc_parser.ParsedBattle import ParsedBattle
 from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.algebra.DamageCube import DamageCube
+from stfc_parser.core.CombatantRegistry import CombatantRegistry
 from stfc_parser.core.Combatants import Combatants
 from stfc_parser.core.Crew import Crew
+from stfc_parser.core.FilterCombatDataframeByCombatant import FilterCombatDataframeByCombatant
+from stfc_parser.core.HealthLedger import HealthLedger
 import pandas as pd
 
 from stfc_parser.core.Outcome import Outcome
+from stfc_parser.core.QueryCache import QueryCache, QueryStats, memoized_query
 from stfc_parser.core.Ships import Ships
+from stfc_parser.core.TeamMembership import TeamMembership
 
 logger = logging.getLogger(__name__)
 class Delegator:
+    """
+    Route session queries to the core helpers.
+
+    Helpers are built on first use, so a lazily parsed battle only parses the
+    sections a query needs. The battle is treated as immutable: query results
+    are memoized in ``query_cache`` (see ``cache_stats``).
+    """
+
+    def __init__(self, battle: ParsedBattle | LazyParsedBattle | pd.DataFrame) -> None:
+        if isinstance(battle, pd.DataFrame):
+            # Legacy path: side frames arrive in combat_df.attrs.
+            battle = ParsedBattle.from_combat_df(battle)
+        self.battle = battle
+        self.query_cache = QueryCache()
+
+    @cached_property
+    def combatants(self) -> Combatants:
+        return Combatants(self.players_df, self.combat_df)
+
+    @cached_property
+    def crew(self) -> Crew:
+        return Crew(self.players_df, self.combat_df)
+
+    @cached_property
+    def registry(self) -> CombatantRegistry:
+        return CombatantRegistry(self.combat_df)
+
+    @cached_property
+    def ships(self) -> Ships:
+        return Ships(self.combat_df, self.registry)
+
+    @cached_property
+    def outcome(self) -> Outcome:
+        return Outcome(self.players_df, self.combat_df)
+
+    @cached_property
+    def team_membership(self) -> TeamMembership:
+        return TeamMembership(self.players_df, self.combat_df, self.registry)
+
+    @cached_property
+    def combatant_filter(self) -> FilterCombatDataframeByCombatant:
+        return FilterCombatDataframeByCombatant(self.combat_df, self.registry)
+
+    @cached_property
+    def damage_cube(self) -> DamageCube:
+        return DamageCube.from_combat_df(self.combat_df, self.registry)
+
+    @cached_property
+    def health_ledger(self) -> HealthLedger:
+        return HealthLedger(self.combat_df, self.players_df, self.fleets_df, self.registry)
+
+    def cache_stats(self) -> dict[str, QueryStats]:
+        """Return hit/miss counters for each memoized query called so far."""
+        return self.query_cache.stats()
+
+    @property
+    def combat_df(self) -> pd.DataFrame:
+        return self.battle.combat_df
+
+    @property
+    def players_df(self) -> pd.DataFrame:
+        return self.battle.players_df
+
+    @property
+    def fleets_df(self) -> pd.DataFrame:
+        return self.battle.fleets_df
+
+    @property
+    def loot_df(self) -> pd.DataFrame:
+        return self.battle.loot_df
 
-    def __init__(self, combat_df: pd.DataFrame) -> None:
-        self.combat_df = combat_df
-        players_df = combat_df.attrs.get("players_df")
-        if not isinstance(players_df, pd.DataFrame):
-            logger.warning("SessionInfo missing players_df in combat_df attrs.")
-            players_df = pd.DataFrame()
-        fleets_df = combat_df.attrs.get("fleets_df")
-        if not isinstance(fleets_df, pd.DataFrame):
-            logger.warning("SessionInfo missing fleets_df in combat_df attrs.")
-            fleets_df = pd.DataFrame()
-        self.players_df = players_df
-        self.fleets_df = fleets_df
-        self.combatants = Combatants(self.players_df, self.combat_df)
-        self.crew = Crew(self.players_df, self.combat_df)
-        self.ships = Ships(self.combat_df)
-        self.outcome = Outcome(self.players_df, self.combat_df)
     #
     # From core/Crew
     #
+    @memoized_query()
     def get_captain_name(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return the captain officer name(s) for a combatant and ship."""
         return self.crew.get_captain_name(combatant_name, ship_name)
 
+    @memoized_query()
     def get_1st_officer_name(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return the first officer name(s) for a combatant and ship."""
         return self.crew.get_1st_officer_name(combatant_name, ship_name)
 
+    @memoized_query()
     def get_2nd_officer_name(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return the second officer name(s) for a combatant and ship."""
         return self.crew.get_2nd_officer_name(combatant_name, ship_name)
 
+    @memoized_query()
     def get_bridge_crew(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return the bridge crew officer names for a combatant and ship."""
         return self.crew.get_bridge_crew(combatant_name, ship_name)
 
+    @memoized_query()
     def get_below_deck_officers(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return below-deck officer names for a combatant and ship."""
         return self.crew.get_below_deck_officers(combatant_name, ship_name)
 
+    @memoized_query()
     def all_officer_names(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return all officer names activated by a combatant and ship."""
         return self.crew.all_officer_names(combatant_name, ship_name)
@@ -59,9 +129,11 @@ class Delegator:
     #
     # From core/Combatants
     #
+    @memoized_query(maxsize=1)
     def combatant_names(self) -> set[str]:
         return self.combatants.combatant_names()
 
+    @memoized_query(maxsize=1)
     def alliance_names(self) -> set[str]:
         return self.combatants.alliance_names()
 
@@ -69,12 +141,25 @@ class Delegator:
     #
     # From core/Ships
     #
+    @memoized_query(maxsize=1)
     def get_every_ship(self) -> set[ShipSpecifier]:
         return self.ships.get_every_ship()
 
+    @memoized_query()
     def get_ships(self, combatant_name: str) -> set[str]:
         return self.ships.get_ships(combatant_name)
 
+    #
+    # From core/TeamMembership
+    #
+    def get_combat_df_with_teams(self) -> pd.DataFrame:
+        """Return the combat frame with attacker_team/target_team code columns."""
+        return self.team_membership.team_combat_df
+
+    def get_team_damage_by_round(self, column: str = "applied_damage") -> pd.DataFrame:
+        """Return damage dealt and received per (round, team)."""
+        return self.team_membership.damage_by_round(column)
+
     #
     # From core/Outcome
     #
@@ -103,5 +188,15 @@ class Delegator:
         """Infer a player outcome based on the NPC outcome."""
         return Outcome.infer_player_outcome(npc_outcome)
 
+    @memoized_query(maxsize=1)
     def build_outcome_lookup(self) -> dict[tuple[str, str, str], object]:
-        return self.outcome.build_outcome_lookup()
\ No newline at end of file
+        return self.outcome.build_outcome_lookup()
+
+    @classmethod
+    def build_outcome_lookups(
+        cls, sessions: Iterable[Delegator]
+    ) -> list[dict[tuple[str, str, str], object]]:
+        """Return one outcome lookup per session, built in a single batched pass."""
+        return Outcome.build_outcome_lookups(
+            (session.players_df, session.combat_df) for session in sessions
+        )
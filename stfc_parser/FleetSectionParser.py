@@ -22,12 +22,15 @@ class FleetSectionParser(AbstractSectionParser):
     }
     FLEET_BOOLEAN_COLUMNS = ("buff_applied", "debuff_applied")
 
-    def __init__(self, section_text: str | None) -> None:
+    def __init__(self, section_text: str | memoryview | None, *, engine: str = "c") -> None:
         self.section_text = section_text
+        self.engine = engine
 
     def parse(self, *, soft: bool = False) -> pd.DataFrame:
         """Return a normalized fleets dataframe."""
-        fleets_df = section_to_dataframe(self.section_text, SECTION_HEADERS["fleets"])
+        fleets_df = section_to_dataframe(
+            self.section_text, SECTION_HEADERS["fleets"], engine=self.engine
+        )
         fleets_df = self._normalize_dataframe(fleets_df)
         fleets_df = fleets_df.rename(columns=self.FLEET_COLUMN_RENAMES, inplace=False)
         fleets_df = self._coerce_yes_no_columns(fleets_df, self.FLEET_BOOLEAN_COLUMNS)
@@ -0,0 +1,123 @@
+"""Parse battle log sections on first access instead of all up front."""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from functools import cached_property
+from typing import IO, Any, Iterator
+
+import pandas as pd
+
+from stfc_parser.BattleSectionParser import BattleSectionParser
+from stfc_parser.FleetSectionParser import FleetSectionParser
+from stfc_parser.LootSectionParser import LootSectionParser
+from stfc_parser.ParsedBattle import ParsedBattle
+from stfc_parser.PlayerSectionParser import PlayerSectionParser
+from stfc_parser.StartsWhen import tokenize_sections
+from stfc_parser.compact import compact_combat_df
+from stfc_parser.core.FixPlayersDataframe import FixPlayersDataframe
+
+logger = logging.getLogger(__name__)
+
+
+class LazyParsedBattle:
+    """
+    A ParsedBattle whose frames are parsed, validated, and repaired on first access.
+
+    The export is tokenized once up front; each section is then parsed the first
+    time its attribute is read and memoized. ``players_df`` only pulls in the
+    fleets and combat frames when the players section needs repair. Seconds
+    spent on each section are recorded in ``timings``.
+    """
+
+    SECTIONS = ("combat_df", "players_df", "fleets_df", "loot_df", "raw_combat_df")
+
+    def __init__(
+        self,
+        file_bytes: bytes | str | IO[Any],
+        *,
+        soft: bool = False,
+        engine: str = "c",
+        compact: bool = False,
+        workers: int | None = 1,
+    ) -> None:
+        self._parser = BattleSectionParser(file_bytes, engine=engine, workers=workers)
+        self.sections = tokenize_sections(self._parser._read_buffer(file_bytes))
+        self.soft = soft
+        self.engine = engine
+        self.compact = compact
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def _timed(self, section: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[section] = self.timings.get(section, 0.0) + time.perf_counter() - start
+
+    @cached_property
+    def combat_df(self) -> pd.DataFrame:
+        with self._timed("combat"):
+            df = self._parser._parse_sections(self.sections, soft=self.soft)
+            if self.compact:
+                df = compact_combat_df(df)
+        return df
+
+    @cached_property
+    def raw_combat_df(self) -> pd.DataFrame:
+        with self._timed("raw_combat"):
+            return self._parser.read_raw(self.sections)
+
+    @cached_property
+    def fleets_df(self) -> pd.DataFrame:
+        with self._timed("fleets"):
+            return FleetSectionParser(self.sections.get("fleets"), engine=self.engine).parse(
+                soft=self.soft
+            )
+
+    @cached_property
+    def loot_df(self) -> pd.DataFrame:
+        with self._timed("loot"):
+            return LootSectionParser(self.sections.get("rewards"), engine=self.engine).parse(
+                soft=self.soft
+            )
+
+    @cached_property
+    def players_df(self) -> pd.DataFrame:
+        psp = PlayerSectionParser(self.sections.get("players"), engine=self.engine)
+        with self._timed("players"):
+            players_df = psp.parse(soft=self.soft)
+        if not FixPlayersDataframe.needs_fix(players_df):
+            return players_df
+        # Resolve repair dependencies outside the players timer; they time themselves.
+        fleets_df = self.fleets_df
+        combat_df = self.combat_df
+        with self._timed("players"):
+            return psp.repair(players_df, combat_df, fleets_df)
+
+    def parsed_sections(self) -> list[str]:
+        """Return the frame attributes that have been parsed so far."""
+        return [name for name in self.SECTIONS if name in self.__dict__]
+
+    def materialize(self) -> ParsedBattle:
+        """
+        Parse any remaining sections and return an eager ParsedBattle.
+
+        The raw combat frame is carried over if it was read, and otherwise
+        left for the ParsedBattle to read on first access.
+        """
+        raw_combat = self.__dict__.get("raw_combat_df")
+        return ParsedBattle(
+            combat_df=self.combat_df,
+            players_df=self.players_df,
+            fleets_df=self.fleets_df,
+            loot_df=self.loot_df,
+            raw_combat=raw_combat if raw_combat is not None else self._parser.raw_reader(self.sections),
+        )
+
+    def to_combat_df(self) -> pd.DataFrame:
+        """Return the combat frame with the side frames in attrs (legacy shape)."""
+        return self.materialize().to_combat_df()
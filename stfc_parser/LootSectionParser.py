@@ -14,14 +14,17 @@ logger = logging.getLogger(__name__)
 class LootSectionParser(AbstractSectionParser):
     """Parse the rewards section of a combat log into a normalized dataframe."""
 
-    def __init__(self, section_text: str | None) -> None:
+    def __init__(self, section_text: str | memoryview | None, *, engine: str = "c") -> None:
         self.section_text = section_text
+        self.engine = engine
 
     def parse(self, *, soft: bool = False) -> pd.DataFrame:
         """Return a normalized dataframe for rewards/loot entries."""
         if not self.section_text:
             logger.debug("Rewards section missing or empty; returning empty loot dataframe.")
-        loot_df = section_to_dataframe(self.section_text, SECTION_HEADERS["rewards"])
+        loot_df = section_to_dataframe(
+            self.section_text, SECTION_HEADERS["rewards"], engine=self.engine
+        )
         loot_df = self._normalize_dataframe(loot_df)
         return validate_dataframe(
             loot_df,
@@ -0,0 +1,81 @@
+"""Container for the validated frames parsed from one battle log."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable
+
+import pandas as pd
+
+from stfc_parser.frames import shallow_copy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ParsedBattle:
+    """
+    Validated combat, players, fleets, and loot frames for a single export.
+
+    The frames are held as separate fields rather than in ``combat_df.attrs``;
+    pandas deep-copies ``attrs`` into every derived frame, so keeping the side
+    frames out of it keeps filters and copies on the combat frame cheap.
+
+    ``raw_combat`` is the string-typed combat section: a frame, or a
+    zero-argument reader (see ``BattleSectionParser.raw_reader``) that
+    ``raw_combat_df`` calls on first access, so a parse that never looks at
+    the raw frame reads the combat section only once. A reader holds the
+    export it reads from, so it is left out when the battle is pickled: an
+    unpickled battle has no raw frame until its source is attached again
+    (``ParseCache`` and ``parse_many`` do this).
+    """
+
+    combat_df: pd.DataFrame
+    players_df: pd.DataFrame
+    fleets_df: pd.DataFrame
+    loot_df: pd.DataFrame
+    raw_combat: pd.DataFrame | Callable[[], pd.DataFrame] | None = field(default=None, repr=False)
+
+    ATTRS_KEYS = ("players_df", "fleets_df", "loot_df", "raw_combat_df")
+
+    @cached_property
+    def raw_combat_df(self) -> pd.DataFrame | None:
+        """Return the combat section as read, before normalization, reading it if needed."""
+        if callable(self.raw_combat):
+            return self.raw_combat()
+        return self.raw_combat
+
+    def __getstate__(self) -> dict[str, object]:
+        state = dict(self.__dict__)
+        if callable(state["raw_combat"]):
+            state["raw_combat"] = None
+            state.pop("raw_combat_df", None)
+        return state
+
+    @classmethod
+    def from_combat_df(cls, combat_df: pd.DataFrame) -> "ParsedBattle":
+        """Build a ParsedBattle from a combat frame carrying the legacy attrs."""
+        frames: dict[str, pd.DataFrame] = {}
+        for key in ("players_df", "fleets_df", "loot_df"):
+            frame = combat_df.attrs.get(key)
+            if not isinstance(frame, pd.DataFrame):
+                if key != "loot_df":
+                    logger.warning("SessionInfo missing %s in combat_df attrs.", key)
+                frame = pd.DataFrame()
+            frames[key] = frame
+        raw_combat_df = combat_df.attrs.get("raw_combat_df")
+        bare = shallow_copy(combat_df)
+        bare.attrs = {}
+        return cls(
+            combat_df=bare,
+            raw_combat=raw_combat_df if isinstance(raw_combat_df, pd.DataFrame) else None,
+            **frames,
+        )
+
+    def to_combat_df(self) -> pd.DataFrame:
+        """Return the combat frame with the side frames in attrs (legacy shape)."""
+        combat_df = shallow_copy(self.combat_df)
+        combat_df.attrs.update({key: getattr(self, key) for key in self.ATTRS_KEYS})
+        return combat_df
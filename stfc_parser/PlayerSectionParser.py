@@ -17,13 +17,22 @@ logger = logging.getLogger(__name__)
 class PlayerSectionParser(AbstractSectionParser):
     """Parse and normalize the player metadata section of a battle log."""
 
-    def __init__(self, section_text: str | None, combat_df: pd.DataFrame) -> None:
+    def __init__(
+        self,
+        section_text: str | memoryview | None,
+        combat_df: pd.DataFrame | None = None,
+        *,
+        engine: str = "c",
+    ) -> None:
         self.section_text = section_text
         self.combat_df = combat_df
+        self.engine = engine
 
     def parse(self, *, soft: bool = False) -> pd.DataFrame:
         """Return a normalized players dataframe, with inferred entries as needed."""
-        players_df = section_to_dataframe(self.section_text, SECTION_HEADERS["players"])
+        players_df = section_to_dataframe(
+            self.section_text, SECTION_HEADERS["players"], engine=self.engine
+        )
         players_df = self._normalize_dataframe(players_df)
         #players_df = self._augment_players_df(players_df, self.combat_df)
         return validate_dataframe(
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pandas as pd
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShipSpecifier:
-    """Identify a combatant by name, alliance, and ship."""
+    """
+    Identify a combatant by name, alliance, and ship.
+
+    The normalized key is computed once at construction; equality and hashing
+    still use the raw fields.
+    """
 
     name: str | None
     alliance: str | None
     ship: str | None
+    _key: tuple[str, str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_key", self.normalize_key(self.name, self.alliance, self.ship))
 
     @staticmethod
     def normalize_text(value: object) -> str:
@@ -36,19 +45,19 @@ class ShipSpecifier:
 
     def normalized_name(self) -> str:
         """Return the normalized combatant name."""
-        return self.normalize_text(self.name)
+        return self._key[0]
 
     def normalized_alliance(self) -> str:
         """Return the normalized alliance label."""
-        return self.normalize_text(self.alliance)
+        return self._key[1]
 
     def normalized_ship(self) -> str:
         """Return the normalized ship label."""
-        return self.normalize_text(self.ship)
+        return self._key[2]
 
     def normalized_key(self) -> tuple[str, str, str]:
         """Return the normalized lookup key for this spec."""
-        return self.normalize_key(self.name, self.alliance, self.ship)
+        return self._key
 
     def matches_normalized(self, name: object, alliance: object, ship: object) -> bool:
         """Return True when the normalized inputs match this spec."""
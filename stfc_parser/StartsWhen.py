@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import importlib.util
 import io
 import logging
-from typing import IO
+import mmap
+import os
+import re
+from functools import cache, lru_cache
+from typing import IO, Any, Iterator, Mapping
 
 import pandas as pd
 
@@ -17,6 +22,8 @@ SECTION_HEADERS = {
     "combat": "Round\tBattle Event\tType",
 }
 
+ENGINES = ("c", "pyarrow", "auto")
+
 
 def extract_sections(text: str, headers: dict[str, str] | None = None) -> dict[str, str]:
     """Extract labeled sections from a battle log export."""
@@ -53,19 +60,303 @@ def extract_sections(text: str, headers: dict[str, str] | None = None) -> dict[s
     return found
 
 
-def section_to_dataframe(section_text: str | None, header_prefix: str) -> pd.DataFrame:
+class SectionReader(io.RawIOBase):
+    """Expose a byte range of a shared buffer as a readable binary stream.
+
+    Bytes are copied out only as the consumer asks for them, so a large section
+    is never duplicated as a whole.
+    """
+
+    def __init__(self, buffer: memoryview, start: int = 0, end: int | None = None) -> None:
+        self._buffer = buffer
+        self._pos = start
+        self._end = len(buffer) if end is None else end
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        size = min(len(b), self._end - self._pos)
+        if size <= 0:
+            return 0
+        b[:size] = self._buffer[self._pos : self._pos + size]
+        self._pos += size
+        return size
+
+
+class SectionIndex(Mapping[str, memoryview]):
+    """Byte offsets of each labeled section inside one shared buffer.
+
+    Indexing by section key returns a zero-copy ``memoryview`` of that section.
+    """
+
+    def __init__(self, buffer: memoryview, spans: dict[str, tuple[int, int]]) -> None:
+        self.buffer = buffer
+        self.spans = spans
+
+    def __getitem__(self, key: str) -> memoryview:
+        start, end = self.spans[key]
+        return self.buffer[start:end]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.spans)
+
+    def __len__(self) -> int:
+        return len(self.spans)
+
+    def reader(self, key: str) -> io.BufferedReader | None:
+        """Return a buffered binary stream over a section, or None when absent."""
+        if key not in self.spans:
+            return None
+        start, end = self.spans[key]
+        return io.BufferedReader(SectionReader(self.buffer, start, end))
+
+    def text(self, key: str) -> str | None:
+        """Return a decoded copy of a section, or None when absent."""
+        if key not in self.spans:
+            return None
+        return bytes(self[key]).decode("utf-8", errors="replace")
+
+
+class SectionText(Mapping[str, str]):
+    """Decoded view of a ``SectionIndex``, shaped like ``extract_sections`` output.
+
+    Each section is decoded on access, with its lines joined by ``\\n`` and
+    trailing blank lines dropped; the index's byte views stay internal.
+    """
+
+    def __init__(self, sections: SectionIndex) -> None:
+        self.sections = sections
+
+    def __getitem__(self, key: str) -> str:
+        text = self.sections.text(key)
+        if text is None:
+            raise KeyError(key)
+        lines = text.splitlines()
+        while lines and not lines[-1].strip():
+            lines.pop()
+        return "\n".join(lines)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sections)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+
+def as_buffer(data: bytes | bytearray | memoryview | str) -> memoryview:
+    """Return a byte view of the input, encoding text once when needed."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return data if isinstance(data, memoryview) else memoryview(data)
+
+
+def map_file(path: str | os.PathLike[str]) -> memoryview:
+    """
+    Return a read-only memory map of a file as a byte view.
+
+    Pages are loaded by the OS as sections are scanned and read, so the file is
+    never copied into a Python bytes object. The mapping is released once the
+    view and every slice taken from it are garbage collected.
+    """
+    with open(path, "rb") as handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files cannot be mapped
+            return memoryview(b"")
+    return memoryview(mapped)
+
+
+def unmap_file(view: memoryview) -> bool:
+    """
+    Release a view from ``map_file`` and close its mapping.
+
+    Returns False, leaving the mapping to the garbage collector, while slices
+    of the view are still alive.
+    """
+    mapped = view.obj
+    view.release()
+    if isinstance(mapped, mmap.mmap):
+        try:
+            mapped.close()
+        except BufferError:
+            return False
+    return True
+
+
+@lru_cache(maxsize=8)
+def _section_pattern(headers: tuple[tuple[str, str], ...]) -> re.Pattern[bytes]:
+    alternatives = [
+        b"(?P<s%d>%s)" % (i, re.escape(prefix.encode("utf-8")))
+        for i, (_, prefix) in enumerate(headers)
+    ]
+    alternatives.append(rb"(?P<blank>[ \t\r\f\v]*$)")
+    return re.compile(b"^(?:" + b"|".join(alternatives) + b")", re.MULTILINE)
+
+
+def tokenize_sections(
+    data: bytes | bytearray | memoryview | str,
+    headers: dict[str, str] | None = None,
+    *,
+    open_ended: str | None = "combat",
+) -> SectionIndex:
+    """Locate every labeled section in a single scan of the export.
+
+    A section runs from its header line up to the next blank line or header.
+    The ``open_ended`` section (combat by default) runs to the end of the buffer,
+    matching how ``StartsWhen`` feeds it to ``pd.read_csv``; scanning stops there,
+    so the combat rows themselves are never walked by the tokenizer.
+    """
+    headers = headers or SECTION_HEADERS
+    buffer = as_buffer(data)
+    keys = list(headers)
+    pattern = _section_pattern(tuple(headers.items()))
+    spans: dict[str, tuple[int, int]] = {}
+    current_key: str | None = None
+    current_start = 0
+
+    for match in pattern.finditer(buffer):
+        if match.lastgroup == "blank":
+            if current_key is not None:
+                spans[current_key] = (current_start, match.start())
+            current_key = None
+            continue
+        if current_key is not None:
+            spans[current_key] = (current_start, match.start())
+        current_key = keys[int(match.lastgroup[1:])]
+        current_start = match.start()
+        if current_key == open_ended:
+            break
+
+    if current_key is not None:
+        spans[current_key] = (current_start, len(buffer))
+    return SectionIndex(buffer, spans)
+
+
+@cache
+def pyarrow_available() -> bool:
+    """Return True when pyarrow can be imported."""
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+@cache
+def resolve_engine(engine: str = "c") -> str:
+    """
+    Map a requested section reader engine to the one that will actually run.
+
+    ``"auto"`` picks pyarrow when it is installed. An explicit ``"pyarrow"``
+    request falls back to the C engine, with a warning, when it is not.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine {engine!r}; expected one of {ENGINES}")
+    if engine == "c":
+        return "c"
+    if pyarrow_available():
+        return "pyarrow"
+    if engine == "pyarrow":
+        logger.warning("pyarrow is not installed; falling back to the C engine.")
+    return "c"
+
+
+# pandas dtype names used by the section parsers and their pyarrow equivalents.
+_ARROW_TYPE_NAMES = {
+    "str": "string",
+    "string": "string",
+    "float64": "float64",
+    "boolean": "bool_",
+    "bool": "bool_",
+}
+
+
+def _arrow_type(dtype: Any) -> Any:
+    import pyarrow as pa
+
+    name = dtype.__name__ if isinstance(dtype, type) else str(dtype)
+    return getattr(pa, _ARROW_TYPE_NAMES[name])()
+
+
+def _section_columns(buffer: memoryview) -> list[str]:
+    header = io.BufferedReader(SectionReader(buffer)).readline()
+    return header.decode("utf-8", errors="replace").rstrip("\r\n").split("\t")
+
+
+def _read_section_arrow(
+    buffer: memoryview,
+    *,
+    dtype: Any = None,
+    na_values: Any = None,
+    true_values: Any = None,
+    false_values: Any = None,
+    **_: Any,
+) -> pd.DataFrame:
+    """
+    Read a section with pyarrow's CSV reader straight into Arrow-backed columns.
+
+    Column types are fixed up front from the section header rather than
+    inferred, so string columns stay strings. Options pyarrow has no
+    equivalent for (``thousands``, ``float_precision``) are ignored; a value
+    they would have handled fails to convert and the caller falls back.
+    """
+    import pyarrow as pa
+    from pyarrow import csv
+
+    column_types = {}
+    if dtype is not None:
+        for column in _section_columns(buffer):
+            try:
+                column_dtype = dtype[column] if isinstance(dtype, Mapping) else dtype
+            except KeyError:
+                continue
+            column_types[column] = _arrow_type(column_dtype)
+    null_values = list(na_values or [])
+    convert_options = csv.ConvertOptions(
+        column_types=column_types,
+        null_values=null_values,
+        strings_can_be_null="" in null_values,
+        **({"true_values": list(true_values)} if true_values else {}),
+        **({"false_values": list(false_values)} if false_values else {}),
+    )
+    table = csv.read_csv(
+        pa.BufferReader(pa.py_buffer(buffer)),
+        parse_options=csv.ParseOptions(delimiter="\t"),
+        convert_options=convert_options,
+    )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+def read_section_csv(
+    section: str | bytes | memoryview, *, engine: str = "c", **kwargs
+) -> pd.DataFrame:
+    """
+    Run ``pd.read_csv`` over a tab-delimited section without copying it first.
+
+    With ``engine="pyarrow"`` (or ``"auto"`` when pyarrow is installed) the
+    section is read by pyarrow into Arrow-backed columns instead. Any input
+    pyarrow rejects, such as ragged rows, is re-read with the C engine.
+    """
+    if resolve_engine(engine) == "pyarrow":
+        import pyarrow as pa
+
+        try:
+            return _read_section_arrow(as_buffer(section), **kwargs)
+        except (pa.ArrowInvalid, KeyError) as exc:
+            logger.debug("pyarrow could not read section (%s); using the C engine.", exc)
+    if isinstance(section, str):
+        return pd.read_csv(io.StringIO(section), sep="\t", **kwargs)
+    source = io.BufferedReader(SectionReader(as_buffer(section)))
+    return pd.read_csv(source, sep="\t", encoding="utf-8", encoding_errors="replace", **kwargs)
+
+
+def section_to_dataframe(
+    section_text: str | bytes | memoryview | None, header_prefix: str, *, engine: str = "c"
+) -> pd.DataFrame:
     """Parse a tab-delimited section into a dataframe."""
     columns = header_prefix.split("\t")
     if not section_text:
         return pd.DataFrame(columns=columns)
 
     try:
-        return pd.read_csv(
-            io.StringIO(section_text),
-            sep="\t",
-            dtype=str,
-            na_values=NA_TOKENS,
-        )
+        return read_section_csv(section_text, engine=engine, dtype=str, na_values=NA_TOKENS)
     except Exception:  # pragma: no cover - defensive for messy inputs
         logger.exception("Failed to parse section with header %s", header_prefix)
         return pd.DataFrame(columns=columns)
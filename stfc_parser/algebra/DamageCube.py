@@ -0,0 +1,262 @@
+import os
+from dataclasses import dataclass
+from functools import cached_property
+from typing import BinaryIO
+
+import numpy as np
+import pandas as pd
+
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.algebra.NonNormalizedGVS import NonNormalizedGVS
+from stfc_parser.core.CombatantRegistry import CombatantRegistry
+
+
+@dataclass(frozen=True)
+class DamageCube:
+    """
+    Dense damage tensor of one battle: round × attacker × target × metric.
+
+    ``values[r, a, t, m]`` is metric m summed over the attack events of round
+    ``rounds[r]`` fired by ``combatants[a]`` at ``combatants[t]``. Attacker and
+    target axes share the CombatantRegistry id space, so one index names one
+    combatant on both. The metrics are a shot count followed by the
+    OFFENSIVE_COLS and DEFENSIVE_COLS of NonNormalizedGVS; is_crit sums to a
+    crit count and missing values count as 0.
+
+    Selections are views of ``values`` where NumPy allows; marginals and the
+    running totals over rounds are reductions of it. The cube pickles as is
+    and saves to a pickle-free .npz archive.
+    """
+    values: np.ndarray
+    rounds: np.ndarray
+    combatants: tuple[ShipSpecifier, ...]
+    metrics: tuple[str, ...]
+
+    AXES = ('round', 'attacker', 'target', 'metric')
+
+    METRICS = (
+        'shots',
+        *NonNormalizedGVS.OFFENSIVE_COLS,
+        *NonNormalizedGVS.DEFENSIVE_COLS,
+    )
+
+    # ---- lifecycle ----
+    def __post_init__(self):
+        self._validate()
+
+    # ---- construction ----
+    @classmethod
+    def from_non_normalized(cls, nn: NonNormalizedGVS) -> 'DamageCube':
+        """Build the cube from the attack events of a NonNormalizedGVS."""
+        registry = CombatantRegistry(nn.df)
+        return cls._from_events(nn.df, registry.ids('attacker'), registry.ids('target'), registry.specs)
+
+    @classmethod
+    def from_combat_df(
+        cls,
+        combat_df: pd.DataFrame,
+        registry: CombatantRegistry | None = None,
+    ) -> 'DamageCube':
+        """
+        Build the cube from the Attack rows of a parser combat frame.
+
+        Passing the session's registry keeps the combatant axes on its ids,
+        and so aligned with e.g. TeamMembership.combatant_teams.
+        """
+        registry = registry if registry is not None else CombatantRegistry(combat_df)
+        attackers = registry.ids('attacker')
+        targets = registry.ids('target')
+        if attackers is None or targets is None or 'event_type' not in combat_df.columns:
+            raise ValueError("DamageCube needs event_type, attacker and target columns")
+        attacks = (combat_df['event_type'] == 'Attack').to_numpy(dtype=bool, na_value=False)
+        return cls._from_events(combat_df[attacks], attackers[attacks], targets[attacks], registry.specs)
+
+    @classmethod
+    def _from_events(
+        cls,
+        df: pd.DataFrame,
+        attackers: np.ndarray,
+        targets: np.ndarray,
+        combatants: tuple[ShipSpecifier, ...],
+    ) -> 'DamageCube':
+        """Sum every metric into its (round, attacker, target) cell with one bincount each."""
+        missing = [col for col in ('round', *cls.METRICS[1:]) if col not in df.columns]
+        if missing:
+            raise ValueError(f"DamageCube missing columns: {missing}")
+
+        round_codes, rounds = pd.factorize(df['round'], sort=True)
+        counted = round_codes >= 0
+        width = len(combatants)
+        cells = ((round_codes * width + attackers) * width + targets)[counted]
+        size = len(rounds) * width * width
+
+        values = np.empty((len(cls.METRICS), size), dtype=np.float64)
+        values[0] = np.bincount(cells, minlength=size)
+        for row, col in enumerate(cls.METRICS[1:], start=1):
+            weights = df[col].to_numpy(dtype=np.float64, na_value=0.0)[counted]
+            values[row] = np.bincount(cells, weights=weights, minlength=size)
+
+        return cls(
+            values.T.reshape(len(rounds), width, width, len(cls.METRICS)),
+            np.asarray(rounds),
+            tuple(combatants),
+            cls.METRICS,
+        )
+
+    # ---- invariants ----
+    def _validate(self):
+        expected = (len(self.rounds), len(self.combatants), len(self.combatants), len(self.metrics))
+        if self.values.shape != expected:
+            raise ValueError(f"DamageCube values have shape {self.values.shape}, labels need {expected}")
+
+    # ---- labels ----
+    @cached_property
+    def _positions(self) -> dict[str, dict[object, int]]:
+        combatants: dict[object, int] = {}
+        for position, spec in enumerate(self.combatants):
+            combatants.setdefault(spec.normalized_key(), position)
+        return {
+            'round': {k: position for position, k in enumerate(self.rounds.tolist())},
+            'combatant': combatants,
+            'metric': {name: position for position, name in enumerate(self.metrics)},
+        }
+
+    def index_of(self, axis: str, label: object) -> int:
+        """
+        Return the position of a label on an axis.
+
+        Rounds are round numbers and metrics are names. Combatants are
+        ShipSpecifiers, matched on their normalized key, or registry ids.
+        """
+        if axis not in self.AXES:
+            raise ValueError(f"Unknown DamageCube axis: {axis}")
+        if axis in ('attacker', 'target'):
+            if isinstance(label, ShipSpecifier):
+                label = label.normalized_key()
+            elif isinstance(label, (int, np.integer)) and 0 <= label < len(self.combatants):
+                return int(label)
+            axis = 'combatant'
+        try:
+            return self._positions[axis][label]
+        except (KeyError, TypeError):
+            raise KeyError(f"{label!r} is not on the DamageCube {axis} axis") from None
+
+    def labels(self, axis: str) -> list[object]:
+        """Return the labels along an axis, in cube order."""
+        if axis == 'round':
+            return self.rounds.tolist()
+        if axis in ('attacker', 'target'):
+            return list(self.combatants)
+        if axis == 'metric':
+            return list(self.metrics)
+        raise ValueError(f"Unknown DamageCube axis: {axis}")
+
+    # ---- projections ----
+    def select(
+        self,
+        round: object = None,
+        attacker: object = None,
+        target: object = None,
+        metric: object = None,
+    ) -> np.ndarray:
+        """
+        Return the part of the cube at the given labels.
+
+        Each argument is None to keep the whole axis, one label to drop the
+        axis, or a list of labels to keep those, in that order. Whole axes and
+        single labels give views; label lists copy.
+        """
+        result = self.values
+        axis = 0
+        for name, selection in zip(self.AXES, (round, attacker, target, metric)):
+            if selection is None:
+                axis += 1
+            elif isinstance(selection, (list, tuple, np.ndarray)):
+                result = result.take([self.index_of(name, label) for label in selection], axis=axis)
+                axis += 1
+            else:
+                result = result[(slice(None),) * axis + (self.index_of(name, selection),)]
+        return result
+
+    def marginal(self, *keep: str, metric: str | None = None) -> np.ndarray:
+        """
+        Sum out every round/attacker/target axis not named in ``keep``.
+
+        The kept axes stay in cube order and are followed by the metric axis,
+        unless one ``metric`` is picked: ``marginal('attacker',
+        metric='hull_damage')`` is the hull damage each combatant dealt.
+        """
+        unknown = set(keep) - set(self.AXES[:3])
+        if unknown:
+            raise ValueError(f"Cannot keep DamageCube axes: {sorted(unknown)}")
+        values = self.values if metric is None else self.values[..., self.index_of('metric', metric)]
+        summed = tuple(position for position, axis in enumerate(self.AXES[:3]) if axis not in keep)
+        return values.sum(axis=summed)
+
+    def to_frame(self, *keep: str) -> pd.DataFrame:
+        """
+        Return ``marginal(*keep)`` as a frame with one column per metric.
+
+        The index levels follow the order of ``keep`` and hold every
+        combination of the kept labels that saw at least one shot; with
+        nothing kept it is a single row of totals.
+        """
+        marginal = self.marginal(*keep)
+        # marginal() keeps its axes in cube order; line them up with ``keep``.
+        in_cube_order = [axis for axis in self.AXES[:3] if axis in keep]
+        marginal = marginal.transpose([in_cube_order.index(axis) for axis in keep] + [len(keep)])
+        totals = marginal.reshape(-1, len(self.metrics))
+        if not keep:
+            return pd.DataFrame(totals, columns=list(self.metrics))
+        index = pd.MultiIndex.from_product([self.labels(axis) for axis in keep], names=list(keep))
+        if len(keep) == 1:
+            index = index.get_level_values(0)
+        frame = pd.DataFrame(totals, index=index, columns=list(self.metrics))
+        return frame[totals[:, self.metrics.index('shots')] > 0]
+
+    # ---- running totals ----
+    @cached_property
+    def cumulative(self) -> np.ndarray:
+        """Return read-only running totals over rounds: entry r sums rounds[0] through rounds[r]."""
+        totals = np.cumsum(self.values, axis=0)
+        totals.flags.writeable = False
+        return totals
+
+    def through_round(self, k: object) -> np.ndarray:
+        """Return the (attacker, target, metric) totals of every round up to and including k."""
+        position = int(np.searchsorted(self.rounds, k, side='right')) - 1
+        if position < 0:
+            return np.zeros(self.values.shape[1:])
+        return self.cumulative[position]
+
+    # ---- serialization ----
+    def save(self, file: str | os.PathLike | BinaryIO) -> None:
+        """Write the cube and its labels to an uncompressed .npz archive."""
+        fields = {
+            f'combatant_{field}': np.array([getattr(spec, field) or '' for spec in self.combatants], dtype=str)
+            for field in CombatantRegistry.FIELDS
+        }
+        np.savez(
+            file,
+            values=self.values,
+            rounds=self.rounds,
+            metrics=np.array(self.metrics, dtype=str),
+            **fields,
+        )
+
+    @classmethod
+    def load(cls, file: str | os.PathLike | BinaryIO) -> 'DamageCube':
+        """Read a cube written by ``save``; the archive is loaded without pickle."""
+        with np.load(file, allow_pickle=False) as archive:
+            fields = [
+                archive[f'combatant_{field}'].tolist() for field in CombatantRegistry.FIELDS
+            ]
+            return cls(
+                archive['values'],
+                archive['rounds'],
+                tuple(
+                    ShipSpecifier(name=name, alliance=alliance, ship=ship)
+                    for name, alliance, ship in zip(*fields)
+                ),
+                tuple(archive['metrics'].tolist()),
+            )
@@ -1,6 +1,12 @@
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterator
+
+import numpy as np
 import pandas as pd
 
+from stfc_parser.frames import copy_on_write_enabled
+
 @dataclass(frozen=True)
 class NonNormalizedGVS:
     """
@@ -8,6 +14,12 @@ class NonNormalizedGVS:
 
     Each row is an atomic attack event (shot-level), graded by round,
     carrying raw offensive flux, defensive response, and target capacity.
+
+    Round and target projections are slices of partitions built on first use:
+    the events sorted once by (round, battle_event, shot_index), and that order
+    regrouped by target. Under copy-on-write (always on from pandas 3.0) each
+    slice is a view sharing the partition's buffers and stays independent if
+    anyone writes to it; without it each slice is copied.
     """
     df: pd.DataFrame
 
@@ -31,6 +43,8 @@ class NonNormalizedGVS:
         'initial_hull_health',
     ]
 
+    ORDER_COLS = ['round', 'battle_event', 'shot_index']
+
     # ---- lifecycle ----
     def __post_init__(self):
         self._validate()
@@ -144,9 +158,72 @@ class NonNormalizedGVS:
         return self.df[self.DEFENSIVE_COLS]
 
     def by_round(self, k: int) -> "NonNormalizedGVS":
-        return NonNormalizedGVS(self.df[self.df['round'] == k].copy())
+        frame, offsets = self._round_partition
+        return self._view(frame, offsets.get(k, slice(0, 0)))
 
     def for_target(self, target_name: str) -> "NonNormalizedGVS":
-        return NonNormalizedGVS(
-            self.df[self.df['target_name'] == target_name].copy()
-        )
\ No newline at end of file
+        frame, offsets = self._target_partition
+        return self._view(frame, offsets.get(target_name, slice(0, 0)))
+
+    def iter_rounds(self) -> Iterator[tuple[object, "NonNormalizedGVS"]]:
+        """Yield (round, events) for every round, in ascending order.
+
+        Rows without a round are skipped, as by_round cannot select them.
+        """
+        frame, offsets = self._round_partition
+        for k, rows in offsets.items():
+            yield k, self._view(frame, rows)
+
+    def iter_targets(self) -> Iterator[tuple[object, "NonNormalizedGVS"]]:
+        """Yield (target_name, events) for every target, in order of first appearance.
+
+        Rows without a target name are skipped, as for_target cannot select them.
+        """
+        frame, offsets = self._target_partition
+        for target_name, rows in offsets.items():
+            yield target_name, self._view(frame, rows)
+
+    # ---- partitions ----
+    @cached_property
+    def _round_partition(self) -> tuple[pd.DataFrame, dict[object, slice]]:
+        df = self.df
+        keys = [
+            df[c].to_numpy(dtype=np.float64, na_value=np.inf)
+            for c in reversed(self.ORDER_COLS)
+        ]
+        order = np.lexsort(keys)
+        # Parser output is already in event order; only reorder when it is not.
+        if not np.array_equal(order, np.arange(len(df))):
+            df = df.take(order)
+        codes, labels = pd.factorize(df['round'], sort=True)
+        return df, self._offsets(codes, labels)
+
+    @cached_property
+    def _target_partition(self) -> tuple[pd.DataFrame, dict[object, slice]]:
+        df, _ = self._round_partition
+        codes, labels = pd.factorize(df['target_name'])
+        # A stable sort keeps each target's events in event order.
+        order = np.argsort(codes, kind='stable')
+        return df.take(order), self._offsets(codes[order], labels)
+
+    @staticmethod
+    def _offsets(codes: np.ndarray, labels) -> dict[object, slice]:
+        """Return the slice of each label's run in grouped factorize codes, skipping missing (-1)."""
+        if len(codes) == 0:
+            return {}
+        labels = pd.Index(labels).tolist()
+        starts = (np.flatnonzero(np.diff(codes)) + 1).tolist()
+        bounds = [0, *starts, len(codes)]
+        return {
+            labels[codes[start]]: slice(start, stop)
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            if codes[start] >= 0
+        }
+
+    @classmethod
+    def _view(cls, frame: pd.DataFrame, rows: slice) -> "NonNormalizedGVS":
+        # Slices of a validated space are valid; skip re-validating every view.
+        view = object.__new__(cls)
+        df = frame.iloc[rows]
+        object.__setattr__(view, 'df', df if copy_on_write_enabled() else df.copy())
+        return view
\ No newline at end of file
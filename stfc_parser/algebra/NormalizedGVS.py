@@ -2,6 +2,86 @@ from dataclasses import dataclass
 import pandas as pd
 import numpy as np
 
+from stfc_parser.frames import shallow_copy
+
+STATE_FIELDS = ['name', 'ship', 'alliance']
+
+
+def _combatant_codes(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Return attacker and target codes over one shared combatant numbering.
+
+    Each (name, ship, alliance) field is factorized across both roles with
+    nulls kept as a value of their own, so a null matches only a null, and
+    the field codes are folded into dense ids. The third array flags, per
+    id, combatants with a null field.
+    """
+    n = len(df)
+    codes = np.zeros(2 * n, dtype=np.int64)
+    has_null = np.zeros(2 * n, dtype=bool)
+    width = 1
+    for field in STATE_FIELDS:
+        values = pd.concat([df[f'attacker_{field}'], df[f'target_{field}']], ignore_index=True)
+        field_codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        null_codes = np.flatnonzero(pd.isna(uniques))
+        if len(null_codes):
+            has_null |= field_codes == null_codes[0]
+        if width * len(uniques) >= 2**62:
+            codes, distinct = pd.factorize(codes)
+            width = len(distinct)
+        codes = codes * len(uniques) + field_codes
+        width *= len(uniques)
+    codes, distinct = pd.factorize(codes)
+    null_ids = np.zeros(len(distinct), dtype=bool)
+    null_ids[codes[has_null]] = True
+    return codes[:n], codes[n:], null_ids
+
+
+def _state_before_shot(
+    time_key: np.ndarray,
+    attackers: np.ndarray,
+    targets: np.ndarray,
+    hull: np.ndarray,
+) -> np.ndarray:
+    """
+    Return each reader's last written hull value from an earlier time step.
+
+    Rows are in time_key order; row i reads attackers[i] and writes hull[i]
+    to targets[i]. Reads and writes are laid out as one stream, each read
+    placed ahead of every write of its time step, and the stream is grouped
+    by combatant with stable sorts so the running state becomes a forward
+    fill of the latest write. Both sorts are linear here: the first merges
+    two ascending runs, the second is a radix sort on small codes. Missing
+    states and null hull values read as 1.0.
+    """
+    n = len(time_key)
+    if n == 0:
+        return np.empty(0, dtype=np.float64)
+    step_start = np.flatnonzero(np.r_[True, time_key[1:] != time_key[:-1]])
+    first_row = np.repeat(step_start, np.diff(np.r_[step_start, n]))
+
+    position = np.concatenate([2 * first_row, 2 * np.arange(n) + 1])
+    stream = np.argsort(position, kind='stable')
+    combatants = np.concatenate([attackers, targets])[stream]
+    if combatants.max() < np.iinfo(np.int16).max:
+        combatants = combatants.astype(np.int16)
+    by_combatant = np.argsort(combatants, kind='stable')
+    stream = stream[by_combatant]
+    combatants = combatants[by_combatant]
+
+    is_write = stream >= n
+    latest = np.maximum.accumulate(np.where(is_write, np.arange(2 * n), -1))
+    seen = latest >= 0
+    latest = np.where(seen, latest, 0)
+    seen &= combatants[latest] == combatants
+    state = np.where(seen, hull[stream[latest] - n], np.nan)
+
+    is_read = ~is_write
+    result = np.empty(n, dtype=np.float64)
+    result[stream[is_read]] = state[is_read]
+    return np.where(np.isnan(result), 1.0, result)
+
+
 @dataclass(frozen=True)
 class NormalizedGVS:
     """
@@ -17,13 +97,21 @@ class NormalizedGVS:
         'shield_damage', 'hull_damage',
     ]
 
+    TARGET_COLS = ['target_name', 'target_ship', 'target_alliance']
+
+    DERIVED_COLS = (
+        ['damage_pct']
+        + [f'{col}_norm' for col in NORM_COLS]
+        + ['cumulative_hull_damage_norm', 'current_hull_percentage']
+    )
+
     def __post_init__(self):
         self._validate()
 
     # ---- construction ----
     @classmethod
     def from_non_normalized(cls, nn):
-        df = nn.df.copy()
+        df = shallow_copy(nn.df)
 
         # --- safeguard ---
         df['initial_hull_health'] = (
@@ -31,93 +119,110 @@ class NormalizedGVS:
             .fillna(0.0)
         )
 
-        # --- scalar hull damage fraction ---
-        df['damage_pct'] = (
-            df['hull_damage'] / df['initial_hull_health']
-        ).replace([np.inf, -np.inf], 0).fillna(0)
-
-        # --- linear normalization ---
-        for col in cls.NORM_COLS:
-            df[f'{col}_norm'] = (
-                df[col] / df['initial_hull_health']
-            ).replace([np.inf, -np.inf], 0).fillna(0)
-
-        # --- target hull trajectory ---
-        df['cumulative_hull_damage_norm'] = (
-            df.groupby(
-                ['target_name', 'target_ship', 'target_alliance']
-            )['hull_damage_norm']
-            .cumsum()
-        )
-
-        df['current_hull_percentage'] = (
-            1.0 - df['cumulative_hull_damage_norm']
-        )
+        # --- normalization and target hull trajectory ---
+        attackers, targets, null_ids = _combatant_codes(df)
+        df = pd.concat([df, cls._normalize_block(df, targets, null_ids)], axis=1)
 
         # --- attacker state pullback ---
-        df = cls._annotate_attacker_state(df)
+        df = cls._annotate_attacker_state(df, (attackers, targets))
 
         return cls(df)
 
+    @classmethod
+    def _normalize_block(
+        cls,
+        df: pd.DataFrame,
+        targets: np.ndarray,
+        null_ids: np.ndarray,
+    ) -> pd.DataFrame:
+        """
+        Return the DERIVED_COLS of ``df`` as one float block on its index.
+
+        The NORM_COLS are stacked into a 2-D array and divided by
+        initial_hull_health in one broadcast; quotients that are not finite
+        (zero or missing hull, missing damage) become 0, and damage_pct is the
+        normalized hull damage. Hull damage accumulates in row order per target
+        code; rows whose target has a null field (``null_ids``) have no
+        trajectory (NaN), as with a groupby that drops null keys.
+        """
+        n_cols = len(cls.NORM_COLS)
+        block = np.empty((len(cls.DERIVED_COLS), len(df)), dtype=np.float64)
+        damage = np.vstack([df[col].to_numpy(dtype=np.float64, na_value=np.nan) for col in cls.NORM_COLS])
+        hull = df['initial_hull_health'].to_numpy(dtype=np.float64)
+
+        norm = block[1:n_cols + 1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            np.divide(damage, hull, out=norm)
+        norm[~np.isfinite(norm)] = 0.0
+        hull_norm = norm[cls.NORM_COLS.index('hull_damage')]
+        block[0] = hull_norm
+
+        has_target = ~null_ids[targets]
+        cumulative = (
+            pd.Series(hull_norm, copy=False)
+            .groupby(np.where(has_target, targets, -1))
+            .cumsum()
+            .to_numpy()
+        )
+        block[n_cols + 1] = np.where(has_target, cumulative, np.nan)
+        block[n_cols + 2] = 1.0 - block[n_cols + 1]
+
+        return pd.DataFrame(block.T, index=df.index, columns=cls.DERIVED_COLS, copy=False)
+
     # ---- attacker state annotation ----
     @staticmethod
-    def _annotate_attacker_state(df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
-
-        df['time_key'] = (
-            df['round'] * 1_000_000 +
-            df['battle_event'] * 1_000 +
-            df['shot_index']
+    def _annotate_attacker_state(
+        df: pd.DataFrame,
+        combatants: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Attach each attacker's own hull percentage as of just before its shot.
+
+        Events are taken in time_key order against a running hull percentage
+        per combatant that starts at 1.0: every time step first reads its
+        attackers' state, then records the hull its targets are left at, so
+        shots sharing a time_key do not see each other. Rows come back in
+        time_key order on a fresh index; name/ship/alliance repeat the
+        attacker columns, as the previous merge_asof left them.
+        ``combatants`` may pass in the row-aligned codes of _combatant_codes.
+        """
+        df = shallow_copy(df)
+
+        # Widen the counters first: compact frames narrow them to int8/int16.
+        round_, battle_event, shot_index = (
+            df[c].astype('Int64') if pd.api.types.is_integer_dtype(df[c]) else df[c]
+            for c in ('round', 'battle_event', 'shot_index')
         )
-
-        state_history = df[[
-            'time_key',
-            'target_name', 'target_ship', 'target_alliance',
-            'current_hull_percentage'
-        ]].copy()
-
-        state_history.columns = [
-            'time_key', 'name', 'ship', 'alliance', 'hp_pct'
-        ]
-
-        participants = pd.concat([
-            df[['attacker_name', 'attacker_ship', 'attacker_alliance']]
-              .rename(columns={'attacker_name':'name',
-                               'attacker_ship':'ship',
-                               'attacker_alliance':'alliance'}),
-            df[['target_name', 'target_ship', 'target_alliance']]
-              .rename(columns={'target_name':'name',
-                               'target_ship':'ship',
-                               'target_alliance':'alliance'}),
-        ]).drop_duplicates()
-
-        participants['time_key'] = -1
-        participants['hp_pct'] = 1.0
-
-        full_history = (
-            pd.concat([participants, state_history])
-            .sort_values('time_key')
+        df['time_key'] = (
+            round_ * 1_000_000 +
+            battle_event * 1_000 +
+            shot_index
         )
-
-        df = df.sort_values('time_key')
-
-        df = pd.merge_asof(
-            df,
-            full_history,
-            left_on='time_key',
-            right_on='time_key',
-            left_by=['attacker_name', 'attacker_ship', 'attacker_alliance'],
-            right_by=['name', 'ship', 'alliance'],
-            direction='backward',
-            allow_exact_matches=False
+        if df['time_key'].isna().any():
+            raise ValueError("Attacker state needs round, battle_event and shot_index on every event")
+
+        attackers, targets = combatants if combatants is not None else _combatant_codes(df)[:2]
+        time_key = df['time_key'].to_numpy(dtype=np.int64)
+        if len(time_key) and (np.diff(time_key) < 0).any():
+            order = np.argsort(time_key, kind='stable')
+            df = df.take(order)
+            time_key, attackers, targets = time_key[order], attackers[order], targets[order]
+        df = df.reset_index(drop=True)
+
+        df['name'] = df['attacker_name']
+        df['ship'] = df['attacker_ship']
+        df['alliance'] = df['attacker_alliance']
+        df['attacker_hull_percentage'] = _state_before_shot(
+            time_key,
+            attackers,
+            targets,
+            df['current_hull_percentage'].to_numpy(dtype=np.float64, na_value=np.nan),
         )
 
-        df = df.rename(columns={'hp_pct': 'attacker_hull_percentage'})
-        df['attacker_hull_percentage'] = df['attacker_hull_percentage'].fillna(1.0)
-
         return df
 
     # ---- invariants ----
     def _validate(self):
-        if (self.df.filter(like='_norm') < 0).any().any():
+        norm = self.df.filter(like='_norm').to_numpy(dtype=np.float64, na_value=np.nan)
+        if (norm < 0).any():
             raise ValueError("Negative normalized values detected")
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""Parse many battle log exports at once over a process pool."""
+
+from __future__ import annotations
+
+import logging
+import os
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from stfc_parser.BattleSectionParser import BattleSectionParser
+from stfc_parser.ParsedBattle import ParsedBattle
+from stfc_parser.parser_stub import parse_battle
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ParseError:
+    """Describe why a single file in a batch failed to parse."""
+
+    error_type: str
+    message: str
+    traceback: str
+
+    @classmethod
+    def from_exception(cls, exc: BaseException) -> "ParseError":
+        return cls(
+            error_type=type(exc).__name__,
+            message=str(exc),
+            traceback="".join(traceback.format_exception(exc)),
+        )
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of parsing one file: either a ParsedBattle or a ParseError."""
+
+    path: Path
+    battle: ParsedBattle | None = None
+    error: ParseError | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _parse_path(path: Path) -> BatchResult:
+    try:
+        return BatchResult(path=path, battle=parse_battle(path.read_bytes(), path.name))
+    except Exception as exc:
+        logger.warning("Failed to parse %s: %s", path, exc)
+        return BatchResult(path=path, error=ParseError.from_exception(exc))
+
+
+def _parse_chunk(paths: Sequence[Path]) -> list[BatchResult]:
+    return [_parse_path(path) for path in paths]
+
+
+def _reattach_raw(result: BatchResult) -> BatchResult:
+    """Point a battle sent back by a worker at its file for the raw frame left out of the pickle."""
+    if result.battle is None:
+        return result
+    raw_combat = partial(BattleSectionParser.read_raw_file, result.path)
+    return replace(result, battle=replace(result.battle, raw_combat=raw_combat))
+
+
+def parse_many(
+    paths: Iterable[str | os.PathLike[str]],
+    workers: int | None = None,
+    chunksize: int = 1,
+) -> Iterator[BatchResult]:
+    """
+    Parse battle log files, yielding results in completion order.
+
+    Files are fanned out to ``workers`` processes (default: CPU count) in
+    groups of ``chunksize``. A file that fails to parse comes back as a
+    ``BatchResult`` carrying a ``ParseError``; it never aborts the batch. With
+    ``workers=1`` files are parsed in-process, in input order.
+    """
+    path_list = [Path(path) for path in paths]
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(path_list) <= 1:
+        for path in path_list:
+            yield _parse_path(path)
+        return
+
+    chunks = [path_list[i : i + chunksize] for i in range(0, len(path_list), chunksize)]
+    pool = ProcessPoolExecutor(max_workers=min(workers, len(chunks)))
+    try:
+        pending: dict[Future[list[BatchResult]], list[Path]] = {
+            pool.submit(_parse_chunk, chunk): chunk for chunk in chunks
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                try:
+                    results = future.result()
+                except Exception as exc:
+                    # The worker itself died (e.g. BrokenProcessPool); report every file in the chunk.
+                    error = ParseError.from_exception(exc)
+                    results = [BatchResult(path=path, error=error) for path in chunk]
+                yield from map(_reattach_raw, results)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
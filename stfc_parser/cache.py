@@ -0,0 +1,220 @@
+"""Content-addressed on-disk cache of parsed battle logs."""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import logging
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, replace
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+
+from stfc_parser.BattleSectionParser import BattleSectionParser
+from stfc_parser.ParsedBattle import ParsedBattle
+from stfc_parser.StartsWhen import resolve_engine, tokenize_sections
+from stfc_parser.compact import compact_combat_df
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUFFIX = ".battle.pkl"
+
+# Bump when a parse result changes through code outside PARSER_MODULES (or
+# when the pickled ParsedBattle layout changes) so stale entries are not served.
+CACHE_FORMAT_VERSION = 1
+
+# Modules whose source decides what a parse returns; editing any of them
+# invalidates every cache entry.
+PARSER_MODULES = (
+    "stfc_parser.parser_stub",
+    "stfc_parser.AbstractSectionParser",
+    "stfc_parser.BattleSectionParser",
+    "stfc_parser.PlayerSectionParser",
+    "stfc_parser.FleetSectionParser",
+    "stfc_parser.LootSectionParser",
+    "stfc_parser.StartsWhen",
+    "stfc_parser.columns",
+    "stfc_parser.compact",
+    "stfc_parser.frames",
+    "stfc_parser.ParsedBattle",
+    "stfc_parser.ShipSpecifier",
+    "stfc_parser.core.FixPlayersDataframe",
+    "stfc_parser.core.HealthLedger",
+    "stfc_parser.core.CombatantRegistry",
+    "stfc_parser.core.Outcome",
+    "stfc_parser.rough.derive_metrics",
+    "stfc_parser.schemas",
+    "stfc_parser.schemas.CombatSchema",
+    "stfc_parser.schemas.PlayersSchema",
+    "stfc_parser.schemas.FleetsSchema",
+    "stfc_parser.schemas.LootSchema",
+    "stfc_parser.schemas.SchemaPlan",
+    "stfc_parser.schemas.SchemaValidation",
+    "stfc_parser.schemas.schema_helpers",
+)
+
+
+@cache
+def parser_fingerprint() -> str:
+    """
+    Return a digest of the cache format, the parser version and source, and
+    every section schema.
+    """
+    from stfc_parser.schemas import CombatSchema, FleetsSchema, LootSchema, PlayersSchema
+    from stfc_parser.schemas.CombatSchema import COMBAT_COLUMN_ALIASES, COMBAT_COLUMN_RENAMES
+
+    try:
+        version = metadata.version("stfc_parser")
+    except metadata.PackageNotFoundError:  # pragma: no cover - running from a bare checkout
+        version = "unknown"
+    digest = hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{version}".encode())
+    for name in PARSER_MODULES:
+        digest.update(Path(importlib.import_module(name).__file__).read_bytes())
+    for schema in (CombatSchema, PlayersSchema, FleetsSchema, LootSchema):
+        digest.update(repr(schema.to_schema()).encode())
+    digest.update(repr(sorted(COMBAT_COLUMN_RENAMES.items())).encode())
+    digest.update(repr(sorted(COMBAT_COLUMN_ALIASES.items())).encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Running counters for a ParseCache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+class ParseCache:
+    """
+    Store validated parse results on disk, keyed by file content.
+
+    Entries are keyed by a SHA-256 of the export bytes, the section reader
+    engine, and the parser fingerprint: CACHE_FORMAT_VERSION, the package
+    version, the source of the PARSER_MODULES and the section schemas. Editing
+    those modules or schemas invalidates old entries; a change elsewhere that
+    alters parse results must bump CACHE_FORMAT_VERSION. The frames are written with pickle
+    protocol 5, which stores each pandas block as one contiguous binary buffer
+    and preserves nullable dtypes exactly, so a warm hit skips section parsing
+    and validation entirely. When the cache grows past ``max_bytes`` the least
+    recently used entries are evicted.
+
+    Entries are read back with ``pickle.load``, which can run arbitrary code:
+    only point a ParseCache at a private directory this process controls, never
+    at one that is shared or whose contents are untrusted.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str], max_bytes: int = 512 * 1024 * 1024) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+    def key_for(self, file_bytes: bytes, *, engine: str = "c") -> str:
+        """Return the cache key for an export's raw bytes read with ``engine``."""
+        digest = hashlib.sha256(file_bytes)
+        digest.update(parser_fingerprint().encode())
+        digest.update(resolve_engine(engine).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, file_bytes: bytes, *, engine: str = "c") -> ParsedBattle | None:
+        """Return the cached ParsedBattle for these bytes, or None on a miss."""
+        path = self._path(self.key_for(file_bytes, engine=engine))
+        try:
+            with path.open("rb") as handle:
+                battle = pickle.load(handle)
+        except FileNotFoundError:
+            self.stats.misses += 1
+            return None
+        except Exception:
+            logger.warning("Discarding unreadable cache entry %s.", path, exc_info=True)
+            path.unlink(missing_ok=True)
+            self.stats.misses += 1
+            return None
+        os.utime(path)  # mark as most recently used
+        self.stats.hits += 1
+        return battle
+
+    def put(self, file_bytes: bytes, battle: ParsedBattle, *, engine: str = "c") -> None:
+        """Store a ParsedBattle for these bytes and evict entries over the size cap."""
+        path = self._path(self.key_for(file_bytes, engine=engine))
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                pickle.dump(battle, handle, protocol=5)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self.stats.stores += 1
+        self.evict(keep=path)
+
+    def parse(
+        self,
+        file_bytes: bytes,
+        filename: str,
+        *,
+        engine: str = "c",
+        compact: bool = False,
+        workers: int | None = 1,
+    ) -> ParsedBattle:
+        """
+        Return the cached parse for these bytes, parsing and storing on a miss.
+
+        ``engine`` and ``workers`` are passed to ``parse_battle`` on a miss.
+        The engine decides the column dtypes, so the resolved engine is part
+        of the key; ``workers`` only changes how the log is read. Entries hold
+        the default combat dtypes, and ``compact=True`` applies
+        ``compact_combat_df`` to the returned battle, so both modes share one
+        entry. Entries hold no raw combat frame; a hit reads it from
+        ``file_bytes`` on first access.
+        """
+        from stfc_parser.parser_stub import parse_battle
+
+        battle = self.get(file_bytes, engine=engine)
+        if battle is None:
+            battle = parse_battle(file_bytes, filename, engine=engine, workers=workers)
+            self.put(file_bytes, battle, engine=engine)
+        elif battle.raw_combat is None:
+            parser = BattleSectionParser(file_bytes, engine=engine)
+            sections = tokenize_sections(parser._read_buffer(file_bytes))
+            battle = replace(battle, raw_combat=parser.raw_reader(sections))
+        if compact:
+            battle = replace(battle, combat_df=compact_combat_df(battle.combat_df))
+        return battle
+
+    def size_bytes(self) -> int:
+        """Return the total size of all cache entries."""
+        return sum(path.stat().st_size for path in self.directory.glob(f"*{CACHE_SUFFIX}"))
+
+    def evict(self, *, keep: Path | None = None) -> None:
+        """Remove least recently used entries until the cache fits in ``max_bytes``."""
+        entries = []
+        for path in self.directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        for path in self.directory.glob(f"*{CACHE_SUFFIX}"):
+            path.unlink(missing_ok=True)
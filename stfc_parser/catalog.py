@@ -0,0 +1,173 @@
+"""Scan only the header sections of battle logs and catalog them."""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Iterable
+
+import pandas as pd
+
+from stfc_parser.FleetSectionParser import FleetSectionParser
+from stfc_parser.LootSectionParser import LootSectionParser
+from stfc_parser.PlayerSectionParser import PlayerSectionParser
+from stfc_parser.StartsWhen import SECTION_HEADERS, section_to_dataframe, tokenize_sections
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+
+CATALOG_COLUMNS = (
+    "path",
+    "timestamp",
+    "location",
+    "players",
+    "outcomes",
+    "ships",
+    "fleets",
+    "rewards",
+    "error",
+)
+
+
+@dataclass(frozen=True)
+class BattleHeader:
+    """
+    Players, fleets, and loot frames read from the top of one export.
+
+    The players frame is not repaired from the combat section, which is never
+    read; exports whose players section is incomplete stay incomplete here.
+    """
+
+    players_df: pd.DataFrame
+    fleets_df: pd.DataFrame
+    loot_df: pd.DataFrame
+    timestamp: pd.Timestamp | None
+    location: str | None
+
+
+def read_header_bytes(handle: IO[bytes]) -> bytes:
+    """Return the bytes of a binary stream up to, not including, the combat header."""
+    combat_header = SECTION_HEADERS["combat"].encode("utf-8")
+    lines: list[bytes] = []
+    for line in handle:
+        if line.startswith(combat_header):
+            break
+        lines.append(line)
+    return b"".join(lines)
+
+
+def _first_value(df: pd.DataFrame, column: str) -> Any:
+    if column not in df.columns:
+        return None
+    values = df[column].dropna()
+    return values.iloc[0] if len(values) else None
+
+
+def parse_timestamp(value: str | None) -> pd.Timestamp | None:
+    """Parse an export timestamp such as ``1/7/2026 8:20:49 AM``; None if it does not parse."""
+    if value is None:
+        return None
+    timestamp = pd.to_datetime(value, format=TIMESTAMP_FORMAT, errors="coerce")
+    return None if pd.isna(timestamp) else timestamp
+
+
+def scan_header(
+    path: str | os.PathLike[str],
+    *,
+    soft: bool = False,
+    engine: str = "c",
+    validate: bool = True,
+) -> BattleHeader:
+    """
+    Parse the players, rewards, and fleets sections of an export without its combat rows.
+
+    The file is read line by line and reading stops at the combat header, so
+    cost depends only on the (small) header sections. With ``validate=False``
+    the frames are returned as read (strings, NA tokens as missing), skipping
+    normalization and schema validation, which dominate the cost of a scan.
+    """
+    with open(path, "rb") as handle:
+        sections = tokenize_sections(read_header_bytes(handle))
+    if validate:
+        players_df = PlayerSectionParser(sections.get("players"), engine=engine).parse(soft=soft)
+        fleets_df = FleetSectionParser(sections.get("fleets"), engine=engine).parse(soft=soft)
+        loot_df = LootSectionParser(sections.get("rewards"), engine=engine).parse(soft=soft)
+    else:
+        players_df, fleets_df, loot_df = (
+            section_to_dataframe(sections.get(key), SECTION_HEADERS[key], engine=engine)
+            for key in ("players", "fleets", "rewards")
+        )
+    location = _first_value(players_df, "Location")
+    timestamp = _first_value(players_df, "Timestamp")
+    return BattleHeader(
+        players_df=players_df,
+        fleets_df=fleets_df,
+        loot_df=loot_df,
+        timestamp=None if timestamp is None else parse_timestamp(str(timestamp).strip()),
+        location=None if location is None else str(location).strip(),
+    )
+
+
+def _column_tuple(df: pd.DataFrame, column: str) -> tuple[str, ...]:
+    if column not in df.columns:
+        return ()
+    return tuple(str(value).strip() for value in df[column].dropna())
+
+
+def _catalog_row(path: Path) -> dict[str, Any]:
+    try:
+        header = scan_header(path, validate=False)
+    except Exception as exc:
+        logger.warning("Failed to scan %s: %s", path, exc)
+        return {"path": path, "error": f"{type(exc).__name__}: {exc}"}
+    return {
+        "path": path,
+        "timestamp": header.timestamp,
+        "location": header.location,
+        "players": _column_tuple(header.players_df, "Player Name"),
+        "outcomes": _column_tuple(header.players_df, "Outcome"),
+        "ships": _column_tuple(header.players_df, "Ship Name"),
+        "fleets": len(header.fleets_df),
+        "rewards": len(header.loot_df),
+        "error": None,
+    }
+
+
+def build_catalog(
+    paths: str | os.PathLike[str] | Iterable[str | os.PathLike[str]],
+    pattern: str = "*.csv",
+    *,
+    workers: int | None = None,
+    chunksize: int = 32,
+) -> pd.DataFrame:
+    """
+    Return one row per battle log with its time, location, players, and rewards.
+
+    ``paths`` is either a directory, searched recursively for ``pattern``, or an
+    iterable of files. Only the header sections are read, without validation
+    (see ``scan_header``).
+    A file that fails to scan gets a row with its ``error`` filled in rather than
+    aborting the catalog. Rows are sorted by timestamp, oldest first.
+
+    Files are scanned over ``workers`` processes (default: CPU count) in groups
+    of ``chunksize``; with ``workers=1`` they are scanned in-process.
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        path_list = sorted(Path(paths).rglob(pattern))
+    else:
+        path_list = [Path(path) for path in paths]
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    workers = min(workers or os.cpu_count() or 1, -(-len(path_list) // chunksize))
+    if workers <= 1:
+        rows = [_catalog_row(path) for path in path_list]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            rows = list(pool.map(_catalog_row, path_list, chunksize=chunksize))
+    catalog = pd.DataFrame(rows, columns=list(CATALOG_COLUMNS))
+    catalog["timestamp"] = pd.to_datetime(catalog["timestamp"])
+    return catalog.sort_values("timestamp", kind="stable", na_position="last", ignore_index=True)
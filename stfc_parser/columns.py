@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import pandas as pd
 
+from stfc_parser.frames import shallow_copy
+
 CANONICAL_COLUMN_STYLE = "snake_case"
 
 def resolve_event_type(
@@ -35,8 +37,7 @@ def add_alias_columns(
     aliases: dict[str, str] | None,
 ) -> pd.DataFrame:
     """Add alias columns for canonical sources (does not drop originals)."""
-    updated = df.copy()
-    updated.attrs = df.attrs.copy()
+    updated = shallow_copy(df)
     alias_map = aliases or {}
     for alias, source in alias_map.items():
         if alias in updated.columns:
@@ -0,0 +1,75 @@
+"""Opt-in compact dtypes for the validated combat frame."""
+
+from __future__ import annotations
+
+import logging
+
+import pandas as pd
+
+from stfc_parser.frames import shallow_copy
+from stfc_parser.schemas.CombatSchema import (
+    COMBAT_CATEGORY_COLUMNS,
+    COMBAT_COUNTER_COLUMNS,
+    COMBAT_FLAG_COLUMNS,
+    COMBAT_IDENTITY_COLUMNS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def identity_dtype(combat_df: pd.DataFrame) -> pd.CategoricalDtype:
+    """Return one categorical dtype covering every identity value in the battle."""
+    values: set[str] = set()
+    for column in COMBAT_IDENTITY_COLUMNS:
+        if column in combat_df.columns:
+            values.update(combat_df[column].dropna().unique())
+    return pd.CategoricalDtype(sorted(values))
+
+
+def _narrow_integers(series: pd.Series) -> pd.Series:
+    if not pd.api.types.is_integer_dtype(series):
+        return series
+    return pd.to_numeric(series, downcast="integer")
+
+
+def compact_combat_df(combat_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return the validated combat frame with compact dtypes.
+
+    Identity columns (names, ships, alliances, ability owners) become
+    categoricals sharing one category set, so attacker and target columns
+    still compare and merge against each other. Other low-cardinality text
+    columns get their own categories, counters are narrowed to the smallest
+    integer type that holds them (widen them before arithmetic that can
+    overflow it), and flags are nullable booleans. Damage
+    columns are left as float64. Only whole columns are replaced.
+    """
+    compact = shallow_copy(combat_df)
+    shared = identity_dtype(combat_df)
+    for column in COMBAT_IDENTITY_COLUMNS:
+        if column in compact.columns:
+            compact[column] = compact[column].astype(shared)
+    for column in COMBAT_CATEGORY_COLUMNS:
+        if column in compact.columns:
+            compact[column] = compact[column].astype("category")
+    for column in COMBAT_COUNTER_COLUMNS:
+        if column in compact.columns:
+            compact[column] = _narrow_integers(compact[column])
+    for column in COMBAT_FLAG_COLUMNS:
+        if column in compact.columns:
+            compact[column] = compact[column].astype("boolean")
+    return compact
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """Return per-column deep memory usage before and after compaction, in bytes."""
+    report = pd.DataFrame(
+        {
+            "dtype_before": before.dtypes.astype(str),
+            "dtype_after": after.dtypes.reindex(before.columns).astype(str),
+            "bytes_before": before.memory_usage(index=False, deep=True),
+            "bytes_after": after.memory_usage(index=False, deep=True).reindex(before.columns),
+        }
+    )
+    report["bytes_saved"] = report["bytes_before"] - report["bytes_after"]
+    return report.sort_values("bytes_saved", ascending=False)
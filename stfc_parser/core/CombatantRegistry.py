@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import logging
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.frames import shallow_copy
+
+logger = logging.getLogger(__name__)
+
+
+class CombatantRegistry:
+    """
+    Give every distinct combatant of a battle an integer id.
+
+    Attacker and target (name, alliance, ship) triples share one id space, so
+    an attacker id and a target id are equal exactly when the triples are.
+    Values are kept as they appear in the combat frame, with nulls as empty
+    strings. Each id owns one interned ShipSpecifier, and the per-row codes
+    are available as arrays or as ``attacker_id``/``target_id`` columns.
+    """
+
+    ROLES = ("attacker", "target")
+    FIELDS = ("name", "alliance", "ship")
+    ID_COLUMNS = {"attacker": "attacker_id", "target": "target_id"}
+
+    def __init__(self, combat_df: pd.DataFrame):
+        self.combat_df = combat_df
+
+    @classmethod
+    def role_columns(cls, role: str) -> list[str]:
+        return [f"{role}_{field}" for field in cls.FIELDS]
+
+    @cached_property
+    def _encoded(self) -> tuple[dict[str, np.ndarray], tuple[ShipSpecifier, ...]]:
+        df = self.combat_df
+        roles = []
+        for role in self.ROLES:
+            missing = [column for column in self.role_columns(role) if column not in df.columns]
+            if missing:
+                logger.warning("Combat df missing %s columns; no %s ids: %s", role, role, missing)
+            else:
+                roles.append(role)
+        if not roles:
+            return {}, ()
+
+        # Factorize each identity column and map its few distinct values into one
+        # shared vocabulary; code 0 is the empty string that stands in for nulls.
+        columns = [column for role in roles for column in self.role_columns(role)]
+        vocabulary: dict[str, int] = {"": 0}
+        cells = np.empty((len(columns), len(df)), dtype=np.int64)
+        for row, column in enumerate(columns):
+            codes, uniques = pd.factorize(df[column])
+            remap = [vocabulary.setdefault(str(value), len(vocabulary)) for value in uniques]
+            cells[row] = np.array(remap + [0], dtype=np.int64)[codes]
+        cells = cells.reshape(len(roles), len(self.FIELDS), len(df))
+
+        # Pack (name, alliance, ship) codes into one integer key; vocabularies too
+        # large to pack in 63 bits are combined pairwise instead.
+        width = len(vocabulary)
+        name, alliance, ship = (cells[:, field].ravel() for field in range(len(self.FIELDS)))
+        if width**3 < 2**63:
+            ids, _ = pd.factorize((name * width + alliance) * width + ship)
+        else:
+            pairs, _ = pd.factorize(name * width + alliance)
+            ids, _ = pd.factorize(pairs * width + ship)
+        ids = ids.astype(np.int32)
+
+        first = np.empty(ids.max() + 1 if ids.size else 0, dtype=np.intp)
+        first[ids[::-1]] = np.arange(ids.size)[::-1]
+        fields = cells.transpose(1, 0, 2).reshape(len(self.FIELDS), -1)[:, first]
+        labels = np.array(list(vocabulary), dtype=object)
+        specs = tuple(
+            ShipSpecifier(name=spec_name, alliance=spec_alliance, ship=spec_ship)
+            for spec_name, spec_alliance, spec_ship in zip(*(labels[codes] for codes in fields))
+        )
+        return dict(zip(roles, ids.reshape(len(roles), len(df)))), specs
+
+    @property
+    def specs(self) -> tuple[ShipSpecifier, ...]:
+        """Return the interned specifier for every id, indexed by id."""
+        return self._encoded[1]
+
+    def spec(self, combatant_id: int) -> ShipSpecifier:
+        """Return the interned specifier for an id."""
+        return self.specs[combatant_id]
+
+    @cached_property
+    def _ids_by_key(self) -> dict[tuple[str, str, str], int]:
+        return {
+            (spec.name, spec.alliance, spec.ship): combatant_id
+            for combatant_id, spec in enumerate(self.specs)
+        }
+
+    def id_of(self, name: object, alliance: object, ship: object) -> int | None:
+        """Return the id of a (name, alliance, ship) triple, or None when it never appears."""
+        key = tuple(
+            "" if value is None or pd.isna(value) else str(value) for value in (name, alliance, ship)
+        )
+        return self._ids_by_key.get(key)
+
+    def intern(self, spec: ShipSpecifier) -> ShipSpecifier:
+        """Return the registry's instance of a specifier, or the specifier itself when unknown."""
+        combatant_id = self.id_of(spec.name, spec.alliance, spec.ship)
+        return spec if combatant_id is None else self.specs[combatant_id]
+
+    def ids(self, role: str) -> np.ndarray | None:
+        """Return the per-row combatant ids for a role, or None if its columns are missing."""
+        return self._encoded[0].get(role)
+
+    def role_specs(self, role: str) -> list[ShipSpecifier]:
+        """Return the interned specifiers seen in a role, in order of first appearance."""
+        ids = self.ids(role)
+        if ids is None:
+            return []
+        return [self.specs[combatant_id] for combatant_id in pd.unique(ids)]
+
+    @cached_property
+    def _rows_by_id(self) -> dict[str, dict[int, np.ndarray]]:
+        rows = {}
+        for role, ids in self._encoded[0].items():
+            order = np.argsort(ids, kind="stable")
+            bounds = np.cumsum(np.bincount(ids, minlength=len(self.specs)))
+            rows[role] = {
+                combatant_id: positions
+                for combatant_id, positions in enumerate(np.split(order, bounds[:-1]))
+                if positions.size
+            }
+        return rows
+
+    def rows_by_id(self, role: str) -> dict[int, np.ndarray] | None:
+        """Return ascending row positions keyed by combatant id, or None if the role is missing."""
+        return self._rows_by_id.get(role)
+
+    @cached_property
+    def coded_combat_df(self) -> pd.DataFrame:
+        """Return the combat frame with ``attacker_id``/``target_id`` columns appended."""
+        coded = shallow_copy(self.combat_df)
+        for role, ids in self._encoded[0].items():
+            coded[self.ID_COLUMNS[role]] = ids
+        return coded
@@ -1,52 +1,123 @@
+from dataclasses import dataclass
+from functools import cached_property
+
 import pandas as pd
 
+from stfc_parser.ShipSpecifier import ShipSpecifier
+
+
+@dataclass(frozen=True)
+class OfficerRoster:
+    """Bridge crew from the players section and officers seen activating in combat."""
+
+    captain: frozenset[str] = frozenset()
+    first_officer: frozenset[str] = frozenset()
+    second_officer: frozenset[str] = frozenset()
+    activated: frozenset[str] = frozenset()
+
+    @property
+    def bridge_crew(self) -> frozenset[str]:
+        return self.captain | self.first_officer | self.second_officer
+
+
+EMPTY_ROSTER = OfficerRoster()
+
+
+def _normalized(series: pd.Series) -> pd.Series:
+    """Vectorized ShipSpecifier.normalize_text: stripped strings, nulls as empty."""
+    return series.astype("string").str.strip().fillna("")
+
 
 class Crew:
+    """
+    Answer officer queries for each (combatant, ship) from a precomputed roster.
+
+    The roster is built on first use: one pass over the players section for the
+    bridge crew and one groupby over officer events for activated officers.
+    Every query is then a dict lookup keyed by the normalized (name, ship).
+    """
+
+    BRIDGE_COLUMNS = {
+        "captain": "Officer One",
+        "first_officer": "Officer Two",
+        "second_officer": "Officer Three",
+    }
 
     def __init__(self, players_df: pd.DataFrame, combat_df: pd.DataFrame):
         self.players_df = players_df
         self.combat_df = combat_df
 
+    @cached_property
+    def _officer_events(self) -> pd.DataFrame:
+        """Officer ability rows of the combat frame, selected once."""
+        df = self.combat_df
+        event_type = df["event_type"].astype(str).str.lower()
+        return df.loc[event_type == "officer", ["attacker_name", "attacker_ship", "ability_owner_name"]]
+
+    @cached_property
+    def roster(self) -> dict[tuple[str, str], OfficerRoster]:
+        """Return officer rosters keyed by normalized (combatant name, ship name)."""
+        fields: dict[tuple[str, str], dict[str, set[str]]] = {}
+
+        df = self.players_df
+        if {"Player Name", "Ship Name"}.issubset(df.columns):
+            keys = list(zip(_normalized(df["Player Name"]), _normalized(df["Ship Name"])))
+            for field, column in self.BRIDGE_COLUMNS.items():
+                if column not in df.columns:
+                    continue
+                for key, officer in zip(keys, df[column]):
+                    if not pd.isna(officer):
+                        fields.setdefault(key, {}).setdefault(field, set()).add(str(officer))
+
+        events = self._officer_events
+        owners = events["ability_owner_name"]
+        present = owners.notna()
+        if present.any():
+            activated = (
+                owners[present]
+                .astype(str)
+                .groupby(
+                    [
+                        _normalized(events.loc[present, "attacker_name"]),
+                        _normalized(events.loc[present, "attacker_ship"]),
+                    ]
+                )
+                .unique()
+            )
+            for key, officers in activated.items():
+                fields.setdefault(key, {})["activated"] = set(officers)
+
+        return {
+            key: OfficerRoster(**{field: frozenset(names) for field, names in entry.items()})
+            for key, entry in fields.items()
+        }
+
+    def roster_for(self, combatant_name: str, ship_name: str) -> OfficerRoster:
+        """Return the roster for a combatant and ship, empty when unknown."""
+        key = ShipSpecifier.normalize_text(combatant_name), ShipSpecifier.normalize_text(ship_name)
+        return self.roster.get(key, EMPTY_ROSTER)
+
     def get_captain_name(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return the captain officer name(s) for a combatant and ship."""
-        df = self.players_df
-        mask = (df["Ship Name"] == ship_name) & (df["Player Name"] == combatant_name)
-        return set(df.loc[mask, "Officer One"].dropna().astype(str).unique())
+        return set(self.roster_for(combatant_name, ship_name).captain)
 
     def get_1st_officer_name(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return the first officer name(s) for a combatant and ship."""
-        df = self.players_df
-        mask = (df["Ship Name"] == ship_name) & (df["Player Name"] == combatant_name)
-        return set(df.loc[mask, "Officer Two"].dropna().astype(str).unique())
+        return set(self.roster_for(combatant_name, ship_name).first_officer)
 
     def get_2nd_officer_name(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return the second officer name(s) for a combatant and ship."""
-        df = self.players_df
-        mask = (df["Ship Name"] == ship_name) & (df["Player Name"] == combatant_name)
-        return set(df.loc[mask, "Officer Three"].dropna().astype(str).unique())
+        return set(self.roster_for(combatant_name, ship_name).second_officer)
 
     def get_bridge_crew(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return the bridge crew officer names for a combatant and ship."""
-        bridge_crew: set[str] = set()
-        bridge_crew.update(self.get_captain_name(combatant_name, ship_name))
-        bridge_crew.update(self.get_1st_officer_name(combatant_name, ship_name))
-        bridge_crew.update(self.get_2nd_officer_name(combatant_name, ship_name))
-        return bridge_crew
+        return set(self.roster_for(combatant_name, ship_name).bridge_crew)
 
     def get_below_deck_officers(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return below-deck officer names for a combatant and ship."""
-        all_officers = self.all_officer_names(combatant_name, ship_name)
-        bridge_crew = self.get_bridge_crew(combatant_name, ship_name)
-        return all_officers - bridge_crew
+        roster = self.roster_for(combatant_name, ship_name)
+        return set(roster.activated - roster.bridge_crew)
 
     def all_officer_names(self, combatant_name: str, ship_name: str) -> set[str]:
         """Return all officer names activated by a combatant and ship."""
-        df = self.combat_df
-        event_type = df["event_type"].astype(str).str.lower()
-        mask = (
-            (event_type == "officer")
-            & (df["attacker_ship"] == ship_name)
-            & (df["attacker_name"] == combatant_name)
-        )
-        return set(df.loc[mask, "ability_owner_name"].dropna().astype(str).unique())
-
+        return set(self.roster_for(combatant_name, ship_name).activated)
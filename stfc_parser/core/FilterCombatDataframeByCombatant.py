@@ -1,13 +1,26 @@
 import logging
 from typing import Sequence
 
+import numpy as np
 import pandas as pd
 
 from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.core.CombatantRegistry import CombatantRegistry
 
 logger = logging.getLogger(__name__)
 
 class FilterCombatDataframeByCombatant:
+    """
+    Filter combat rows by combatant for the attacker or target role.
+
+    Row positions are grouped by combatant id from the battle's
+    CombatantRegistry, once per role; every filter only matches specs against
+    the distinct combatants and unions their precomputed positions.
+    """
+
+    def __init__(self, combat_df: pd.DataFrame, registry: CombatantRegistry | None = None):
+        self.combat_df = combat_df
+        self.registry = registry if registry is not None else CombatantRegistry(combat_df)
 
     @classmethod
     def _get_combat_df_filtered_by_specs(
@@ -16,33 +29,40 @@ class FilterCombatDataframeByCombatant:
         specs: Sequence[ShipSpecifier],
         role: str,
     ) -> pd.DataFrame:
+        """Return combat rows for any provided ship specs for a given role."""
+        return cls(combat_df).filter_by_specs(specs, role)
+
+    def filter_by_specs(self, specs: Sequence[ShipSpecifier], role: str) -> pd.DataFrame:
         """Return combat rows for any provided ship specs for a given role."""
         if not specs:
-            return combat_df
-        df = combat_df
-        required_columns = (
-            f"{role}_name",
-            f"{role}_alliance",
-            f"{role}_ship",
+            return self.combat_df
+        index = self.role_index(role)
+        if index is None:
+            return self.combat_df.iloc[0:0]
+
+        combatants = self.registry.specs
+        groups = [
+            positions
+            for combatant_id, positions in index.items()
+            if any(self._matches(combatants[combatant_id], spec) for spec in specs)
+        ]
+        if not groups:
+            return self.combat_df.iloc[0:0]
+        # Groups are disjoint, so sorting restores frame order without duplicates.
+        return self.combat_df.iloc[np.sort(np.concatenate(groups))]
+
+    def role_index(self, role: str) -> dict[int, np.ndarray] | None:
+        """Return row positions keyed by combatant id, or None if columns are missing."""
+        index = self.registry.rows_by_id(role)
+        if index is None:
+            logger.warning("Combat df missing %s columns; cannot filter by %s.", role, role)
+        return index
+
+    @staticmethod
+    def _matches(combatant: ShipSpecifier, spec: ShipSpecifier) -> bool:
+        # Unset spec fields are wildcards; missing values (empty in the registry) never match a set field.
+        return (
+            (not spec.name or combatant.name == spec.name)
+            and (not spec.alliance or combatant.alliance == spec.alliance)
+            and (not spec.ship or combatant.ship == spec.ship)
         )
-        for column in required_columns:
-            if column not in df.columns:
-                logger.warning(
-                    "Combat df missing %s column; cannot filter by %s.",
-                    column,
-                    role,
-                )
-                return df.iloc[0:0]
-
-        mask = pd.Series(False, index=df.index)
-        for spec in specs:
-            spec_mask = pd.Series(True, index=df.index)
-            if spec.name:
-                spec_mask &= df[f"{role}_name"] == spec.name
-            if spec.alliance:
-                spec_mask &= df[f"{role}_alliance"] == spec.alliance
-            if spec.ship:
-                spec_mask &= df[f"{role}_ship"] == spec.ship
-            mask |= spec_mask
-
-        return df.loc[mask]
\ No newline at end of file
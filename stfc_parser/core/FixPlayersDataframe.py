@@ -4,16 +4,24 @@ from typing import Sequence
 import pandas as pd
 
 from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.core.HealthLedger import HealthLedger
 
 logger = logging.getLogger(__name__)
 
 
 class FixPlayersDataframe:
 
-    def __init__(self, players_df: pd.DataFrame, combat_df: pd.DataFrame, fleet_df: pd.DataFrame):
+    def __init__(
+        self,
+        players_df: pd.DataFrame,
+        combat_df: pd.DataFrame,
+        fleet_df: pd.DataFrame,
+        ledger: HealthLedger | None = None,
+    ):
         self.players_df = players_df
         self.combat_df = combat_df
         self.fleet_df = fleet_df
+        self.ledger = ledger if ledger is not None else HealthLedger(combat_df)
 
     def _fallback_players_df(
         self,  npc_name: str | None
@@ -84,13 +92,18 @@ class FixPlayersDataframe:
         }
         return pd.DataFrame(aligned)
 
+    @staticmethod
+    def needs_fix(players_df: pd.DataFrame) -> bool:
+        """Return True when the players section lacks rows that must be rebuilt from combat."""
+        return len(players_df) <= 1
+
     def fix(self) -> pd.DataFrame:
         """
         Drop-in replacement for the fix method to handle header recovery,
         outcome propagation, and health reconciliation.
         """
 
-        if len(self.players_df) > 1:
+        if not self.needs_fix(self.players_df):
             return self.players_df
         # 1. Identify Participants from shadow data (Attack events)
         # We need the order of appearance to map to Player Fleet 1, 2, 3
@@ -114,6 +127,11 @@ class FixPlayersDataframe:
         npc_outcome = str(npc_row.get("Outcome", pd.Series(["UNKNOWN"])).iloc[0]).upper()
         inferred_outcome = "DEFEAT" if "VICTORY" in npc_outcome else "VICTORY"
 
+        # Hull totals per fleet and hull damage taken per ship, each read once
+        # instead of scanning fleet_df and combat_df for every player.
+        max_hull_by_fleet = self.fleet_df.groupby('Fleet Type')['Hull Health'].sum()
+        damage_by_ship = self._hull_damage_by_ship()
+
         # 4. Reconstruct the Players Dataframe
         reconstructed_rows = []
         for i, (_, row) in enumerate(players_only.iterrows()):
@@ -127,8 +145,8 @@ class FixPlayersDataframe:
 
             # 5. Calculate Hull Health Remaining (Point 6)
             # Find max health from fleet_df and subtract damage from combat_df
-            max_hull = self.fleet_df.loc[self.fleet_df['Fleet Type'] == f"Player Fleet {i + 1}", 'Hull Health'].sum()
-            damage_taken = self.combat_df[self.combat_df['target_ship'] == row['attacker_ship']]['hull_damage'].sum()
+            max_hull = max_hull_by_fleet.get(f"Player Fleet {i + 1}", 0.0)
+            damage_taken = damage_by_ship.get(row['attacker_ship'], 0.0)
             new_row["Hull Health Remaining"] = max(0, max_hull - damage_taken)
             new_row["Hull Health"] = max_hull  # Restore max health to the header
 
@@ -142,6 +160,21 @@ class FixPlayersDataframe:
         return self._align_players_columns(combined, self.players_df.columns)
 
 
+    def _hull_damage_by_ship(self) -> pd.Series:
+        """Return hull damage taken per target ship, from the ledger when the combat frame allows it."""
+        if self.ledger.complete:
+            return (
+                self.ledger.total_damage()
+                .query("ship != ''")
+                .groupby('ship')['hull_damage'].sum()
+            )
+        # Without shield_damage, round, or battle_event the ledger is empty;
+        # the hull column alone still gives each ship's total.
+        if not {'target_ship', 'hull_damage'}.issubset(self.combat_df.columns):
+            logger.warning("Hull damage skipped: combat df missing target_ship or hull_damage.")
+            return pd.Series(dtype=float)
+        return self.combat_df.groupby('target_ship')['hull_damage'].sum()
+
     def _augment_players_df( self) -> pd.DataFrame:
         """Augment player metadata with entries inferred from the combat log."""
         if len(self.players_df) > 1:
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import logging
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.core.CombatantRegistry import CombatantRegistry
+from stfc_parser.core.Outcome import Outcome
+
+logger = logging.getLogger(__name__)
+
+HEALTH_COLUMNS = {"shield": "Shield Health", "hull": "Hull Health"}
+DAMAGE_COLUMNS = {"shield": "shield_damage", "hull": "hull_damage"}
+
+
+class HealthLedger:
+    """
+    Track the shield and hull each combatant has left after every hit it takes.
+
+    Combat rows carrying shield or hull damage are grouped by target id once
+    (in (round, battle_event) order within each combatant), and the damage is
+    accumulated per combatant. Point queries binary-search a combatant's hits,
+    so "state of X at round r, event e" costs O(log n).
+
+    Starting health is seeded like the outcome lookup: each players row's
+    Hull Health/Shield Health, falling back to the fleets row at the same
+    position, keyed by (name, alliance, ship) and also by the alliances its
+    (name, ship) attacks under when the row has none. Remaining health is the
+    start minus damage taken, floored at 0, and NaN for unseeded combatants.
+    """
+
+    def __init__(
+        self,
+        combat_df: pd.DataFrame,
+        players_df: pd.DataFrame | None = None,
+        fleets_df: pd.DataFrame | None = None,
+        registry: CombatantRegistry | None = None,
+    ):
+        self.combat_df = combat_df
+        self.players_df = players_df
+        self.fleets_df = fleets_df
+        self.registry = registry if registry is not None else CombatantRegistry(combat_df)
+
+    @property
+    def complete(self) -> bool:
+        """Return True when the combat frame has every column the ledger reads."""
+        required = {"round", "battle_event", *DAMAGE_COLUMNS.values()}
+        return self.registry.ids("target") is not None and required.issubset(self.combat_df.columns)
+
+    @cached_property
+    def _ledger(self) -> dict[str, np.ndarray]:
+        df = self.combat_df
+        targets = self.registry.ids("target")
+        width = len(self.registry.specs)
+        if not self.complete:
+            logger.warning("Health ledger empty: combat df missing target, round, or damage columns.")
+            empty = np.empty(0)
+            return {
+                "bounds": np.zeros(width + 1, dtype=np.intp),
+                "rows": empty.astype(np.intp),
+                "time": empty.astype(np.int64),
+                "stride": np.int64(1),
+                "shield": empty,
+                "hull": empty,
+            }
+
+        damage = {
+            part: df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            for part, column in DAMAGE_COLUMNS.items()
+        }
+        rounds = df["round"].to_numpy(dtype=np.float64, na_value=np.nan)
+        events = df["battle_event"].to_numpy(dtype=np.float64, na_value=np.nan)
+        hits = (~np.isnan(damage["shield"]) | ~np.isnan(damage["hull"])) & ~np.isnan(rounds) & ~np.isnan(events)
+        rows = np.flatnonzero(hits)
+
+        stride = np.int64(events[rows].max() + 1) if rows.size else np.int64(1)
+        time = rounds[rows].astype(np.int64) * stride + events[rows].astype(np.int64)
+        order = np.lexsort((time, targets[rows]))
+        rows, time = rows[order], time[order]
+        ids = targets[rows]
+
+        ledger = {
+            "bounds": np.concatenate([[0], np.cumsum(np.bincount(ids, minlength=width))]),
+            "rows": rows,
+            "time": time,
+            "stride": stride,
+        }
+        for part, values in damage.items():
+            hits_damage = np.nan_to_num(values[rows], nan=0.0)
+            ledger[part] = pd.Series(hits_damage, copy=False).groupby(ids, sort=False).cumsum().to_numpy()
+        return ledger
+
+    @cached_property
+    def starting_health(self) -> dict[str, np.ndarray]:
+        """Return starting ``shield`` and ``hull`` per registry id; NaN where no row seeds it."""
+        width = len(self.registry.specs)
+        start = {part: np.full(width, np.nan) for part in HEALTH_COLUMNS}
+        players = self.players_df
+        if not isinstance(players, pd.DataFrame) or players.empty:
+            return start
+
+        fleets = self.fleets_df
+        aligned = isinstance(fleets, pd.DataFrame) and len(fleets) == len(players)
+        seeds = {}
+        for part, column in HEALTH_COLUMNS.items():
+            values = self._health_column(players, column)
+            if aligned:
+                values = np.where(np.isnan(values), self._health_column(fleets, column), values)
+            seeds[part] = values
+
+        by_key = Outcome.player_rows_by_spec_key(players, self.combat_df)
+        for combatant_id, spec in enumerate(self.registry.specs):
+            row = by_key.get(spec.normalized_key())
+            if row is not None:
+                for part in HEALTH_COLUMNS:
+                    start[part][combatant_id] = seeds[part][row]
+        return start
+
+    @staticmethod
+    def _health_column(df: pd.DataFrame, column: str) -> np.ndarray:
+        if column not in df.columns:
+            return np.full(len(df), np.nan)
+        return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def combatant_id(self, combatant: ShipSpecifier | int) -> int:
+        """Return the registry id of a specifier (or pass an id through)."""
+        if isinstance(combatant, ShipSpecifier):
+            combatant_id = self.registry.id_of(combatant.name, combatant.alliance, combatant.ship)
+            if combatant_id is None:
+                raise KeyError(f"{combatant!r} never appears in combat")
+            return combatant_id
+        if not 0 <= combatant < len(self.registry.specs):
+            raise KeyError(f"No combatant with id {combatant}")
+        return int(combatant)
+
+    def _hits_through(self, combatant_id: int, round: int | None, event: int | None) -> int:
+        """Return the ledger position just past the combatant's last hit at or before (round, event)."""
+        ledger = self._ledger
+        lo, hi = ledger["bounds"][combatant_id], ledger["bounds"][combatant_id + 1]
+        if round is None:
+            return hi
+        stride = ledger["stride"]
+        event = stride - 1 if event is None else min(event, stride - 1)
+        return lo + int(np.searchsorted(ledger["time"][lo:hi], round * stride + event, side="right"))
+
+    def damage_taken(
+        self,
+        combatant: ShipSpecifier | int,
+        round: int | None = None,
+        event: int | None = None,
+    ) -> tuple[float, float]:
+        """
+        Return the (shield, hull) damage a combatant has taken.
+
+        Counts hits up to and including battle_event ``event`` of round
+        ``round``; the whole round when ``event`` is None, the whole battle
+        when ``round`` is None.
+        """
+        combatant_id = self.combatant_id(combatant)
+        position = self._hits_through(combatant_id, round, event)
+        if position == self._ledger["bounds"][combatant_id]:
+            return 0.0, 0.0
+        return float(self._ledger["shield"][position - 1]), float(self._ledger["hull"][position - 1])
+
+    def state_at(
+        self,
+        combatant: ShipSpecifier | int,
+        round: int | None = None,
+        event: int | None = None,
+    ) -> tuple[float, float]:
+        """Return the (shield, hull) remaining at the same point as ``damage_taken``."""
+        combatant_id = self.combatant_id(combatant)
+        shield, hull = self.damage_taken(combatant_id, round, event)
+        start = self.starting_health
+        return (
+            float(np.maximum(start["shield"][combatant_id] - shield, 0.0)),
+            float(np.maximum(start["hull"][combatant_id] - hull, 0.0)),
+        )
+
+    def total_damage(self) -> pd.DataFrame:
+        """Return total shield and hull damage taken per registry id, with the combatant's fields."""
+        ledger = self._ledger
+        bounds = ledger["bounds"]
+        took_hits = np.diff(bounds) > 0
+        last = bounds[1:][took_hits] - 1
+        frame = self._spec_frame(np.arange(len(bounds) - 1))
+        for part, column in DAMAGE_COLUMNS.items():
+            totals = np.zeros(len(frame))
+            totals[took_hits] = ledger[part][last]
+            frame[column] = totals
+        return frame
+
+    def timeline(self) -> pd.DataFrame:
+        """
+        Return every hit in the ledger with the damage so far and health left.
+
+        Rows are grouped by combatant id and ordered by (round, battle_event)
+        within each; ``row`` is the combat frame position of the hit.
+        """
+        ledger = self._ledger
+        ids = np.repeat(np.arange(len(ledger["bounds"]) - 1), np.diff(ledger["bounds"]))
+        frame = self._spec_frame(ids)
+        frame["row"] = ledger["rows"]
+        frame["round"] = ledger["time"] // ledger["stride"]
+        frame["battle_event"] = ledger["time"] % ledger["stride"]
+        start = self.starting_health
+        for part, column in DAMAGE_COLUMNS.items():
+            frame[f"{part}_damage_taken"] = ledger[part]
+            frame[f"{part}_remaining"] = np.maximum(start[part][ids] - ledger[part], 0.0)
+        return frame
+
+    def _spec_frame(self, ids: np.ndarray) -> pd.DataFrame:
+        specs = self.registry.specs
+        frame = pd.DataFrame({"combatant_id": ids})
+        for field in CombatantRegistry.FIELDS:
+            labels = np.array([getattr(spec, field) for spec in specs], dtype=object)
+            frame[field] = labels[ids] if len(labels) else np.array([], dtype=object)
+        return frame
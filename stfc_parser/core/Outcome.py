@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import logging
+from typing import Callable, Iterable, Iterator
+
+import numpy as np
 import pandas as pd
 
 from stfc_parser.ShipSpecifier import ShipSpecifier
@@ -23,6 +26,22 @@ OUTCOME_SYNONYMS = {
 }
 UNKNOWN_OUTCOMES = {"UNKNOWN", "UNSURE", "N/A", "NA", "?", ""}
 
+PLAYER_ALLIANCE_COLUMNS = ("Alliance", "Player Alliance")
+ATTACKER_COLUMNS = ["attacker_name", "attacker_ship", "attacker_alliance"]
+
+
+def _normalize_distinct(values: pd.Series, normalize: Callable[[object], str]) -> np.ndarray:
+    """
+    Apply a scalar normalizer to every value by normalizing only the distinct ones.
+
+    Values are factorized once, ``normalize`` runs over the uniques, and the
+    codes take the results back to full length; nulls map to ``normalize(None)``.
+    """
+    codes, uniques = pd.factorize(values)
+    table = np.array([normalize(value) for value in uniques] + [normalize(None)], dtype=object)
+    return table[codes]
+
+
 class Outcome:
     def __init__(self, players_df: pd.DataFrame, combat_df: pd.DataFrame):
         self.players_df = players_df
@@ -30,101 +49,201 @@ class Outcome:
 
     def build_outcome_lookup(self) -> dict[tuple[str, str, str], object]:
         """Return a lookup of normalized ship specs to Outcome values."""
-        if not isinstance(self.players_df, pd.DataFrame) or self.players_df.empty:
-            logger.warning("Outcome lookup skipped: players_df missing or empty.")
-            return {}
-        if "Outcome" not in self.players_df.columns:
-            logger.warning("Outcome lookup skipped: 'Outcome' column missing.")
-            return {}
+        return self.build_outcome_lookups([(self.players_df, self.combat_df)])[0]
+
+    @classmethod
+    def build_outcome_lookups(
+        cls,
+        sessions: Iterable[tuple[pd.DataFrame, pd.DataFrame]],
+    ) -> list[dict[tuple[str, str, str], object]]:
+        """
+        Return one outcome lookup per (players_df, combat_df) pair.
+
+        Player rows from every session are stacked and normalized together, and
+        attacker alliances from every combat frame are grouped in one pass, so a
+        batch costs little more than its largest session.
+        """
+        sessions = list(sessions)
+        lookups: list[dict[tuple[str, str, str], object]] = [{} for _ in sessions]
+        frames = []
+        positions = []
+        for position, (players_df, _) in enumerate(sessions):
+            if not isinstance(players_df, pd.DataFrame) or players_df.empty:
+                logger.warning("Outcome lookup skipped: players_df missing or empty.")
+                continue
+            if "Outcome" not in players_df.columns:
+                logger.warning("Outcome lookup skipped: 'Outcome' column missing.")
+                continue
+            columns = [
+                column
+                for column in ("Player Name", "Ship Name", *PLAYER_ALLIANCE_COLUMNS, "Outcome")
+                if column in players_df.columns
+            ]
+            frames.append(players_df.loc[:, columns])
+            positions.append(position)
+        if not frames:
+            return lookups
+
+        attacker_alliances = cls._attacker_alliance_lookup(
+            {position: sessions[position][1] for position in positions}
+        )
+        players = pd.concat(frames, ignore_index=True)
+        sizes = np.array([len(frame) for frame in frames])
+        stops = np.cumsum(sizes)
+
+        name, alliance, ship = cls._player_key_columns(players)
+        normalized = _normalize_distinct(players["Outcome"], cls.normalize_outcome)
+        present = (name != "") | (ship != "") | (alliance != "")
+        determinate = np.isin(normalized, list(OUTCOME_ICONS))
+
+        # The NPC is the last players row of its session; everyone else gets the
+        # opposite of the NPC's outcome when they have none of their own.
+        npc_rows = stops - 1
+        npc_name = name[npc_rows]
+        npc_outcome = normalized[npc_rows]
+        inferred = np.array([cls.infer_player_outcome(label) or "" for label in npc_outcome], dtype=object)
+        row_npc_name = np.repeat(npc_name, sizes)
+        fallback = np.where(name == row_npc_name, np.repeat(npc_outcome, sizes), np.repeat(inferred, sizes))
+        known = (npc_name != "") & (npc_outcome != "")
+        fallback = np.where(np.repeat(known, sizes), fallback, "")
+
+        keys = list(zip(name, alliance, ship))
+        outcomes = [
+            outcome if is_determinate else None
+            for outcome, is_determinate in zip(players["Outcome"].tolist(), determinate)
+        ]
+        fallbacks = fallback.tolist()
+        present = present.tolist()
+        for position, stop, size, npc, label in zip(positions, stops, sizes, npc_name, npc_outcome):
+            if npc and not label:
+                logger.warning("NPC outcome missing for %s in players_df.", npc)
+            rows = slice(stop - size, stop)
+            lookups[position] = cls._assemble_lookup(
+                keys[rows],
+                outcomes[rows],
+                fallbacks[rows],
+                present[rows],
+                attacker_alliances.get(position, {}),
+            )
+        return lookups
+
+    @classmethod
+    def _assemble_lookup(
+        cls,
+        keys: list[tuple[str, str, str]],
+        outcomes: list[object],
+        fallbacks: list[str],
+        present: list[bool],
+        attacker_alliances: dict[tuple[str, str], set[str]],
+    ) -> dict[tuple[str, str, str], object]:
+        """Fill one session's lookup from its rows' keys, determinate outcomes, and fallbacks."""
         outcome_lookup: dict[tuple[str, str, str], object] = {}
-        attacker_alliances = self._attacker_alliance_lookup()
-        npc_row = self.players_df.iloc[-1]
-        npc_name = self.normalize_text(npc_row.get("Player Name"))
-        npc_outcome = npc_row.get("Outcome")
-        normalized_npc_outcome = self.normalize_outcome(npc_outcome)
-        inferred_player_outcome = self.infer_player_outcome(normalized_npc_outcome)
-        if npc_name and not normalized_npc_outcome:
-            logger.warning("NPC outcome missing for %s in players_df.", npc_name)
         #
         # Test 1 - look to see if this combatant has a victory/defeat entry
         #
-        for _, row in self.players_df.iterrows():
-            name = self.normalize_text(row.get("Player Name"))
-            ship = self.normalize_text(row.get("Ship Name"))
-            alliance = self._resolve_player_alliance(row)
-            if not any([name, ship, alliance]):
-                continue
-            key = self.normalize_spec_key(name, alliance, ship)
-            normalized_outcome = self.normalize_outcome(row.get("Outcome"))
-            if not self.is_determinate_outcome(normalized_outcome):
+        for key, outcome, is_present in zip(keys, outcomes, present):
+            if not is_present or outcome is None:
                 continue
-            if key not in outcome_lookup:
-                outcome_lookup[key] = row.get("Outcome")
-            if not alliance:
-                for inferred_alliance in attacker_alliances.get((name, ship), set()):
-                    derived_key = self.normalize_spec_key(name, inferred_alliance, ship)
-                    if derived_key not in outcome_lookup:
-                        outcome_lookup[derived_key] = row.get("Outcome")
+            for spec_key in cls._spec_keys(key, attacker_alliances):
+                outcome_lookup.setdefault(spec_key, outcome)
         #
         # Test 2 - the NPC should ALWAYS be in this players_df and should always have an outcome
         #
-        if npc_name and normalized_npc_outcome:
-            for _, row in self.players_df.iterrows():
-                name = self.normalize_text(row.get("Player Name"))
-                ship = self.normalize_text(row.get("Ship Name"))
-                alliance = self._resolve_player_alliance(row)
-                if not any([name, ship, alliance]):
-                    continue
-                key = self.normalize_spec_key(name, alliance, ship)
-                if key in outcome_lookup:
-                    continue
-                if name == npc_name:
-                    outcome_lookup[key] = normalized_npc_outcome
-                elif inferred_player_outcome:
-                    outcome_lookup[key] = inferred_player_outcome
-                if not alliance:
-                    for inferred_alliance in attacker_alliances.get((name, ship), set()):
-                        derived_key = self.normalize_spec_key(name, inferred_alliance, ship)
-                        if derived_key in outcome_lookup:
-                            continue
-                        if name == npc_name:
-                            outcome_lookup[derived_key] = normalized_npc_outcome
-                        elif inferred_player_outcome:
-                            outcome_lookup[derived_key] = inferred_player_outcome
+        for key, fallback, is_present in zip(keys, fallbacks, present):
+            if not is_present or not fallback or key in outcome_lookup:
+                continue
+            for spec_key in cls._spec_keys(key, attacker_alliances):
+                outcome_lookup.setdefault(spec_key, fallback)
         #
         # Test 3 - The battle_df should have a row with Type="Combatant Destroyed" and Attacker Name==the loser's name
 
         #
         return outcome_lookup
 
-    def _attacker_alliance_lookup(self) -> dict[tuple[str, str], set[str]]:
-        """Return attacker alliance values keyed by (name, ship)."""
-        df = self.combat_df
-        required_columns = {"attacker_name", "attacker_ship", "attacker_alliance"}
-        if not required_columns.issubset(df.columns):
-            missing = required_columns - set(df.columns)
-            logger.warning("Combat df missing attacker columns for alliances: %s", sorted(missing))
+    @staticmethod
+    def _spec_keys(
+        key: tuple[str, str, str],
+        attacker_alliances: dict[tuple[str, str], set[str]],
+    ) -> Iterator[tuple[str, str, str]]:
+        """Yield a row's key, then one per alliance seen in combat when the row has none."""
+        yield key
+        name, alliance, ship = key
+        if not alliance:
+            for inferred_alliance in attacker_alliances.get((name, ship), set()):
+                yield name, inferred_alliance, ship
+
+    @classmethod
+    def _attacker_alliance_lookup(
+        cls,
+        combat_frames: dict[int, pd.DataFrame],
+    ) -> dict[int, dict[tuple[str, str], set[str]]]:
+        """Return attacker alliance values keyed by session, then (name, ship)."""
+        frames = []
+        positions = []
+        for position, df in combat_frames.items():
+            if not set(ATTACKER_COLUMNS).issubset(df.columns):
+                missing = set(ATTACKER_COLUMNS) - set(df.columns)
+                logger.warning("Combat df missing attacker columns for alliances: %s", sorted(missing))
+                continue
+            # One hash pass groups the rows into distinct attacker triples;
+            # only those few are normalized below.
+            triples = df.loc[:, ATTACKER_COLUMNS].drop_duplicates()
+            frames.append(triples)
+            positions.extend([position] * len(triples))
+        if not frames:
             return {}
 
-        # Select and copy the data
-        subset = df.loc[:, ["attacker_name", "attacker_ship", "attacker_alliance"]].copy()
+        subset = pd.concat(frames, ignore_index=True)
+        name, ship, alliance = (cls._normalized_column(subset, column) for column in ATTACKER_COLUMNS)
+        lookup: dict[int, dict[tuple[str, str], set[str]]] = {}
+        for position, *key, value in zip(positions, name, ship, alliance):
+            if key[0] and key[1] and value:
+                lookup.setdefault(position, {}).setdefault(tuple(key), set()).add(value)
+        return lookup
+
+    @classmethod
+    def player_keys(cls, players_df: pd.DataFrame) -> list[tuple[str, str, str]]:
+        """Return the normalized (name, alliance, ship) key of every players row."""
+        return list(zip(*cls._player_key_columns(players_df)))
 
-        # 1. Convert everything to a stripped string, handling NaNs manually
-        # This avoids the internal .astype() 'concat' bug
-        subset = subset.map(lambda x: str(x).strip() if pd.notna(x) else "")
+    @classmethod
+    def player_rows_by_spec_key(
+        cls,
+        players_df: pd.DataFrame,
+        combat_df: pd.DataFrame,
+    ) -> dict[tuple[str, str, str], int]:
+        """
+        Return the positional players row each normalized spec key belongs to.
 
-        # 2. Filter out the empty strings
-        subset = subset[
-            (subset["attacker_name"] != "")
-            & (subset["attacker_ship"] != "")
-            & (subset["attacker_alliance"] != "")
-            ]
-        grouped = (
-            subset.groupby(["attacker_name", "attacker_ship"])["attacker_alliance"]
-            .agg(lambda values: set(values))
-            .to_dict()
-        )
-        return {key: set(values) for key, values in grouped.items()}
+        Rows without an alliance also claim one key per alliance their
+        (name, ship) attacked under in combat; the first row to claim a key keeps it.
+        """
+        alliances = cls._attacker_alliance_lookup({0: combat_df}).get(0, {})
+        rows: dict[tuple[str, str, str], int] = {}
+        for row, key in enumerate(cls.player_keys(players_df)):
+            if not any(key):
+                continue
+            for spec_key in cls._spec_keys(key, alliances):
+                rows.setdefault(spec_key, row)
+        return rows
+
+    @classmethod
+    def _player_key_columns(cls, players_df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return normalized name, alliance, and ship arrays for the players rows."""
+        name = cls._normalized_column(players_df, "Player Name")
+        ship = cls._normalized_column(players_df, "Ship Name")
+        alliance = np.full(len(players_df), "", dtype=object)
+        for column in reversed(PLAYER_ALLIANCE_COLUMNS):
+            value = cls._normalized_column(players_df, column)
+            alliance = np.where(value != "", value, alliance)
+        return name, alliance, ship
+
+    @classmethod
+    def _normalized_column(cls, df: pd.DataFrame, column: str) -> np.ndarray:
+        """Return a column as normalized text, or all empty when the frame lacks it."""
+        if column not in df.columns:
+            return np.full(len(df), "", dtype=object)
+        return _normalize_distinct(df[column], cls.normalize_text)
 
     @classmethod
     def normalize_spec_key(
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import functools
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass
+class QueryStats:
+    """Running counters for one memoized query method."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+def _detached(value: Any) -> Any:
+    """Return a copy of mutable containers so callers cannot edit a cached result."""
+    if isinstance(value, (set, dict, list)):
+        return value.copy()
+    if isinstance(value, tuple):
+        return tuple(_detached(item) for item in value)
+    return value
+
+
+class QueryCache:
+    """
+    Memoize query results for one immutable session, per method and arguments.
+
+    Each method keeps its own LRU of at most ``maxsize`` argument tuples, with
+    hit/miss/store/eviction counters. Calls with unhashable arguments are
+    computed every time and counted as misses.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, OrderedDict[tuple[Any, ...], Any]] = {}
+        self._stats: dict[str, QueryStats] = {}
+
+    def lookup(
+        self, name: str, key: tuple[Any, ...], compute: Callable[[], Any], maxsize: int | None
+    ) -> Any:
+        """Return the cached result for ``name`` and ``key``, computing it on a miss."""
+        entries = self._entries.setdefault(name, OrderedDict())
+        stats = self._stats.setdefault(name, QueryStats())
+        try:
+            hash(key)
+        except TypeError:
+            stats.misses += 1
+            return compute()
+        if key in entries:
+            entries.move_to_end(key)
+            stats.hits += 1
+            return entries[key]
+        stats.misses += 1
+        value = compute()
+        entries[key] = value
+        stats.stores += 1
+        if maxsize is not None and len(entries) > maxsize:
+            entries.popitem(last=False)
+            stats.evictions += 1
+        return value
+
+    def stats(self) -> dict[str, QueryStats]:
+        """Return a snapshot of the counters for every method called so far."""
+        return {name: replace(stats) for name, stats in self._stats.items()}
+
+    def totals(self) -> QueryStats:
+        """Return the counters summed over all methods."""
+        totals = QueryStats()
+        for stats in self._stats.values():
+            totals.hits += stats.hits
+            totals.misses += stats.misses
+            totals.stores += stats.stores
+            totals.evictions += stats.evictions
+        return totals
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        self._entries.clear()
+        self._stats.clear()
+
+
+def memoized_query(maxsize: int | None = 128) -> Callable[[F], F]:
+    """
+    Cache a query method's results in its instance's ``query_cache``.
+
+    Positional and keyword arguments form the key; ``maxsize`` bounds the
+    entries kept per method (None for unbounded). Sets, dicts, and lists are
+    returned as copies.
+    """
+
+    def decorate(method: F) -> F:
+        name = method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            key = args + tuple(sorted(kwargs.items())) if kwargs else args
+            value = self.query_cache.lookup(
+                name, key, lambda: method(self, *args, **kwargs), maxsize
+            )
+            return _detached(value)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
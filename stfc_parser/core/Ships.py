@@ -1,53 +1,44 @@
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 
 import pandas as pd
 
 from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.core.CombatantRegistry import CombatantRegistry
+
 logger = logging.getLogger(__name__)
 
 
 class Ships:
 
-    def __init__(self, combat_df: pd.DataFrame):
+    def __init__(self, combat_df: pd.DataFrame, registry: CombatantRegistry | None = None):
         # self.players_df = players_df
         self.combat_df = combat_df
+        self.registry = registry if registry is not None else CombatantRegistry(combat_df)
 
     def get_every_ship(self) -> set[ShipSpecifier]:
         """Return unique attacker combinations across the combat log."""
-        df = self.combat_df
-        cols = ["attacker_name", "attacker_alliance", "attacker_ship"]
-        missing = [column for column in cols if column not in df.columns]
-        if missing:
-            logger.warning(
-                "Combat df missing attacker columns for ship roster: %s",
-                missing,
-            )
+        if self.registry.ids("attacker") is None:
+            logger.warning("Combat df missing attacker columns for ship roster.")
             return set()
-
-        # Select your columns first
-        unique_combos_df = df.loc[:, cols].dropna(how="all")
-
-        # Convert to string without rebuilding the whole DataFrame index/attrs tree
-        # Using 'map' or 'applymap' is often safer in experimental Python versions
-        unique_combos_df = unique_combos_df.map(lambda x: "" if x is None or pd.isna(x) else str(x))
-
-        # Clean up duplicates
-        unique_combos_df = unique_combos_df.drop_duplicates().reset_index(drop=True)
-
+        # Rows with no attacker at all share the all-empty combatant; skip it.
         return {
-            ShipSpecifier(
-                name=row["attacker_name"],
-                alliance=row["attacker_alliance"],
-                ship=row["attacker_ship"],
-            )
-            for row in unique_combos_df.to_dict(orient="records")
+            spec
+            for spec in self.registry.role_specs("attacker")
+            if spec.name or spec.alliance or spec.ship
         }
 
-    def get_ships(self, combatant_name: str) -> set[str]:
-        """Return all ships used by a combatant in attack events."""
+    @cached_property
+    def _attack_events(self) -> pd.DataFrame:
+        """Attack rows of the combat frame, selected once."""
         df = self.combat_df
         event_type = df["event_type"].astype(str).str.lower()
-        mask = (event_type == "attack") & (df["attacker_name"] == combatant_name)
+        return df.loc[event_type == "attack", ["attacker_name", "attacker_ship"]]
+
+    def get_ships(self, combatant_name: str) -> set[str]:
+        """Return all ships used by a combatant in attack events."""
+        df = self._attack_events
+        mask = df["attacker_name"] == combatant_name
         return set(df.loc[mask, "attacker_ship"].dropna().astype(str).unique())
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import logging
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.core.CombatantRegistry import CombatantRegistry
+from stfc_parser.core.Outcome import Outcome
+from stfc_parser.frames import shallow_copy
+
+logger = logging.getLogger(__name__)
+
+NO_TEAM = 0
+TEAM_ONE = 1
+TEAM_TWO = 2
+TEAMS = (NO_TEAM, TEAM_ONE, TEAM_TWO)
+
+
+class TeamMembership:
+    """
+    Tag every combat row with the team of its attacker and of its target.
+
+    Team two is the last players row and team one every other row, as in
+    ``teams.get_teams_from_players_df``. A players row without an alliance also
+    claims each alliance its (name, ship) attacks under in combat, as in the
+    outcome lookup. Teams are resolved once per registry combatant and reach
+    the rows through the combatant ids; combatants no players row claims are
+    NO_TEAM.
+    """
+
+    TEAM_COLUMNS = {"attacker": "attacker_team", "target": "target_team"}
+
+    def __init__(
+        self,
+        players_df: pd.DataFrame,
+        combat_df: pd.DataFrame,
+        registry: CombatantRegistry | None = None,
+    ):
+        self.players_df = players_df
+        self.combat_df = combat_df
+        self.registry = registry if registry is not None else CombatantRegistry(combat_df)
+
+    @cached_property
+    def team_by_key(self) -> dict[tuple[str, str, str], int]:
+        """Return team codes keyed by normalized (name, alliance, ship)."""
+        df = self.players_df
+        if not isinstance(df, pd.DataFrame) or df.empty:
+            logger.warning("Team membership skipped: players_df missing or empty.")
+            return {}
+        last = len(df) - 1
+        return {
+            spec_key: TEAM_TWO if row == last else TEAM_ONE
+            for spec_key, row in Outcome.player_rows_by_spec_key(df, self.combat_df).items()
+        }
+
+    @cached_property
+    def combatant_teams(self) -> np.ndarray:
+        """Return the team code of every registry combatant, indexed by id."""
+        teams = self.team_by_key
+        return np.array(
+            [teams.get(spec.normalized_key(), NO_TEAM) for spec in self.registry.specs],
+            dtype=np.int8,
+        )
+
+    @cached_property
+    def _team_codes(self) -> dict[str, np.ndarray]:
+        codes = {}
+        for role in self.TEAM_COLUMNS:
+            ids = self.registry.ids(role)
+            if ids is not None:
+                codes[role] = self.combatant_teams[ids]
+        return codes
+
+    def team_codes(self, role: str) -> np.ndarray | None:
+        """Return the per-row team codes for a role, or None if its columns are missing."""
+        return self._team_codes.get(role)
+
+    def members(self, team: int) -> list[ShipSpecifier]:
+        """Return the combatants of a team seen in combat, in registry order."""
+        return [spec for spec, code in zip(self.registry.specs, self.combatant_teams) if code == team]
+
+    @cached_property
+    def team_combat_df(self) -> pd.DataFrame:
+        """Return the combat frame with ``attacker_team``/``target_team`` columns appended."""
+        tagged = shallow_copy(self.combat_df)
+        for role, codes in self._team_codes.items():
+            tagged[self.TEAM_COLUMNS[role]] = codes
+        return tagged
+
+    def damage_by_round(self, column: str = "applied_damage") -> pd.DataFrame:
+        """
+        Return damage dealt and received per round and team.
+
+        The frame is indexed by (round, team) for every round and every team
+        code, with ``dealt`` summed over attacker teams and ``received`` over
+        target teams. Missing damage counts as zero.
+        """
+        df = self.combat_df
+        attacker = self.team_codes("attacker")
+        target = self.team_codes("target")
+        if attacker is None or target is None or not {"round", column}.issubset(df.columns):
+            logger.warning("Team damage skipped: combat df missing round, %s, or combatant columns.", column)
+            return pd.DataFrame(
+                {"dealt": [], "received": []},
+                index=pd.MultiIndex.from_arrays([[], []], names=["round", "team"]),
+            )
+
+        rounds, round_values = pd.factorize(df["round"], sort=True)
+        damage = df[column].to_numpy(dtype=np.float64, na_value=0.0)
+        counted = rounds >= 0
+        size = len(round_values) * len(TEAMS)
+        slots = rounds[counted] * len(TEAMS)
+        weights = damage[counted]
+        return pd.DataFrame(
+            {
+                "dealt": np.bincount(slots + attacker[counted], weights=weights, minlength=size),
+                "received": np.bincount(slots + target[counted], weights=weights, minlength=size),
+            },
+            index=pd.MultiIndex.from_product([round_values, TEAMS], names=["round", "team"]),
+        )
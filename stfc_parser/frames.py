@@ -0,0 +1,23 @@
+"""Frame copies that share buffers only where pandas copy-on-write keeps them independent."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+
+def copy_on_write_enabled() -> bool:
+    """Return True when pandas copy-on-write is active: always from pandas 3.0, opt-in on 2.x."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
+def shallow_copy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a copy of ``df`` for replacing or adding whole columns.
+
+    Under copy-on-write the copy shares the original's buffers; without it (the
+    pandas 2.x default) a write into the copy could reach the original, so the
+    copy is deep.
+    """
+    return df.copy(deep=not copy_on_write_enabled())
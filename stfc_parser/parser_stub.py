@@ -3,45 +3,131 @@
 from __future__ import annotations
 
 import logging
+import os
+from dataclasses import replace
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
 from stfc_parser.BattleSectionParser import BattleSectionParser
 from stfc_parser.FleetSectionParser import FleetSectionParser
+from stfc_parser.LazyParsedBattle import LazyParsedBattle
 from stfc_parser.LootSectionParser import LootSectionParser
+from stfc_parser.ParsedBattle import ParsedBattle
 from stfc_parser.PlayerSectionParser import PlayerSectionParser
 from stfc_parser.SessionInfo import SessionInfo
+from stfc_parser.StartsWhen import map_file, unmap_file
+from stfc_parser.compact import compact_combat_df
+
+if TYPE_CHECKING:
+    from stfc_parser.cache import ParseCache
 
 logger = logging.getLogger(__name__)
 
 
-def parse_battle_log(file_bytes: bytes, filename: str) -> pd.DataFrame:
+def parse_battle(
+    file_bytes: bytes | memoryview,
+    filename: str,
+    *,
+    cache: ParseCache | None = None,
+    lazy: bool = False,
+    engine: str = "c",
+    compact: bool = False,
+    workers: int | None = 1,
+) -> ParsedBattle | LazyParsedBattle:
+    """Parse a battle log export into its validated combat, players, fleets, and loot frames.
+
+    When a ``cache`` is given, a previously stored result for identical bytes is
+    returned without parsing; a miss is parsed with the given options and
+    stored. With ``lazy=True`` a LazyParsedBattle is returned and each section
+    is parsed on first access; it cannot be combined with a ``cache``, which
+    stores fully parsed battles. ``engine`` selects the section
+    reader: ``"c"`` (default), ``"pyarrow"``, or ``"auto"``; see ``resolve_engine``.
+    ``compact=True`` returns the combat frame with the compact dtypes from
+    ``compact_combat_df``. ``workers`` above 1 (``None`` for the CPU count)
+    parses a large combat section in pieces across that many processes.
+    """
+    if cache is not None:
+        if lazy:
+            raise ValueError("parse_battle cannot combine lazy=True with a cache")
+        return cache.parse(file_bytes, filename, engine=engine, compact=compact, workers=workers)
+    if lazy:
+        return LazyParsedBattle(file_bytes, engine=engine, compact=compact, workers=workers)
+    del filename
+    parser = BattleSectionParser(file_bytes, engine=engine, workers=workers)
+    df, sections = parser._parse_with_index()
+    psp = PlayerSectionParser(sections.get("players"), df, engine=engine)
+    validated_players_df = psp.parse()
+    validated_fleets_df = FleetSectionParser(sections.get("fleets"), engine=engine).parse()
+    validated_loot_df = LootSectionParser(sections.get("rewards"), engine=engine).parse()
+    validated_players_df = psp.repair(validated_players_df, df, validated_fleets_df)
+    if compact:
+        df = compact_combat_df(df)
+    return ParsedBattle(
+        combat_df=df,
+        players_df=validated_players_df,
+        fleets_df=validated_fleets_df,
+        loot_df=validated_loot_df,
+        raw_combat=parser.raw_reader(sections),
+    )
+
+
+def parse_battle_file(
+    path: str | os.PathLike[str], **kwargs
+) -> ParsedBattle | LazyParsedBattle:
+    """
+    Parse a battle log export straight from disk through a memory map.
+
+    Takes the same keyword arguments as ``parse_battle``. Sections are located
+    and read from the mapped file, so no full in-memory copy of it is made.
+    An eager parse unmaps the file before returning, and its raw combat frame
+    is read back from ``path`` on first access. A lazy battle reads from
+    the mapping, so the file stays mapped (and, on Windows, locked) until the
+    battle is garbage collected; use ``parse_battle(path.read_bytes(), ...)``
+    when that matters.
+    """
+    view = map_file(path)
+    try:
+        battle = parse_battle(view, Path(path).name, **kwargs)
+        if not kwargs.get("lazy"):
+            raw_combat = partial(
+                BattleSectionParser.read_raw_file, os.fspath(path), engine=kwargs.get("engine", "c")
+            )
+            battle = replace(battle, raw_combat=raw_combat)
+        return battle
+    finally:
+        if not kwargs.get("lazy"):
+            unmap_file(view)
+
+
+def parse_battle_log(
+    file_bytes: bytes,
+    filename: str,
+    *,
+    cache: ParseCache | None = None,
+    engine: str = "c",
+    compact: bool = False,
+    workers: int | None = 1,
+) -> pd.DataFrame:
     """
     Should return a pandas DataFrame with at least:
       - 'mitigated_apex'
       - 'total_normal'
+
+    Compatibility shim: the players, fleets, loot, and raw combat frames ride
+    along in ``attrs``. Prefer ``parse_battle``, which keeps them separate.
     """
-    del filename
-    df, raw_df, sections = BattleSectionParser(file_bytes).parse_with_sections()
-    psp = PlayerSectionParser(sections.get("players"), df)
-    validated_players_df = psp.parse()
-    validated_fleets_df = FleetSectionParser(sections.get("fleets")).parse()
-    validated_loot_df = LootSectionParser(sections.get("rewards")).parse()
-    validated_players_df = psp.repair(validated_players_df, df, validated_fleets_df)
-    df.attrs.update(
-        {
-            "players_df": validated_players_df,
-            "fleets_df": validated_fleets_df,
-            "loot_df": validated_loot_df,
-            "raw_combat_df": raw_df,
-        }
+    battle = parse_battle(
+        file_bytes, filename, cache=cache, engine=engine, compact=compact, workers=workers
     )
-    return df
+    return battle.to_combat_df()
 
 def parse_filename_to_session_info(filename:str) -> SessionInfo:
     file_bytes = filename.read_bytes()
-    df = parse_battle_log(file_bytes, filename)
-    session_info = SessionInfo(df)
+    battle = parse_battle(file_bytes, filename)
+    session_info = SessionInfo(battle)
     return session_info
 
 
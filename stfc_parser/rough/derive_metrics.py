@@ -7,6 +7,8 @@ import pandas as pd
 
 from typing import Iterable
 
+from stfc_parser.frames import shallow_copy
+
 ATTACKER_COLUMN_CANDIDATES = ("attacker_name", "Attacker")
 TARGET_COLUMN_CANDIDATES = ("target_name", "Target", "Defender Name")
 
@@ -27,13 +29,32 @@ def coerce_numeric(series: pd.Series) -> pd.Series:
     cleaned = series.astype(str).str.replace(",", "", regex=False).str.strip()
     return pd.to_numeric(cleaned, errors="coerce")
 
-def add_shot_index(df: pd.DataFrame) -> pd.DataFrame:
+def _continue_shot_counts(
+    shots: pd.DataFrame, numbers: pd.Series, shot_counts: dict[tuple[object, ...], int]
+) -> pd.Series:
+    """Offset per-pair shot numbers by earlier counts and record the new totals."""
+    keys = list(
+        zip(*(shots[column].astype(object).where(shots[column].notna(), None) for column in shots))
+    )
+    offsets = np.fromiter((shot_counts.get(key, 0) for key in keys), dtype=np.int64, count=len(keys))
+    continued = numbers + offsets
+    # Later rows of a pair carry its highest number, so they win the update.
+    shot_counts.update(zip(keys, continued.tolist()))
+    return continued
+
+
+def add_shot_index(
+    df: pd.DataFrame, shot_counts: dict[tuple[object, ...], int] | None = None
+) -> pd.DataFrame:
     """
     Add shot_index for damage events only (Attack rows with total_normal > 0).
     Non-damage rows get NA.
+
+    When ``shot_counts`` is given, numbering continues from the per
+    (attacker, target) counts it holds and the dict is updated in place, so
+    consecutive chunks of one log are numbered exactly as the whole log would be.
     """
-    updated = df.copy()
-    updated.attrs = df.attrs.copy()
+    updated = shallow_copy(df)
 
     typ = updated["event_type"].astype(str).str.strip().str.lower()
     total_damage = coerce_numeric(get_series(updated, "total_normal"))
@@ -52,15 +73,50 @@ def add_shot_index(df: pd.DataFrame) -> pd.DataFrame:
     attacker_column = resolve_column(updated, ATTACKER_COLUMN_CANDIDATES)
     target_column = resolve_column(updated, TARGET_COLUMN_CANDIDATES)
     if attacker_column and target_column:
-        shot_counts = (
-            updated.loc[is_shot]
-            .groupby([attacker_column, target_column], dropna=False)
-            .cumcount()
-            .add(1)
-        )
-        shot_index.loc[is_shot] = shot_counts.astype("Int64")
+        shots = updated.loc[is_shot, [attacker_column, target_column]]
+        numbers = shots.groupby([attacker_column, target_column], dropna=False).cumcount().add(1)
+        if shot_counts is not None:
+            numbers = _continue_shot_counts(shots, numbers, shot_counts)
+        shot_index.loc[is_shot] = numbers.astype("Int64")
     else:
-        shot_index.loc[is_shot] = np.arange(1, int(is_shot.sum()) + 1, dtype=np.int64)
+        start = 0 if shot_counts is None else shot_counts.get((None, None), 0)
+        count = int(is_shot.sum())
+        shot_index.loc[is_shot] = np.arange(start + 1, start + count + 1, dtype=np.int64)
+        if shot_counts is not None:
+            shot_counts[(None, None)] = start + count
 
     updated["shot_index"] = shot_index
     return updated
+
+
+def continue_shot_index(
+    df: pd.DataFrame, shot_counts: dict[tuple[object, ...], int]
+) -> pd.DataFrame:
+    """
+    Renumber an existing shot_index so it continues from ``shot_counts``.
+
+    For frames numbered independently by ``add_shot_index`` (e.g. chunks of one
+    log parsed in separate processes); feeding the chunks through in log order
+    reproduces the numbering of the whole log. ``shot_counts`` is updated in place.
+    """
+    shot_index = df["shot_index"]
+    is_shot = shot_index.notna()
+    first_chunk = not shot_counts
+    numbers = shot_index.loc[is_shot].astype(np.int64)
+    attacker_column = resolve_column(df, ATTACKER_COLUMN_CANDIDATES)
+    target_column = resolve_column(df, TARGET_COLUMN_CANDIDATES)
+    if attacker_column and target_column:
+        shots = df.loc[is_shot, [attacker_column, target_column]]
+        continued = _continue_shot_counts(shots, numbers, shot_counts)
+    else:
+        start = shot_counts.get((None, None), 0)
+        continued = numbers + start
+        shot_counts[(None, None)] = start + int(is_shot.sum())
+    if first_chunk:
+        return df  # no earlier counts, so the numbering already stands
+
+    renumbered = shot_index.copy()
+    renumbered.loc[is_shot] = continued.astype(shot_index.dtype)
+    updated = shallow_copy(df)
+    updated["shot_index"] = renumbered
+    return updated
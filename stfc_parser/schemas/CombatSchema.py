@@ -128,6 +128,28 @@ COMBAT_COLUMN_ORDER: ClassVar[list[str]] = [
     "target_destroyed",
 ]
 
+# Compact mode (see stfc_parser.compact): identity columns share one category set,
+# the other low-cardinality text columns get their own, and counters are narrowed.
+# Damage columns stay float64 so values above 1e15 keep full precision.
+COMBAT_IDENTITY_COLUMNS: ClassVar[tuple[str, ...]] = (
+    "attacker_name",
+    "attacker_ship",
+    "attacker_alliance",
+    "target_name",
+    "target_ship",
+    "target_alliance",
+    "ability_owner_name",
+)
+COMBAT_CATEGORY_COLUMNS: ClassVar[tuple[str, ...]] = (
+    "event_type",
+    "ability_type",
+    "ability_name",
+    "target_defeated",
+    "target_destroyed",
+)
+COMBAT_COUNTER_COLUMNS: ClassVar[tuple[str, ...]] = ("round", "battle_event", "shot_index")
+COMBAT_FLAG_COLUMNS: ClassVar[tuple[str, ...]] = ("is_crit", "attacker_is_armada", "target_is_armada")
+
 # CombatSchema.COLUMN_RENAMES = COMBAT_COLUMN_RENAMES
 # CombatSchema.COLUMN_ALIASES = COMBAT_COLUMN_ALIASES
 # CombatSchema.COLUMN_ORDER = COMBAT_COLUMN_ORDER
@@ -0,0 +1,102 @@
+"""Precompiled per-schema normalization plans."""
+
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+import pandas as pd
+import pandera.pandas as pa
+from pandera.api.pandas.model import DataFrameModel
+
+
+@dataclass(frozen=True)
+class SchemaPlan:
+    """
+    Everything needed to normalize a dataframe for one schema, computed once.
+
+    Holds the column renames, aliases, and order declared next to the schema,
+    plus the compiled pandera schema, its target dtypes, and required columns.
+    ``apply`` renames, aliases, and reorders in a single pass without copying
+    column data.
+    """
+
+    schema: type[DataFrameModel]
+    schema_obj: pa.DataFrameSchema
+    renames: dict[str, str]
+    aliases: dict[str, str]
+    order: tuple[str, ...]
+    dtypes: dict[str, Any]
+    required: tuple[str, ...]
+    _layouts: dict[tuple[Any, ...], tuple[list[Any], list[tuple[str, str]], list[Any]]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @classmethod
+    def compile(cls, schema: type[DataFrameModel]) -> "SchemaPlan":
+        """
+        Look for module-level constants next to the schema class:
+          <PREFIX>_COLUMN_RENAMES
+          <PREFIX>_COLUMN_ALIASES
+          <PREFIX>_COLUMN_ORDER
+        Where PREFIX is the schema class name uppercased (e.g., CombatSchema -> COMBAT).
+        Falls back to empty values.
+        """
+        mod = importlib.import_module(schema.__module__)
+        prefix = schema.__name__.removesuffix("Schema").upper()  # CombatSchema -> COMBAT
+        schema_obj = schema.to_schema()
+        return cls(
+            schema=schema,
+            schema_obj=schema_obj,
+            renames=dict(getattr(mod, f"{prefix}_COLUMN_RENAMES", {}) or {}),
+            aliases=dict(getattr(mod, f"{prefix}_COLUMN_ALIASES", {}) or {}),
+            order=tuple(getattr(mod, f"{prefix}_COLUMN_ORDER", []) or []),
+            dtypes={name: column.dtype for name, column in schema_obj.columns.items()},
+            required=tuple(
+                name for name, column in schema_obj.columns.items() if column.required
+            ),
+        )
+
+    def missing_required(self, columns: pd.Index) -> list[str]:
+        """Return required schema columns absent from ``columns``."""
+        present = set(columns)
+        return [name for name in self.required if name not in present]
+
+    def _layout(
+        self, columns: pd.Index
+    ) -> tuple[list[Any], list[tuple[str, str]], list[Any]]:
+        key = tuple(columns)
+        layout = self._layouts.get(key)
+        if layout is None:
+            renamed = [self.renames.get(column, column) for column in key]
+            present = set(renamed)
+            aliases = []
+            for alias, source in self.aliases.items():
+                if alias not in present and source in present:
+                    aliases.append((alias, source))
+                    present.add(alias)
+            candidates = renamed + [alias for alias, _ in aliases]
+            ordered = [column for column in self.order if column in present]
+            ordered_set = set(ordered)
+            extras = [column for column in candidates if column not in ordered_set]
+            layout = (renamed, aliases, ordered + extras)
+            self._layouts[key] = layout
+        return layout
+
+    def apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply schema column renames, aliases, and ordering."""
+        renamed, aliases, final = self._layout(df.columns)
+        updated = df.set_axis(renamed, axis=1)
+        for alias, source in aliases:
+            updated[alias] = updated[source]
+        if list(updated.columns) != final:
+            updated = updated[final]
+        return updated
+
+
+@cache
+def get_schema_plan(schema: type[DataFrameModel]) -> SchemaPlan:
+    """Return the cached SchemaPlan for a schema class."""
+    return SchemaPlan.compile(schema)
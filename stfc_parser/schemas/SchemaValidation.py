@@ -7,6 +7,9 @@ import pandas as pd
 import pandera.pandas as pa
 from pandera.api.pandas.model import DataFrameModel
 
+from stfc_parser.frames import shallow_copy
+from stfc_parser.schemas.SchemaPlan import get_schema_plan
+
 logger = logging.getLogger(__name__)
 
 def reorder_columns(df: pd.DataFrame, column_order: Iterable[str]) -> pd.DataFrame:
@@ -22,26 +25,22 @@ def _add_missing_schema_columns(
     *,
     context: str,
 ) -> pd.DataFrame:
-    schema_obj = schema.to_schema()
-    updated = df.copy()
-    missing_required = [
-        name
-        for name, column in schema_obj.columns.items()
-        if column.required and name not in updated.columns
-    ]
-    if missing_required:
-        logger.warning(
-            "Schema %s missing required columns %s; filling with NA values.",
-            context,
-            ", ".join(missing_required),
-        )
+    missing_required = get_schema_plan(schema).missing_required(df.columns)
+    if not missing_required:
+        return df
+    logger.warning(
+        "Schema %s missing required columns %s; filling with NA values.",
+        context,
+        ", ".join(missing_required),
+    )
+    updated = shallow_copy(df)
     for column in missing_required:
         updated[column] = pd.NA
     return updated
 
 
 def _coerce_to_schema(df: pd.DataFrame, schema: Type[DataFrameModel]) -> pd.DataFrame:
-    schema_obj = schema.to_schema()
+    schema_obj = get_schema_plan(schema).schema_obj
     try:
         return schema_obj.coerce_dtype(df)
     except Exception:  # pragma: no cover - defensive guard
@@ -60,8 +59,11 @@ def validate_dataframe(
     from stfc_parser.schemas.schema_helpers import normalize_dataframe_for_schema
 
     updated = _add_missing_schema_columns(df, schema, context=context)
+    if updated is df:
+        updated = shallow_copy(df)
     try:
-        validated = schema.validate(updated, lazy=True)
+        # Coerce on our own shallow copy rather than letting pandera deep-copy the frame.
+        validated = get_schema_plan(schema).schema_obj.validate(updated, lazy=True, inplace=True)
     except pa.errors.SchemaErrors as exc:
         if not soft:
             logger.error("Schema validation failed for %s.", context, exc_info=exc)
@@ -6,6 +6,7 @@ from stfc_parser.schemas.CombatSchema import CombatSchema
 from stfc_parser.schemas.FleetsSchema import FleetsSchema
 from stfc_parser.schemas.LootSchema import LootSchema
 from stfc_parser.schemas.PlayersSchema import PlayersSchema
+from stfc_parser.schemas.SchemaPlan import SchemaPlan, get_schema_plan
 from stfc_parser.schemas.SchemaValidation import reorder_columns, validate_dataframe
 from stfc_parser.schemas.schema_helpers import normalize_dataframe_for_schema
 
@@ -14,6 +15,8 @@ __all__ = [
     "FleetsSchema",
     "LootSchema",
     "PlayersSchema",
+    "SchemaPlan",
+    "get_schema_plan",
     "reorder_columns",
     "validate_dataframe",
     "normalize_dataframe_for_schema",
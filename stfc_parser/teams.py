@@ -5,23 +5,31 @@ import pandas as pd
 from stfc_parser.Team import Team
 
 
+def _player_specs(players_df: pd.DataFrame) -> list[ShipSpecifier]:
+    """Return one ShipSpecifier per players row, reading whole columns rather than rows."""
+
+    def column(name: str) -> list[object]:
+        if name not in players_df.columns:
+            return [None] * len(players_df)
+        return players_df[name].tolist()
+
+    return [
+        ShipSpecifier(name=name, alliance=alliance, ship=ship)
+        for name, alliance, ship in zip(column('Player Name'), column('Alliance'), column('Ship Name'))
+    ]
+
+
 def get_combatants_from_df(players_df: pd.DataFrame) -> Combatants:
     if players_df.empty:
         return Combatants(Team([]), Team([]))
 
-    def to_spec(row) -> ShipSpecifier:
-        return ShipSpecifier(
-            name=row.get('Player Name'),
-            alliance=row.get('Alliance'),
-            ship=row.get('Ship Name')
-        )
+    specs = _player_specs(players_df)
 
     # Team 2 is the last row (often the POV/Defender)
-    t2 = Team([to_spec(players_df.iloc[-1])])
+    t2 = Team(specs[-1:])
 
     # Team 1 is the attackers/others
-    t1_members = [to_spec(row) for _, row in players_df.iloc[:-1].iterrows()]
-    t1 = Team(t1_members)
+    t1 = Team(specs[:-1])
 
     return Combatants(team_one=t1, team_two=t2)
 
@@ -47,25 +55,12 @@ def get_teams_from_players_df(players_df: pd.DataFrame):
     normalized_players_df['Alliance'] = normalized_players_df['Alliance'].replace(['nan', 'None', '<NA>', ''], '')
 
 
+    specs = _player_specs(normalized_players_df)
+
     # Team2 is the last row
-    last_row = normalized_players_df.iloc[-1]
-    team2_specifier = ShipSpecifier(
-        name=last_row.get('Player Name'),
-        alliance=last_row.get('Alliance'),
-        ship=last_row.get('Ship Name')
-    )
-    team2_set: set[ShipSpecifier] = {team2_specifier}
+    team2_set: set[ShipSpecifier] = {specs[-1]}
 
     # Team1 is the rest of the rows
-    team1_set = set()
-    if len(normalized_players_df) > 1:
-        other_rows = normalized_players_df.iloc[:-1]
-        for _, row in other_rows.iterrows():
-            team1_specifier = ShipSpecifier(
-                name=row.get('Player Name'),
-                alliance=row.get('Alliance'),
-                ship=row.get('Ship Name')
-            )
-            team1_set.add(team1_specifier)
+    team1_set = set(specs[:-1])
 
     return team1_set, team2_set
\ No newline at end of file
@@ -1,9 +1,16 @@
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterator
 
 import pandas as pd
+from pandas.core.internals.managers import BlockManager
 
+from stfc_parser.ParsedBattle import ParsedBattle
 from stfc_parser.SessionInfo import SessionInfo
-from stfc_parser.parser_stub import parse_battle_log
+from stfc_parser.algebra.NonNormalizedGVS import NonNormalizedGVS
+from stfc_parser.parser_stub import parse_battle, parse_battle_log
 
 def get_battle_log(fname) -> pd.DataFrame:
     path = Path(__file__).resolve().parent / "logs" / fname
@@ -14,4 +21,42 @@ def get_battle_log(fname) -> pd.DataFrame:
 
 def get_session_info(fname) -> SessionInfo:
     combat_df = get_battle_log(fname)
-    return SessionInfo(combat_df)
\ No newline at end of file
+    return SessionInfo(combat_df)
+
+
+def get_parsed_battle(fname) -> ParsedBattle:
+    path = Path(__file__).resolve().parent / "logs" / fname
+    assert path.exists(), f"Missing test fixture file: {path.resolve()}"
+    return parse_battle(path.read_bytes(), fname)
+
+
+def get_gvs(fname) -> NonNormalizedGVS:
+    battle = get_parsed_battle(fname)
+    return NonNormalizedGVS.from_parser_outputs(battle.combat_df, battle.players_df)
+
+
+@dataclass
+class FrameCopyStats:
+    deep_copies: int = 0
+    peak_bytes: int = 0
+
+
+@contextmanager
+def track_frame_copies(min_rows: int) -> Iterator[FrameCopyStats]:
+    """Count deep copies of multi-column frames with at least ``min_rows`` rows and trace peak memory."""
+    stats = FrameCopyStats()
+    original_copy = BlockManager.copy
+
+    def counting_copy(self, deep=True):
+        if deep and self.shape[0] > 1 and self.shape[1] >= min_rows:
+            stats.deep_copies += 1
+        return original_copy(self, deep=deep)
+
+    BlockManager.copy = counting_copy
+    tracemalloc.start()
+    try:
+        yield stats
+    finally:
+        stats.peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        BlockManager.copy = original_copy
@@ -0,0 +1,88 @@
+"""Tests for the attacker hull state attached by NormalizedGVS."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stfc_parser.algebra.NonNormalizedGVS import NonNormalizedGVS
+from stfc_parser.algebra.NormalizedGVS import NormalizedGVS
+from helpers import get_parsed_battle
+
+
+def _events(rows: list[tuple]) -> pd.DataFrame:
+    """Build time-keyed events of (round, event, attacker, target, hull left)."""
+    rounds, events, attackers, targets, hull = (list(column) for column in zip(*rows))
+    return pd.DataFrame(
+        {
+            "round": rounds,
+            "battle_event": events,
+            "shot_index": pd.array([0] * len(rows), dtype="Int64"),
+            "attacker_name": attackers,
+            "attacker_ship": "Ship",
+            "attacker_alliance": "",
+            "target_name": targets,
+            "target_ship": "Ship",
+            "target_alliance": "",
+            "current_hull_percentage": hull,
+        }
+    )
+
+
+def _reference(df: pd.DataFrame) -> list[float]:
+    """Walk time steps in order, reading attackers before recording targets."""
+    df = df.sort_values("time_key", kind="stable")
+    keys = list(zip(df["time_key"], df["attacker_name"], df["target_name"], df["current_hull_percentage"]))
+    state: dict[object, float] = {}
+    result = []
+    for _, group in pd.Series(keys).groupby([key[0] for key in keys], sort=False):
+        result.extend(state.get(attacker, 1.0) for _, attacker, _, _ in group)
+        for _, _, target, hull in group:
+            state[target] = hull
+    return [1.0 if pd.isna(value) else value for value in result]
+
+
+def test_attackers_read_their_hull_from_earlier_time_steps() -> None:
+    df = _events(
+        [
+            (1, 1, "A", "B", 0.75),
+            (1, 2, "B", "A", 0.5),
+            (1, 2, "A", "B", 0.25),  # same step: A still reads its pre-step 1.0
+            (1, 3, "A", "A", 0.4),
+            (1, 4, "A", "B", 0.1),
+            (2, 1, "C", "D", np.nan),
+            (2, 2, "D", "C", 0.9),
+        ]
+    )
+    # Reversed input comes back in time order, ties in the order they arrived.
+    state = NormalizedGVS._annotate_attacker_state(df.iloc[::-1])
+    assert state["attacker_name"].tolist() == ["A", "A", "B", "A", "A", "C", "D"]
+    assert state["attacker_hull_percentage"].tolist() == [1.0, 1.0, 0.75, 0.5, 0.4, 1.0, 1.0]
+    assert state["time_key"].is_monotonic_increasing
+    assert state["name"].tolist() == state["attacker_name"].tolist()
+    assert isinstance(state.index, pd.RangeIndex)
+
+
+def test_null_names_match_only_null_names() -> None:
+    df = _events([(1, 1, "A", None, 0.5), (1, 2, None, "A", 0.25), (1, 3, "", "A", 0.2)])
+    df["attacker_name"] = df["attacker_name"].astype("str")
+    df["target_name"] = df["target_name"].astype("str")
+    assert NormalizedGVS._annotate_attacker_state(df)["attacker_hull_percentage"].tolist() == [1.0, 0.5, 1.0]
+
+
+def test_missing_time_keys_are_rejected() -> None:
+    df = _events([(1, 1, "A", "B", 0.5)])
+    df["shot_index"] = pd.array([pd.NA], dtype="Int64")
+    with pytest.raises(ValueError):
+        NormalizedGVS._annotate_attacker_state(df)
+
+
+def test_fixture_state_matches_step_by_step_walk() -> None:
+    battle = get_parsed_battle("3-armada.csv")
+    gvs = NormalizedGVS.from_non_normalized(
+        NonNormalizedGVS.from_parser_outputs(battle.combat_df, battle.players_df)
+    )
+    df = gvs.df
+    assert df["attacker_hull_percentage"].tolist() == pytest.approx(_reference(df))
+    assert df["attacker_hull_percentage"].lt(1.0).any()
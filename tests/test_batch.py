@@ -0,0 +1,38 @@
+"""Tests for batch parsing over a process pool."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from stfc_parser.batch import parse_many
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_many_reports_failures_without_aborting(tmp_path: Path, workers: int) -> None:
+    bad_log = tmp_path / "empty.csv"
+    bad_log.write_bytes(b"")
+    paths = [LOGS / "1.csv", bad_log, LOGS / "4-partial.csv"]
+
+    results = {result.path: result for result in parse_many(paths, workers=workers)}
+
+    assert set(results) == set(paths)
+    assert results[LOGS / "1.csv"].ok
+    assert len(results[LOGS / "1.csv"].battle.players_df) == 2
+    battle = results[LOGS / "1.csv"].battle
+    assert len(battle.raw_combat_df) == len(battle.combat_df)
+    assert results[LOGS / "4-partial.csv"].ok
+    failure = results[bad_log]
+    assert not failure.ok and failure.battle is None
+    assert failure.error.error_type == "EmptyDataError"
+    assert failure.error.traceback
+
+
+def test_parse_many_chunks_files() -> None:
+    paths = sorted(LOGS.glob("*.csv"))
+    results = list(parse_many(paths, workers=2, chunksize=2))
+    assert sorted(result.path for result in results) == paths
+    assert all(result.ok for result in results)
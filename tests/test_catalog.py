@@ -0,0 +1,65 @@
+"""Tests for header-only scans and the battle catalog."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from stfc_parser.FleetSectionParser import FleetSectionParser
+from stfc_parser.LootSectionParser import LootSectionParser
+from stfc_parser.StartsWhen import SECTION_HEADERS, tokenize_sections
+from stfc_parser.catalog import build_catalog, read_header_bytes, scan_header
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+
+def test_header_read_stops_at_combat_section() -> None:
+    file_bytes = (LOGS / "1.csv").read_bytes()
+    handle = io.BytesIO(file_bytes)
+    header = read_header_bytes(handle)
+    assert file_bytes.startswith(header)
+    assert file_bytes[len(header) :].startswith(SECTION_HEADERS["combat"].encode())
+    assert handle.tell() < len(file_bytes)
+
+
+def test_scan_header_matches_full_parse_sections(tmp_path: Path) -> None:
+    file_bytes = (LOGS / "1.csv").read_bytes()
+    sections = tokenize_sections(file_bytes)
+    # Garbage combat rows would fail a full parse; the scan never reads them.
+    cut = file_bytes.index(SECTION_HEADERS["combat"].encode())
+    path = tmp_path / "1.csv"
+    path.write_bytes(file_bytes[:cut] + SECTION_HEADERS["combat"].encode() + b"\n\x00\t\"\n")
+
+    header = scan_header(path)
+
+    assert header.players_df["Player Name"].tolist()[0] == "XanOfHanoi"
+    assert header.timestamp == pd.Timestamp("2026-01-07 08:20:49")
+    assert header.location == "Fiavoli"
+    pd.testing.assert_frame_equal(header.fleets_df, FleetSectionParser(sections["fleets"]).parse())
+    pd.testing.assert_frame_equal(header.loot_df, LootSectionParser(sections.get("rewards")).parse())
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_catalog_rows_sorted_with_failures_recorded(tmp_path: Path, workers: int) -> None:
+    for fname in ("1.csv", "3-armada.csv", "5-kren.csv"):
+        (tmp_path / fname).write_bytes((LOGS / fname).read_bytes())
+    (tmp_path / "broken.csv").write_bytes(b"\xff\xfe")
+
+    catalog = build_catalog(tmp_path, workers=workers, chunksize=1)
+
+    assert len(catalog) == 4
+    assert catalog["timestamp"].iloc[:3].is_monotonic_increasing
+    assert catalog["error"].iloc[:3].isna().all()
+    assert "XanOfHanoi" in catalog.loc[catalog["path"] == tmp_path / "1.csv", "players"].item()
+    assert pd.isna(catalog["timestamp"].iloc[-1])
+
+
+def test_unvalidated_scan_reads_same_header_fields() -> None:
+    validated = scan_header(LOGS / "3-armada.csv")
+    raw = scan_header(LOGS / "3-armada.csv", validate=False)
+    assert (raw.timestamp, raw.location) == (validated.timestamp, validated.location)
+    assert len(raw.players_df) == len(validated.players_df)
+    assert len(raw.fleets_df) == len(validated.fleets_df)
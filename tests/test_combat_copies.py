@@ -0,0 +1,64 @@
+"""Regression guard against full-frame copies in the combat parse path."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from stfc_parser.BattleSectionParser import BattleSectionParser
+from stfc_parser.frames import copy_on_write_enabled
+from helpers import track_frame_copies
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+# Peak traced memory while parsing, as a multiple of the final frame's deep size.
+MAX_PEAK_RATIO = 2.5
+
+# Arrow-backed strings are far smaller than Python objects and live outside
+# tracemalloc's view, so with Arrow string storage peak memory is bounded
+# against both returned frames instead.
+ARROW_STRINGS = pd.StringDtype().storage == "pyarrow"
+MAX_ARROW_PEAK_RATIO = 2.5
+
+# Without copy-on-write (pandas 2.x default) the parse deep-copies on purpose.
+needs_copy_on_write = pytest.mark.skipif(
+    not copy_on_write_enabled(), reason="shallow copies need copy-on-write"
+)
+
+
+@needs_copy_on_write
+@pytest.mark.skipif(ARROW_STRINGS, reason="bound is for Python string storage")
+@pytest.mark.parametrize("fname", ["1.csv", "2-outpost-retal.csv", "3-armada.csv"])
+def test_combat_parse_makes_no_full_frame_copies(fname: str) -> None:
+    file_bytes = (LOGS / fname).read_bytes()
+    BattleSectionParser(file_bytes).parse()  # warm imports and schema plans
+
+    with track_frame_copies(min_rows=100) as stats:
+        combat_df, raw_df = BattleSectionParser(file_bytes).parse()
+
+    assert stats.deep_copies == 0
+    final_bytes = combat_df.memory_usage(deep=True).sum()
+    assert stats.peak_bytes <= MAX_PEAK_RATIO * final_bytes, (
+        f"peak {stats.peak_bytes} bytes vs final frame {final_bytes} bytes"
+    )
+    assert len(raw_df) == len(combat_df)
+
+
+@needs_copy_on_write
+@pytest.mark.skipif(not ARROW_STRINGS, reason="pandas stores strings as Python objects")
+@pytest.mark.parametrize("engine", ["c", "pyarrow"])
+@pytest.mark.parametrize("fname", ["1.csv", "2-outpost-retal.csv", "3-armada.csv"])
+def test_arrow_string_parse_makes_no_full_frame_copies(fname: str, engine: str) -> None:
+    file_bytes = (LOGS / fname).read_bytes()
+    BattleSectionParser(file_bytes, engine=engine).parse()  # warm imports and schema plans
+
+    with track_frame_copies(min_rows=100) as stats:
+        combat_df, raw_df = BattleSectionParser(file_bytes, engine=engine).parse()
+
+    assert stats.deep_copies == 0
+    final_bytes = combat_df.memory_usage(deep=True).sum() + raw_df.memory_usage(deep=True).sum()
+    assert stats.peak_bytes <= MAX_ARROW_PEAK_RATIO * final_bytes, (
+        f"peak {stats.peak_bytes} bytes vs final frames {final_bytes} bytes"
+    )
@@ -0,0 +1,78 @@
+"""Tests for the integer-coded combatant registry."""
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.core.CombatantRegistry import CombatantRegistry
+from helpers import get_session_info
+
+
+def _registry() -> CombatantRegistry:
+    combat_df = pd.DataFrame(
+        {
+            "attacker_name": ["Alice", "Borg", "Alice", None],
+            "attacker_alliance": ["TD", pd.NA, "TD", None],
+            "attacker_ship": ["NX-01", "Cube", "NX-01", None],
+            "target_name": ["Borg", "Alice", "Borg", "Alice"],
+            "target_alliance": [None, "TD", None, "TD"],
+            "target_ship": ["Cube", "NX-01", "Cube", "BORG CUBE"],
+        }
+    )
+    return CombatantRegistry(combat_df)
+
+
+def test_roles_share_one_id_space() -> None:
+    registry = _registry()
+    assert registry.specs == (
+        ShipSpecifier("Alice", "TD", "NX-01"),
+        ShipSpecifier("Borg", "", "Cube"),
+        ShipSpecifier("", "", ""),
+        ShipSpecifier("Alice", "TD", "BORG CUBE"),
+    )
+    assert registry.ids("attacker").tolist() == [0, 1, 0, 2]
+    assert registry.ids("target").tolist() == [1, 0, 1, 3]
+    assert registry.id_of("Borg", None, "Cube") == 1
+    assert registry.id_of("Borg", "TD", "Cube") is None
+
+
+def test_specs_are_interned_with_precomputed_keys() -> None:
+    registry = _registry()
+    alice = registry.intern(ShipSpecifier("Alice", "TD", "NX-01"))
+    assert alice is registry.spec(0)
+    assert alice.normalized_key() is alice.normalized_key()
+    assert not hasattr(alice, "__dict__")
+    assert pickle.loads(pickle.dumps(alice)).normalized_key() == ("Alice", "TD", "NX-01")
+
+
+def test_rows_by_id_and_coded_frame() -> None:
+    registry = _registry()
+    rows = registry.rows_by_id("target")
+    assert {key: value.tolist() for key, value in rows.items()} == {0: [1], 1: [0, 2], 3: [3]}
+
+    coded = registry.coded_combat_df
+    assert coded["attacker_id"].tolist() == [0, 1, 0, 2]
+    assert "attacker_id" not in registry.combat_df.columns
+
+
+def test_missing_role_columns_have_no_ids() -> None:
+    registry = CombatantRegistry(pd.DataFrame({"attacker_name": ["Alice"]}))
+    assert registry.ids("attacker") is None
+    assert registry.rows_by_id("attacker") is None
+    assert registry.specs == ()
+
+
+def test_session_ids_decode_to_combat_values() -> None:
+    session = get_session_info("3-armada.csv")
+    registry = session.registry
+    combat_df = session.combat_df
+    specs = np.array(registry.specs, dtype=object)
+    for role in CombatantRegistry.ROLES:
+        decoded = [(spec.name, spec.alliance, spec.ship) for spec in specs[registry.ids(role)]]
+        expected = combat_df[registry.role_columns(role)].astype(object).fillna("")
+        assert decoded == list(expected.itertuples(index=False, name=None))
+    assert all(spec in registry.specs for spec in session.get_every_ship())
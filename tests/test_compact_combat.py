@@ -0,0 +1,102 @@
+"""Tests for the opt-in compact combat dtypes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from stfc_parser.SessionInfo import SessionInfo
+from stfc_parser.algebra.NonNormalizedGVS import NonNormalizedGVS
+from stfc_parser.algebra.NormalizedGVS import NormalizedGVS
+from stfc_parser.cache import ParseCache
+from stfc_parser.compact import compact_combat_df, memory_report
+from stfc_parser.parser_stub import parse_battle
+from stfc_parser.schemas.CombatSchema import COMBAT_IDENTITY_COLUMNS
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+
+def _session_queries(session: SessionInfo) -> list[object]:
+    results: list[object] = [
+        session.combatant_names(),
+        session.alliance_names(),
+        session.get_every_ship(),
+        session.build_outcome_lookup(),
+    ]
+    for name in sorted(session.combatant_names()):
+        for ship in sorted(session.get_ships(name)):
+            results.append(session.all_officer_names(name, ship))
+    specs = sorted(session.get_every_ship(), key=repr)[:2]
+    results.append(len(session.get_combat_df_filtered_by_attackers(specs)))
+    results.append(len(session.get_combat_df_filtered_by_targets(specs)))
+    return results
+
+
+def test_compact_dtypes_share_identity_categories() -> None:
+    combat_df = parse_battle((LOGS / "3-armada.csv").read_bytes(), "3-armada.csv", compact=True).combat_df
+    shared = combat_df["attacker_name"].dtype
+    assert isinstance(shared, pd.CategoricalDtype)
+    assert all(combat_df[column].dtype == shared for column in COMBAT_IDENTITY_COLUMNS)
+    assert isinstance(combat_df["event_type"].dtype, pd.CategoricalDtype)
+    assert combat_df["round"].dtype.itemsize < 8
+    assert combat_df["shot_index"].dtype.itemsize < 8
+    assert combat_df["is_crit"].dtype == "boolean"
+    assert combat_df["hull_damage"].dtype == "float64"
+
+
+def test_compact_preserves_large_damage_values() -> None:
+    big = 1_234_567_890_123_456.0
+    df = pd.DataFrame(
+        {
+            "round": [1, 2],
+            "attacker_name": ["Alice", "Bob"],
+            "target_name": ["Bob", "Alice"],
+            "hull_damage": [big, big + 2],
+        }
+    )
+    compact = compact_combat_df(df)
+    assert compact["hull_damage"].tolist() == [big, big + 2]
+    assert (compact["attacker_name"] == compact["target_name"]).tolist() == [False, False]
+    assert memory_report(df, compact).loc["hull_damage", "bytes_saved"] == 0
+
+
+@pytest.mark.parametrize("fname", ["1.csv", "2-outpost-retal.csv", "3-armada.csv"])
+def test_session_queries_match_on_compact_frames(fname: str) -> None:
+    file_bytes = (LOGS / fname).read_bytes()
+    expected = SessionInfo(parse_battle(file_bytes, fname))
+    actual = SessionInfo(parse_battle(file_bytes, fname, compact=True))
+    assert _session_queries(actual) == _session_queries(expected)
+    pd.testing.assert_frame_equal(
+        actual.combat_df.astype(expected.combat_df.dtypes.to_dict()), expected.combat_df
+    )
+
+
+@pytest.mark.parametrize("fname", ["1.csv", "3-armada.csv"])
+def test_normalized_gvs_matches_on_compact_frames(fname: str) -> None:
+    file_bytes = (LOGS / fname).read_bytes()
+    spaces = []
+    for compact in (False, True):
+        battle = parse_battle(file_bytes, fname, compact=compact)
+        events = NonNormalizedGVS.from_parser_outputs(battle.combat_df, battle.players_df)
+        spaces.append(NormalizedGVS.from_non_normalized(events).df)
+    expected, actual = spaces
+    columns = ["time_key", "attacker_hull_percentage", *NormalizedGVS.DERIVED_COLS]
+    pd.testing.assert_frame_equal(actual[columns], expected[columns], check_dtype=False)
+
+
+def test_cached_parse_honours_compact(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path)
+    file_bytes = (LOGS / "3-armada.csv").read_bytes()
+    expected = parse_battle(file_bytes, "3-armada.csv", compact=True).combat_df
+    default = parse_battle(file_bytes, "3-armada.csv").combat_df
+
+    cold = parse_battle(file_bytes, "3-armada.csv", cache=cache, compact=True)
+    warm = parse_battle(file_bytes, "3-armada.csv", cache=cache, compact=True)
+    plain = parse_battle(file_bytes, "3-armada.csv", cache=cache)
+
+    pd.testing.assert_frame_equal(cold.combat_df, expected)
+    pd.testing.assert_frame_equal(warm.combat_df, expected)
+    pd.testing.assert_frame_equal(plain.combat_df, default)
+    assert (cache.stats.misses, cache.stats.hits, cache.stats.stores) == (1, 2, 1)
@@ -0,0 +1,51 @@
+"""Tests for the precomputed Crew officer roster."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from stfc_parser.core.Crew import Crew, OfficerRoster
+
+
+def _crew() -> Crew:
+    players_df = pd.DataFrame(
+        {
+            "Player Name": ["Alice", "Alice", None],
+            "Ship Name": ["BORG CUBE", "NX-01", "Romulan Velite"],
+            "Officer One": ["Janeway", "Archer", "Romulan Captain"],
+            "Officer Two": ["The Doctor", pd.NA, pd.NA],
+            "Officer Three": ["Annorax", pd.NA, pd.NA],
+        }
+    )
+    combat_df = pd.DataFrame(
+        {
+            "event_type": ["Officer", "officer", "Attack", "Officer"],
+            "attacker_name": ["Alice", "Alice ", "Alice", "Alice"],
+            "attacker_ship": ["BORG CUBE", "BORG CUBE", "BORG CUBE", "NX-01"],
+            "ability_owner_name": ["Janeway", "Seska", "Ignored", pd.NA],
+        }
+    )
+    return Crew(players_df, combat_df)
+
+
+def test_roster_holds_bridge_and_activated_officers() -> None:
+    crew = _crew()
+    assert crew.roster[("Alice", "BORG CUBE")] == OfficerRoster(
+        captain=frozenset({"Janeway"}),
+        first_officer=frozenset({"The Doctor"}),
+        second_officer=frozenset({"Annorax"}),
+        activated=frozenset({"Janeway", "Seska"}),
+    )
+    assert crew.roster[("Alice", "NX-01")].activated == frozenset()
+    assert crew.roster is crew.roster
+
+
+def test_queries_are_lookups_on_normalized_keys() -> None:
+    crew = _crew()
+    assert crew.get_bridge_crew(" Alice", "BORG CUBE ") == {"Janeway", "The Doctor", "Annorax"}
+    assert crew.all_officer_names("Alice", "BORG CUBE") == {"Janeway", "Seska"}
+    assert crew.get_below_deck_officers("Alice", "BORG CUBE") == {"Seska"}
+    assert crew.get_1st_officer_name("Alice", "NX-01") == set()
+    # A missing player name is keyed as empty, like ShipSpecifier.normalize_text.
+    assert crew.get_captain_name(None, "Romulan Velite") == {"Romulan Captain"}
+    assert crew.get_captain_name("Nobody", "Nothing") == set()
@@ -0,0 +1,98 @@
+"""Tests for the round × attacker × target × metric damage cube."""
+
+from __future__ import annotations
+
+import io
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.algebra.DamageCube import DamageCube
+from helpers import get_gvs, get_session_info
+
+
+def test_cells_match_groupby_over_events() -> None:
+    gvs = get_gvs("3-armada.csv")
+    cube = DamageCube.from_non_normalized(gvs)
+    df = gvs.df
+    keys = ["round", "attacker_name", "attacker_alliance", "attacker_ship",
+            "target_name", "target_alliance", "target_ship"]
+    expected = df.fillna({key: "" for key in keys[1:]}).groupby(keys)["hull_damage"].agg(["sum", "size"])
+
+    frame = cube.to_frame("round", "attacker", "target")
+    assert len(frame) == len(expected)
+    for (k, attacker, target), row in frame.iterrows():
+        key = (k, attacker.name, attacker.alliance, attacker.ship, target.name, target.alliance, target.ship)
+        assert row["hull_damage"] == pytest.approx(expected.loc[key, "sum"])
+        assert row["shots"] == expected.loc[key, "size"]
+    assert cube.values[..., cube.index_of("metric", "is_crit")].sum() == df["is_crit"].sum()
+
+
+def test_frame_index_follows_the_order_of_keep() -> None:
+    gvs = get_gvs("3-armada.csv")
+    cube = DamageCube.from_non_normalized(gvs)
+    df = gvs.df
+    keys = ["target_name", "target_alliance", "target_ship",
+            "attacker_name", "attacker_alliance", "attacker_ship"]
+    expected = df.fillna({key: "" for key in keys}).groupby(keys)["hull_damage"].sum()
+
+    frame = cube.to_frame("target", "attacker")
+    assert frame.index.names == ["target", "attacker"]
+    assert len(frame) == len(expected)
+    for (target, attacker), row in frame.iterrows():
+        key = (target.name, target.alliance, target.ship, attacker.name, attacker.alliance, attacker.ship)
+        assert row["hull_damage"] == pytest.approx(expected.loc[key])
+    swapped = cube.to_frame("attacker", "target").swaplevel().sort_index()
+    pd.testing.assert_frame_equal(frame.sort_index(), swapped)
+
+
+def test_slices_marginals_and_running_totals() -> None:
+    cube = DamageCube.from_non_normalized(get_gvs("3-armada.csv"))
+    dealt = cube.marginal("attacker", metric="hull_damage")
+    assert dealt.shape == (len(cube.combatants),)
+    assert dealt.sum() == pytest.approx(cube.select(metric="hull_damage").sum())
+
+    attacker = cube.combatants[int(np.argmax(dealt))]
+    by_round = cube.select(attacker=attacker, metric="hull_damage").sum(axis=1)
+    assert by_round.sum() == pytest.approx(dealt.max())
+    assert np.shares_memory(cube.select(round=cube.rounds[0]), cube.values)
+    assert cube.select(round=[cube.rounds[0]] * 2, metric="shots").shape == (2, *cube.values.shape[1:3])
+    assert cube.index_of("attacker", ShipSpecifier(attacker.name, attacker.alliance or None, attacker.ship)) == (
+        cube.index_of("target", attacker)
+    )
+
+    last = cube.rounds[-1]
+    np.testing.assert_allclose(cube.through_round(last), cube.values.sum(axis=0))
+    np.testing.assert_allclose(cube.through_round(cube.rounds[0]), cube.values[0])
+    assert not cube.through_round(cube.rounds[0] - 1).any()
+    with pytest.raises(ValueError):
+        cube.cumulative[0, 0, 0, 0] = 1.0
+    with pytest.raises(KeyError):
+        cube.index_of("metric", "nonsense")
+
+
+def test_cube_round_trips_through_npz_and_pickle() -> None:
+    cube = DamageCube.from_non_normalized(get_gvs("3-armada.csv"))
+    buffer = io.BytesIO()
+    cube.save(buffer)
+    buffer.seek(0)
+    for restored in (DamageCube.load(buffer), pickle.loads(pickle.dumps(cube, protocol=5))):
+        np.testing.assert_array_equal(restored.values, cube.values)
+        np.testing.assert_array_equal(restored.rounds, cube.rounds)
+        assert restored.combatants == cube.combatants
+        assert restored.metrics == cube.metrics
+
+
+def test_session_cube_uses_the_session_registry() -> None:
+    session = get_session_info("3-armada.csv")
+    cube = session.damage_cube
+    assert cube.combatants == session.registry.specs
+    teams = session.team_membership.combatant_teams
+    dealt = cube.marginal("attacker", metric="shots")
+    attacks = session.combat_df["event_type"] == "Attack"
+    per_team = pd.Series(session.team_membership.team_codes("attacker")[attacks.to_numpy()]).value_counts()
+    for team, shots in per_team.items():
+        assert dealt[teams == team].sum() == shots
@@ -0,0 +1,61 @@
+"""Tests for the partitioned round and target views of NonNormalizedGVS."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from stfc_parser import frames
+from stfc_parser.algebra import NonNormalizedGVS as non_normalized_gvs
+from stfc_parser.algebra.NonNormalizedGVS import NonNormalizedGVS
+from helpers import get_gvs
+
+
+def test_views_match_masked_selection_and_share_buffers() -> None:
+    gvs = get_gvs("3-armada.csv")
+    df = gvs.df
+    for k in df["round"].unique():
+        view = gvs.by_round(k).df
+        assert view.equals(df[df["round"] == k])
+        shared = np.shares_memory(view["hull_damage"].to_numpy(), df["hull_damage"].to_numpy())
+        assert shared == frames.copy_on_write_enabled()
+    for name in df["target_name"].dropna().unique():
+        assert gvs.for_target(name).df.equals(df[df["target_name"] == name])
+    assert gvs.by_round(999).df.empty
+    assert gvs.for_target("nobody").df.empty
+
+
+def test_iterators_cover_every_round_and_target() -> None:
+    gvs = get_gvs("3-armada.csv")
+    rounds = list(gvs.iter_rounds())
+    assert [k for k, _ in rounds] == sorted(gvs.df["round"].unique().tolist())
+    assert sum(len(view.df) for _, view in rounds) == len(gvs.df)
+    targets = [name for name, _ in gvs.iter_targets()]
+    assert targets == gvs.df["target_name"].dropna().unique().tolist()
+
+
+def test_unsorted_events_are_ordered_once_and_writes_stay_local() -> None:
+    df = get_gvs("3-armada.csv").df
+    shuffled = NonNormalizedGVS(df.sample(frac=1, random_state=1))
+    k = int(df["round"].iloc[0])
+    expected = df[df["round"] == k]
+    view = shuffled.by_round(k).df
+    assert view.equals(expected.sort_values(["battle_event", "shot_index"], kind="stable"))
+
+    view.loc[view.index[0], "hull_damage"] = -1.0
+    assert (shuffled.by_round(k).df["hull_damage"] >= 0).all()
+    assert isinstance(shuffled.by_round(k), NonNormalizedGVS)
+    assert pd.api.types.is_integer_dtype(view["round"])
+
+
+def test_views_and_shallow_copies_are_deep_without_copy_on_write(monkeypatch) -> None:
+    gvs = get_gvs("3-armada.csv")
+    monkeypatch.setattr(frames, "copy_on_write_enabled", lambda: False)
+    monkeypatch.setattr(non_normalized_gvs, "copy_on_write_enabled", lambda: False)
+    df = gvs.df
+    k = int(df["round"].iloc[0])
+    view = gvs.by_round(k).df
+    assert view.equals(df[df["round"] == k])
+    assert not np.shares_memory(view["hull_damage"].to_numpy(), df["hull_damage"].to_numpy())
+    copied = frames.shallow_copy(df)
+    assert not np.shares_memory(copied["hull_damage"].to_numpy(), df["hull_damage"].to_numpy())
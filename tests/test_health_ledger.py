@@ -0,0 +1,110 @@
+"""Tests for the per-combatant shield/hull health ledger."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from stfc_parser.core.FixPlayersDataframe import FixPlayersDataframe
+from stfc_parser.core.HealthLedger import HealthLedger
+from helpers import get_parsed_battle, get_session_info
+
+
+def _damage_through(combat_df, spec, round=None, event=None) -> tuple[float, float]:
+    hit = (
+        (combat_df["target_name"].fillna("") == spec.name)
+        & (combat_df["target_alliance"].fillna("") == spec.alliance)
+        & (combat_df["target_ship"].fillna("") == spec.ship)
+    )
+    if round is not None:
+        before = combat_df["round"] < round
+        if event is None:
+            before |= combat_df["round"] == round
+        else:
+            before |= (combat_df["round"] == round) & (combat_df["battle_event"] <= event)
+        hit &= before
+    return combat_df.loc[hit, "shield_damage"].sum(), combat_df.loc[hit, "hull_damage"].sum()
+
+
+def test_point_queries_match_masked_sums() -> None:
+    battle = get_parsed_battle("3-armada.csv")
+    combat_df = battle.combat_df.sample(frac=1, random_state=0)
+    ledger = HealthLedger(combat_df, battle.players_df, battle.fleets_df)
+    rounds = sorted(combat_df["round"].unique())
+    events = combat_df["battle_event"].quantile([0.25, 0.5, 0.75]).astype(int).tolist()
+
+    for combatant_id, spec in enumerate(ledger.registry.specs):
+        assert ledger.combatant_id(spec) == combatant_id
+        assert ledger.damage_taken(spec) == pytest.approx(_damage_through(combat_df, spec))
+        for k in rounds:
+            assert ledger.damage_taken(combatant_id, k) == pytest.approx(_damage_through(combat_df, spec, k))
+            for event in events:
+                assert ledger.damage_taken(combatant_id, k, event) == pytest.approx(
+                    _damage_through(combat_df, spec, k, event)
+                )
+        assert ledger.damage_taken(combatant_id, rounds[0] - 1) == (0.0, 0.0)
+
+    totals = ledger.total_damage()
+    assert totals["hull_damage"].sum() == pytest.approx(combat_df["hull_damage"].sum())
+    assert totals["shield_damage"].sum() == pytest.approx(combat_df["shield_damage"].sum())
+    with pytest.raises(KeyError):
+        ledger.combatant_id(len(ledger.registry.specs))
+
+
+def test_state_and_timeline_are_seeded_from_players() -> None:
+    session = get_session_info("3-armada.csv")
+    ledger = session.health_ledger
+    players = session.players_df
+    start = ledger.starting_health
+
+    seeded = np.flatnonzero(np.isfinite(start["hull"]))
+    assert len(seeded) == len(players)
+    for combatant_id in seeded:
+        shield, hull = ledger.damage_taken(combatant_id)
+        assert ledger.state_at(combatant_id) == pytest.approx(
+            (max(start["shield"][combatant_id] - shield, 0.0), max(start["hull"][combatant_id] - hull, 0.0))
+        )
+    assert set(start["hull"][seeded]) == set(players["Hull Health"].astype(float))
+
+    timeline = ledger.timeline()
+    hits = session.combat_df["shield_damage"].notna() | session.combat_df["hull_damage"].notna()
+    assert len(timeline) == hits.sum()
+    for _, hits_taken in timeline.groupby("combatant_id"):
+        assert hits_taken["hull_damage_taken"].is_monotonic_increasing
+        assert hits_taken["hull_remaining"].dropna().is_monotonic_decreasing
+        assert (hits_taken["round"] * 10**9 + hits_taken["battle_event"]).is_monotonic_increasing
+    last = timeline.groupby("combatant_id").tail(1).set_index("combatant_id")
+    np.testing.assert_allclose(
+        last["hull_remaining"].to_numpy(),
+        [ledger.state_at(int(combatant_id))[1] for combatant_id in last.index],
+    )
+
+
+def test_fix_reads_hull_remaining_from_the_ledger() -> None:
+    battle = get_parsed_battle("3-armada.csv")
+    combat_df, fleets_df = battle.combat_df, battle.fleets_df
+    fixed = FixPlayersDataframe(battle.players_df.iloc[-1:], combat_df, fleets_df).fix()
+
+    players = fixed.iloc[:-1]
+    assert len(players) > 0
+    for i, (_, row) in enumerate(players.iterrows()):
+        max_hull = fleets_df.loc[fleets_df["Fleet Type"] == f"Player Fleet {i + 1}", "Hull Health"].sum()
+        taken = combat_df.loc[combat_df["target_ship"] == row["Ship Name"], "hull_damage"].sum()
+        assert row["Hull Health"] == max_hull
+        assert row["Hull Health Remaining"] == pytest.approx(max(0, max_hull - taken))
+
+
+@pytest.mark.parametrize("dropped", ["shield_damage", "round", "battle_event"])
+def test_fix_falls_back_to_hull_damage_without_ledger_columns(dropped) -> None:
+    battle = get_parsed_battle("3-armada.csv")
+    players_df, fleets_df = battle.players_df.iloc[-1:], battle.fleets_df
+    combat_df = battle.combat_df.drop(columns=dropped)
+    expected = FixPlayersDataframe(players_df, battle.combat_df, fleets_df).fix()
+
+    assert not HealthLedger(combat_df).complete
+    fixed = FixPlayersDataframe(players_df, combat_df, fleets_df).fix()
+    assert (fixed["Hull Health Remaining"] < fixed["Hull Health"]).iloc[:-1].any()
+    np.testing.assert_allclose(
+        fixed["Hull Health Remaining"].iloc[:-1].astype(float),
+        expected["Hull Health Remaining"].iloc[:-1].astype(float),
+    )
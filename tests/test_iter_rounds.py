@@ -0,0 +1,43 @@
+"""Tests for round-by-round streaming of the combat section."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from stfc_parser.BattleSectionParser import BattleSectionParser
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+
+@pytest.mark.parametrize("fname", ["1.csv", "3-armada.csv", "4-partial.csv"])
+@pytest.mark.parametrize("chunk_rows", [7, 10_000])
+def test_rounds_concatenate_to_batch_parse(fname: str, chunk_rows: int) -> None:
+    file_bytes = (LOGS / fname).read_bytes()
+    expected, _ = BattleSectionParser(file_bytes).parse(soft=True)
+
+    for source in (file_bytes, io.BytesIO(file_bytes)):
+        rounds = list(BattleSectionParser(source).iter_rounds(chunk_rows, soft=True))
+        for frame in rounds:
+            assert frame["round"].nunique(dropna=False) == 1
+        pd.testing.assert_frame_equal(pd.concat(rounds), expected)
+
+
+def test_stream_leaves_caller_handle_open() -> None:
+    handle = io.BytesIO((LOGS / "1.csv").read_bytes())
+    assert list(BattleSectionParser(handle).iter_rounds())
+    assert not handle.closed
+
+
+def test_missing_combat_section_yields_nothing() -> None:
+    text = "Player Name\tPlayer Level\tOutcome\nAlice\t10\tVICTORY\n"
+    assert list(BattleSectionParser(text).iter_rounds()) == []
+    assert list(BattleSectionParser(io.StringIO(text)).iter_rounds()) == []
+
+
+def test_chunk_rows_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        next(BattleSectionParser(b"").iter_rounds(0))
@@ -0,0 +1,49 @@
+"""Tests for lazily parsed battle sections."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from stfc_parser.LazyParsedBattle import LazyParsedBattle
+from stfc_parser.SessionInfo import SessionInfo
+from stfc_parser.parser_stub import parse_battle
+from helpers import get_parsed_battle
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+
+def test_sections_parse_only_on_access() -> None:
+    battle = parse_battle((LOGS / "1.csv").read_bytes(), "1.csv", lazy=True)
+    assert isinstance(battle, LazyParsedBattle)
+    assert battle.parsed_sections() == []
+
+    players_df = battle.players_df
+
+    # 1.csv has a complete players section, so no repair inputs are needed.
+    assert len(players_df) == 2
+    assert battle.parsed_sections() == ["players_df"]
+    assert set(battle.timings) == {"players"}
+
+
+def test_players_repair_pulls_in_dependencies() -> None:
+    battle = LazyParsedBattle((LOGS / "3-armada.csv").read_bytes())
+    players_df = battle.players_df
+    assert "AmigoSniped" in set(players_df["Player Name"].dropna())
+    assert set(battle.parsed_sections()) == {"players_df", "fleets_df", "combat_df"}
+    assert "raw_combat_df" not in battle.parsed_sections()
+
+
+@pytest.mark.parametrize("fname", ["1.csv", "3-armada.csv"])
+def test_lazy_frames_match_eager_parse(fname: str) -> None:
+    eager = get_parsed_battle(fname)
+    lazy = LazyParsedBattle((LOGS / fname).read_bytes()).materialize()
+    for field in LazyParsedBattle.SECTIONS:
+        pd.testing.assert_frame_equal(getattr(lazy, field), getattr(eager, field))
+
+
+def test_session_info_over_lazy_battle() -> None:
+    session = SessionInfo(LazyParsedBattle((LOGS / "1.csv").read_bytes()))
+    assert session.get_ships("XanOfHanoi") == {"BORG CUBE"}
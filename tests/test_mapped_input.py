@@ -0,0 +1,62 @@
+"""Tests for parsing battle logs from memory-mapped files."""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from stfc_parser import parser_stub
+from stfc_parser.LazyParsedBattle import LazyParsedBattle
+from stfc_parser.StartsWhen import map_file, unmap_file
+from stfc_parser.parser_stub import parse_battle, parse_battle_file
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+
+@pytest.mark.parametrize("fname", ["1.csv", "3-armada.csv", "4-partial.csv"])
+def test_mapped_parse_matches_bytes_parse(fname: str) -> None:
+    expected = parse_battle((LOGS / fname).read_bytes(), fname)
+    battle = parse_battle_file(LOGS / fname)
+    for key in ("combat_df", "players_df", "fleets_df", "loot_df", "raw_combat_df"):
+        pd.testing.assert_frame_equal(getattr(battle, key), getattr(expected, key))
+
+
+def test_eager_parse_closes_the_mapping(monkeypatch: pytest.MonkeyPatch) -> None:
+    mappings = []
+
+    def recording_map(path):
+        view = map_file(path)
+        mappings.append(view.obj)
+        return view
+
+    monkeypatch.setattr(parser_stub, "map_file", recording_map)
+    battle = parse_battle_file(LOGS / "1.csv")
+    assert mappings[0].closed
+    # The raw frame is re-read from the path; the battle holds no copy of the section.
+    assert len(pickle.dumps(battle.raw_combat)) < 1024
+    assert len(battle.raw_combat_df) == len(battle.combat_df)
+
+
+def test_lazy_battle_reads_from_the_mapping() -> None:
+    battle = parse_battle_file(LOGS / "1.csv", lazy=True)
+    assert isinstance(battle, LazyParsedBattle)
+    assert len(battle.players_df) == 2
+
+
+def test_map_file_views_file_contents(tmp_path: Path) -> None:
+    assert bytes(map_file(LOGS / "1.csv")) == (LOGS / "1.csv").read_bytes()
+    empty = tmp_path / "empty.csv"
+    empty.write_bytes(b"")
+    assert len(map_file(empty)) == 0
+
+    view = map_file(LOGS / "1.csv")
+    piece = view[:10]
+    assert not unmap_file(view)
+    assert bytes(piece) == (LOGS / "1.csv").read_bytes()[:10]
+    view = map_file(LOGS / "1.csv")
+    mapped = view.obj
+    assert unmap_file(view)
+    assert mapped.closed
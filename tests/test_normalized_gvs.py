@@ -0,0 +1,50 @@
+"""Tests for the normalized damage block of NormalizedGVS."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stfc_parser.algebra.NonNormalizedGVS import NonNormalizedGVS
+from stfc_parser.algebra.NormalizedGVS import NormalizedGVS
+from helpers import get_gvs
+
+
+def _gvs(df: pd.DataFrame) -> NormalizedGVS:
+    return NormalizedGVS.from_non_normalized(NonNormalizedGVS(df))
+
+
+def test_block_matches_columnwise_division_and_groupby() -> None:
+    df = get_gvs("3-armada.csv").df
+    normalized = _gvs(df).df.sort_values(["round", "battle_event", "shot_index"], kind="stable")
+    expected = df.sort_values(["round", "battle_event", "shot_index"], kind="stable")
+    for col in NormalizedGVS.NORM_COLS:
+        ratio = (expected[col] / expected["initial_hull_health"]).replace([np.inf, -np.inf], 0).fillna(0)
+        assert normalized[f"{col}_norm"].tolist() == ratio.tolist()
+    cumulative = ratio.groupby([expected[c] for c in NormalizedGVS.TARGET_COLS]).cumsum()
+    assert normalized["cumulative_hull_damage_norm"].tolist() == pytest.approx(cumulative.tolist(), nan_ok=True)
+    assert normalized["damage_pct"].tolist() == normalized["hull_damage_norm"].tolist()
+    assert list(normalized.columns[len(df.columns):len(df.columns) + 10]) == NormalizedGVS.DERIVED_COLS
+
+
+def test_missing_hull_and_targets_are_guarded() -> None:
+    df = get_gvs("3-armada.csv").df.head(6).copy()
+    df["initial_hull_health"] = [0.0, np.nan, 100.0, 100.0, 100.0, 100.0]
+    df["hull_damage"] = [5.0, 5.0, np.nan, 10.0, 20.0, 30.0]
+    df["target_name"] = "T"
+    df["target_ship"] = "S"
+    df["target_alliance"] = ["", "", "", pd.NA, "", ""]
+    normalized = _gvs(df).df.sort_values("time_key", kind="stable")
+    assert normalized["hull_damage_norm"].tolist() == [0.0, 0.0, 0.0, 0.1, 0.2, 0.3]
+    assert normalized["cumulative_hull_damage_norm"].tolist() == pytest.approx(
+        [0.0, 0.0, 0.0, np.nan, 0.2, 0.5], nan_ok=True
+    )
+    assert normalized["initial_hull_health"].tolist()[1] == 0.0
+
+
+def test_negative_damage_is_rejected() -> None:
+    df = get_gvs("3-armada.csv").df
+    df.loc[df.index[0], "shield_damage"] = -1.0
+    with pytest.raises(ValueError):
+        _gvs(df)
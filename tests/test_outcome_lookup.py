@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import pandas as pd
 import pytest
 
 from stfc_parser.core.Outcome import Outcome
@@ -71,3 +72,44 @@ def test_outcome_lookup_infers_results(
         assert (
             _outcome_for_name(session_info, outcome_lookup, name) == expected_outcome
         )
+
+
+def test_outcome_lookup_expands_alliances_seen_in_combat() -> None:
+    players_df = pd.DataFrame(
+        {
+            "Player Name": [" Alice", "Bob", "Alice", "Borg Cube"],
+            "Ship Name": ["NX-01", "Defiant", "NX-01", "Cube"],
+            "Alliance": [pd.NA, "FED", pd.NA, pd.NA],
+            "Outcome": ["unknown", "win", "DEFEAT", "DEFEAT"],
+        }
+    )
+    combat_df = pd.DataFrame(
+        {
+            "attacker_name": ["Alice", "Alice ", "Bob", "Borg Cube", None],
+            "attacker_ship": ["NX-01", "NX-01", "Defiant", "Cube", "NX-01"],
+            "attacker_alliance": ["FED", "TNG", "FED", pd.NA, "FED"],
+        }
+    )
+
+    assert Outcome(players_df, combat_df).build_outcome_lookup() == {
+        ("Bob", "FED", "Defiant"): "win",
+        ("Alice", "", "NX-01"): "DEFEAT",
+        ("Alice", "FED", "NX-01"): "DEFEAT",
+        ("Alice", "TNG", "NX-01"): "DEFEAT",
+        ("Borg Cube", "", "Cube"): "DEFEAT",
+    }
+
+
+def test_batch_lookups_match_per_session_lookups() -> None:
+    sessions = [
+        helpers.get_session_info(name)
+        for name in ("1.csv", "2-outpost-retal.csv", "3-armada.csv", "4-partial.csv", "5-kren.csv")
+    ]
+    empty = (pd.DataFrame(), sessions[0].combat_df)
+
+    lookups = Outcome.build_outcome_lookups(
+        [(session.players_df, session.combat_df) for session in sessions] + [empty]
+    )
+
+    assert lookups == [session.build_outcome_lookup() for session in sessions] + [{}]
+    assert SessionInfo.build_outcome_lookups(sessions) == lookups[:-1]
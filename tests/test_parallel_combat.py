@@ -0,0 +1,58 @@
+"""Tests for splitting one combat section across worker processes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from stfc_parser.BattleSectionParser import BattleSectionParser, split_combat_section
+from stfc_parser.StartsWhen import tokenize_sections
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+
+@pytest.fixture
+def small_pieces(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The fixtures are far below the real threshold; split them anyway.
+    monkeypatch.setattr(
+        BattleSectionParser, "parallel_parts", classmethod(lambda cls, section_bytes, workers: workers)
+    )
+
+
+@pytest.mark.parametrize("fname", ["1.csv", "2-outpost-retal.csv", "3-armada.csv"])
+def test_parallel_parse_matches_serial(fname: str, small_pieces: None) -> None:
+    file_bytes = (LOGS / fname).read_bytes()
+    expected, expected_raw = BattleSectionParser(file_bytes).parse()
+    combat_df, raw_df = BattleSectionParser(file_bytes, workers=3).parse()
+    pd.testing.assert_frame_equal(combat_df, expected)
+    pd.testing.assert_frame_equal(raw_df, expected_raw)
+
+
+def test_pieces_cover_every_row_and_prefer_round_boundaries() -> None:
+    combat = tokenize_sections((LOGS / "1.csv").read_bytes())["combat"]
+    header, pieces = split_combat_section(combat, 4)
+
+    assert header.startswith(b"Round\tBattle Event\tType")
+    assert len(pieces) == 4
+    assert header + b"".join(pieces) == bytes(combat).rstrip()
+    for before, after in zip(pieces, pieces[1:]):
+        last_round = bytes(before).rstrip().rsplit(b"\n", 1)[-1].split(b"\t", 1)[0]
+        assert bytes(after).split(b"\t", 1)[0] != last_round
+
+
+def test_small_sections_parse_serially() -> None:
+    sections = tokenize_sections((LOGS / "1.csv").read_bytes())
+    assert BattleSectionParser(b"", workers=4)._parse_parallel(sections, soft=False) is None
+
+
+def test_cost_model_splits_only_when_it_pays() -> None:
+    mib = 2**20
+    parts = BattleSectionParser.parallel_parts
+    assert parts(mib // 2, 8, cpus=64, start_method="fork") == 1
+    assert parts(mib // 2, 8, cpus=64, start_method="spawn") == 1
+    assert parts(50 * mib, 2, cpus=1, start_method="fork") == 1
+    assert parts(50 * mib, 8, cpus=4, start_method="fork") == 4
+    assert parts(5 * mib, 8, cpus=8, start_method="fork") > 1
+    assert parts(5 * mib, 8, cpus=8, start_method="spawn") == 1
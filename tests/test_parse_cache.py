@@ -0,0 +1,102 @@
+"""Tests for the on-disk parse cache."""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import os
+import pickle
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from stfc_parser import cache as cache_module
+from stfc_parser.cache import ParseCache
+from stfc_parser import parser_stub
+from stfc_parser.parser_stub import parse_battle
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+
+def test_warm_hit_returns_identical_frames(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path)
+    file_bytes = (LOGS / "1.csv").read_bytes()
+
+    cold = parse_battle(file_bytes, "1.csv", cache=cache)
+    warm = parse_battle(file_bytes, "1.csv", cache=cache)
+
+    assert (cache.stats.misses, cache.stats.hits, cache.stats.stores) == (1, 1, 1)
+    for field in ("combat_df", "players_df", "fleets_df", "loot_df", "raw_combat_df"):
+        pd.testing.assert_frame_equal(getattr(warm, field), getattr(cold, field))
+    # Entries leave the raw combat section behind; a hit reads it from file_bytes.
+    assert cache.size_bytes() < len(file_bytes) + len(pickle.dumps(cold.combat_df, protocol=5))
+
+
+def test_cache_key_depends_on_content(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path)
+    assert cache.key_for(b"a") != cache.key_for(b"b")
+    assert cache.get(b"never stored") is None
+    assert cache.stats.misses == 1
+
+
+def test_cache_forwards_read_options_and_rejects_lazy(tmp_path: Path, monkeypatch) -> None:
+    cache = ParseCache(tmp_path)
+    file_bytes = (LOGS / "1.csv").read_bytes()
+    with pytest.raises(ValueError):
+        parse_battle(file_bytes, "1.csv", cache=cache, lazy=True)
+
+    calls = []
+    original = parser_stub.parse_battle
+
+    def recording_parse(*args, **kwargs):
+        calls.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(parser_stub, "parse_battle", recording_parse)
+    cache.parse(file_bytes, "1.csv", engine="auto", workers=2)
+    assert calls == [{"engine": "auto", "workers": 2}]
+    monkeypatch.setattr(cache_module, "resolve_engine", lambda engine: engine)
+    assert cache.key_for(file_bytes, engine="pyarrow") != cache.key_for(file_bytes)
+
+
+def test_cache_key_depends_on_format_version(tmp_path: Path, monkeypatch) -> None:
+    cache = ParseCache(tmp_path)
+    before = cache.key_for(b"a")
+    monkeypatch.setattr(cache_module, "CACHE_FORMAT_VERSION", cache_module.CACHE_FORMAT_VERSION + 1)
+    cache_module.parser_fingerprint.cache_clear()
+    try:
+        assert cache.key_for(b"a") != before
+    finally:
+        cache_module.parser_fingerprint.cache_clear()
+
+
+def test_parser_modules_cover_their_stfc_parser_imports() -> None:
+    # Imported by parser_stub for other entry points; none shapes an eager parse.
+    outside_parse = {"stfc_parser.LazyParsedBattle", "stfc_parser.SessionInfo", "stfc_parser.cache"}
+    covered = set(cache_module.PARSER_MODULES)
+    for name in cache_module.PARSER_MODULES:
+        tree = ast.parse(Path(importlib.import_module(name).__file__).read_text())
+        imported = {
+            node.module
+            for node in ast.walk(tree)
+            if isinstance(node, ast.ImportFrom) and (node.module or "").startswith("stfc_parser")
+        }
+        assert imported - outside_parse <= covered, name
+
+
+def test_lru_eviction_keeps_recent_entries(tmp_path: Path) -> None:
+    cache = ParseCache(tmp_path)
+    logs = [(LOGS / name).read_bytes() for name in ("1.csv", "4-partial.csv", "5-kren.csv")]
+    for index, file_bytes in enumerate(logs[:2]):
+        cache.parse(file_bytes, "log.csv")
+        entry = cache._path(cache.key_for(file_bytes))
+        os.utime(entry, ns=(index * 10**9, index * 10**9))
+
+    cache.max_bytes = cache.size_bytes()
+    cache.parse(logs[2], "log.csv")
+
+    assert cache.stats.evictions >= 1
+    assert cache.get(logs[0]) is None
+    assert cache.get(logs[2]) is not None
+    assert cache.size_bytes() <= cache.max_bytes
@@ -0,0 +1,67 @@
+"""Tests for the ParsedBattle result container."""
+
+from __future__ import annotations
+
+import pickle
+from pathlib import Path
+
+import pandas as pd
+
+from stfc_parser import BattleSectionParser as battle_section_parser
+from stfc_parser.BattleSectionParser import BattleSectionParser
+from stfc_parser.ParsedBattle import ParsedBattle
+from stfc_parser.StartsWhen import tokenize_sections
+from stfc_parser.parser_stub import parse_battle
+from stfc_parser.SessionInfo import SessionInfo
+from helpers import get_parsed_battle, get_session_info
+
+
+def test_parsed_battle_keeps_side_frames_out_of_attrs() -> None:
+    battle = get_parsed_battle("1.csv")
+    assert battle.combat_df.attrs == {}
+    assert len(battle.players_df) == 2
+    assert isinstance(battle.fleets_df, pd.DataFrame)
+    assert isinstance(battle.loot_df, pd.DataFrame)
+    assert isinstance(battle.raw_combat_df, pd.DataFrame)
+
+
+def test_default_parse_reads_the_combat_section_once(monkeypatch) -> None:
+    reads = []
+    original = battle_section_parser.read_section_csv
+
+    def counting_read(*args, **kwargs):
+        reads.append(kwargs.get("dtype"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(battle_section_parser, "read_section_csv", counting_read)
+    file_bytes = (Path(__file__).resolve().parent / "logs" / "1.csv").read_bytes()
+    battle = parse_battle(file_bytes, "1.csv")
+    assert len(reads) == 1
+
+    expected = BattleSectionParser(file_bytes).read_raw(tokenize_sections(file_bytes))
+    pd.testing.assert_frame_equal(battle.raw_combat_df, expected)
+    assert battle.raw_combat_df is battle.raw_combat_df
+    assert reads.count(str) == 2
+
+    # The reader holds the export; pickles carry the parsed frames only.
+    unpickled = pickle.loads(pickle.dumps(battle, protocol=5))
+    assert unpickled.raw_combat is None and unpickled.raw_combat_df is None
+    pd.testing.assert_frame_equal(unpickled.combat_df, battle.combat_df)
+
+
+def test_legacy_attrs_round_trip() -> None:
+    battle = get_parsed_battle("1.csv")
+    combat_df = battle.to_combat_df()
+    assert combat_df.attrs["players_df"] is battle.players_df
+    assert battle.combat_df.attrs == {}
+
+    restored = ParsedBattle.from_combat_df(combat_df)
+    assert restored.players_df is battle.players_df
+    assert restored.combat_df.attrs == {}
+
+
+def test_session_info_accepts_parsed_battle() -> None:
+    battle = get_parsed_battle("1.csv")
+    session = SessionInfo(battle)
+    assert session.players_df is battle.players_df
+    assert session.combatant_names() == get_session_info("1.csv").combatant_names()
@@ -0,0 +1,41 @@
+"""Tests for precompiled schema plans."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from stfc_parser.frames import copy_on_write_enabled
+from stfc_parser.schemas import CombatSchema, LootSchema, get_schema_plan
+from stfc_parser.schemas.CombatSchema import COMBAT_COLUMN_ORDER
+
+
+def test_plan_is_compiled_once() -> None:
+    plan = get_schema_plan(CombatSchema)
+    assert get_schema_plan(CombatSchema) is plan
+    assert plan.renames["Round"] == "round"
+    assert plan.aliases == {"damage_after_apex": "applied_damage"}
+    assert "round" in plan.required
+    assert get_schema_plan(LootSchema).renames == {}
+
+
+def test_apply_renames_aliases_and_orders_without_copying() -> None:
+    df = pd.DataFrame(
+        {
+            "Charging Weapons %": ["--"],
+            "applied_damage": [5.0],
+            "Battle Event": [2],
+            "Round": [1],
+        }
+    )
+    normalized = get_schema_plan(CombatSchema).apply(df)
+
+    assert list(normalized.columns) == [
+        column
+        for column in COMBAT_COLUMN_ORDER
+        if column in {"round", "battle_event", "applied_damage", "damage_after_apex"}
+    ] + ["Charging Weapons %"]
+    assert normalized["damage_after_apex"].tolist() == [5.0]
+    shared = np.shares_memory(normalized["applied_damage"].to_numpy(), df["applied_damage"].to_numpy())
+    # Without copy-on-write pandas copies on set_axis, which keeps the input safe.
+    assert shared or not copy_on_write_enabled()
@@ -0,0 +1,66 @@
+"""Tests for the optional pyarrow section reader engine."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from stfc_parser import StartsWhen
+from stfc_parser.BattleSectionParser import BattleSectionParser
+from stfc_parser.StartsWhen import resolve_engine, section_to_dataframe, tokenize_sections
+from stfc_parser.parser_stub import parse_battle
+from stfc_parser.schemas import CombatSchema
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+HEADER = "Round\tBattle Event\tType\tAttacker Name\tCritical Hit?\tHull Damage\tTotal Damage\n"
+
+
+@pytest.fixture
+def no_pyarrow(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(StartsWhen, "pyarrow_available", lambda: False)
+    resolve_engine.cache_clear()
+    yield
+    resolve_engine.cache_clear()
+
+
+def test_unknown_engine_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        resolve_engine("python")
+
+
+def test_pyarrow_request_falls_back_to_c_without_pyarrow(no_pyarrow) -> None:
+    assert resolve_engine("pyarrow") == "c"
+    assert resolve_engine("auto") == "c"
+    df = section_to_dataframe("Reward Name\tCount\nLatinum\t5", "Reward Name\tCount", engine="pyarrow")
+    assert df.to_dict("records") == [{"Reward Name": "Latinum", "Count": "5"}]
+
+
+def test_pyarrow_engine_reads_arrow_backed_columns() -> None:
+    pytest.importorskip("pyarrow")
+    sections = tokenize_sections((LOGS / "1.csv").read_bytes())
+    df = BattleSectionParser(b"", engine="pyarrow").read_typed(sections)
+    assert isinstance(df["Attacker Name"].dtype, pd.ArrowDtype)
+    assert str(df["Hull Damage"].dtype) == "double[pyarrow]"
+    assert str(df["Critical Hit?"].dtype) == "bool[pyarrow]"
+
+
+def test_pyarrow_engine_falls_back_on_thousands_separator() -> None:
+    pytest.importorskip("pyarrow")
+    text = HEADER + "1\t2\tAttack\tAlice\tYES\t1,234\t--\n"
+    df = BattleSectionParser(b"", engine="pyarrow").read_typed(tokenize_sections(text))
+    assert df.loc[0, "Hull Damage"] == 1234.0
+    assert pd.isna(df.loc[0, "Total Damage"])
+
+
+def test_pyarrow_engine_matches_c_engine() -> None:
+    pytest.importorskip("pyarrow")
+    file_bytes = (LOGS / "1.csv").read_bytes()
+    expected = parse_battle(file_bytes, "1.csv")
+    actual = parse_battle(file_bytes, "1.csv", engine="pyarrow")
+    schema_columns = list(CombatSchema.to_schema().columns)
+    pd.testing.assert_frame_equal(actual.combat_df[schema_columns], expected.combat_df[schema_columns])
+    for key in ("players_df", "fleets_df", "loot_df"):
+        pd.testing.assert_frame_equal(getattr(actual, key), getattr(expected, key), check_dtype=False)
@@ -0,0 +1,48 @@
+"""Tests for the single-pass section tokenizer."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from stfc_parser.BattleSectionParser import BattleSectionParser
+from stfc_parser.StartsWhen import SECTION_HEADERS, extract_sections, tokenize_sections
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+
+@pytest.mark.parametrize("fname", ["1.csv", "3-armada.csv", "4-partial.csv"])
+def test_header_sections_match_extract_sections(fname: str) -> None:
+    file_bytes = (LOGS / fname).read_bytes()
+    expected = extract_sections(file_bytes.decode("utf-8"))
+    sections = tokenize_sections(file_bytes)
+    for key in ("players", "rewards", "fleets"):
+        assert (sections.text(key) or "").rstrip("\n") == expected.get(key, "")
+
+
+@pytest.mark.parametrize("fname", ["1.csv", "3-armada.csv", "4-partial.csv"])
+def test_parse_with_sections_returns_extracted_text(fname: str) -> None:
+    file_bytes = (LOGS / fname).read_bytes()
+    parser = BattleSectionParser(file_bytes)
+    df, raw_df, sections = parser.parse_with_sections()
+    assert len(raw_df) == len(df)
+    assert dict(sections) == extract_sections(file_bytes.decode("utf-8"))
+    assert all(isinstance(text, str) for text in sections.values())
+
+
+def test_combat_section_runs_to_end_of_file() -> None:
+    file_bytes = (LOGS / "1.csv").read_bytes()
+    sections = tokenize_sections(file_bytes)
+    combat = sections["combat"]
+    assert isinstance(combat, memoryview)
+    assert combat.obj is file_bytes
+    assert bytes(combat).startswith(SECTION_HEADERS["combat"].encode())
+    assert sections.spans["combat"][1] == len(file_bytes)
+
+
+def test_missing_sections_are_absent() -> None:
+    sections = tokenize_sections("Reward Name\tCount\nLatinum\t5\n")
+    assert set(sections) == {"rewards"}
+    assert sections.get("combat") is None
+    assert sections.reader("combat") is None
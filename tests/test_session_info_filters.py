@@ -158,3 +158,34 @@ def test_below_deck_officers_from_fixture_1() -> None:
     # So below deck should include the other 4 names
     expected = {"Harry Kim", "PIC Hugh", "Masriad Vael", "Seska"}
     assert expected.issubset(below_deck)
+
+
+def test_filter_partial_specs_and_missing_values_use_cached_index() -> None:
+    session = _make_session_from_rows(
+        [
+            {"attacker_name": "Alice", "attacker_alliance": "TD", "attacker_ship": "BORG CUBE"},
+            {"attacker_name": "Bob", "attacker_alliance": None, "attacker_ship": "BORG CUBE"},
+            {"attacker_name": "Carol", "attacker_alliance": "TD", "attacker_ship": "NX-01"},
+            {"attacker_name": "Alice", "attacker_alliance": "TD", "attacker_ship": "NX-01"},
+        ]
+    )
+
+    by_alliance = session.get_combat_df_filtered_by_attackers(
+        [ShipSpecifier(name=None, alliance="TD", ship=None)]
+    )
+    by_ship = session.get_combat_df_filtered_by_attackers(
+        [ShipSpecifier(name="", alliance="", ship="BORG CUBE")]
+    )
+    overlapping = session.get_combat_df_filtered_by_attackers(
+        [
+            ShipSpecifier(name="Alice", alliance=None, ship=None),
+            ShipSpecifier(name=None, alliance=None, ship="NX-01"),
+        ]
+    )
+
+    assert by_alliance.index.tolist() == [0, 2, 3]
+    assert by_ship.index.tolist() == [0, 1]
+    assert overlapping.index.tolist() == [0, 2, 3]
+    assert session.combatant_filter.role_index("attacker") is session.combatant_filter.role_index(
+        "attacker"
+    )
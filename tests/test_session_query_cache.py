@@ -0,0 +1,73 @@
+"""Tests for the memoized SessionInfo query layer."""
+
+from __future__ import annotations
+
+from itertools import cycle, islice
+
+import pandas as pd
+
+from stfc_parser.SessionInfo import SessionInfo
+from helpers import get_parsed_battle
+
+
+class CountingBattle:
+    """Wrap a ParsedBattle and count how often each frame is fetched."""
+
+    def __init__(self, battle) -> None:
+        self._battle = battle
+        self.reads: dict[str, int] = {}
+
+    def __getattr__(self, name: str):
+        if name.endswith("_df"):
+            self.reads[name] = self.reads.get(name, 0) + 1
+        return getattr(self._battle, name)
+
+
+def test_page_render_touches_combat_frame_a_handful_of_times() -> None:
+    battle = CountingBattle(get_parsed_battle("3-armada.csv"))
+    session = SessionInfo(battle)
+    assert battle.reads == {}
+
+    ships = sorted(session.get_every_ship(), key=str)
+    calls = [
+        session.combatant_names,
+        session.alliance_names,
+        session.build_outcome_lookup,
+        *(lambda s=s: session.get_ships(s.name) for s in ships),
+        *(lambda s=s: session.get_bridge_crew(s.name, s.ship) for s in ships),
+        *(lambda s=s: session.all_officer_names(s.name, s.ship) for s in ships),
+    ]
+    for call in islice(cycle(calls), 200):
+        call()
+
+    assert battle.reads["combat_df"] <= 5
+    totals = session.query_cache.totals()
+    assert totals.hits + totals.misses == 201
+    assert totals.misses == len(calls) + 1
+
+
+def test_memoized_results_match_and_are_detached() -> None:
+    session = SessionInfo(get_parsed_battle("1.csv"))
+    fresh = SessionInfo(get_parsed_battle("1.csv"))
+
+    names = session.combatant_names()
+    names.add("intruder")
+    assert session.combatant_names() == fresh.combatants.combatant_names()
+    assert session.get_ships("XanOfHanoi") == fresh.ships.get_ships("XanOfHanoi")
+    assert session.cache_stats()["combatant_names"].hits == 1
+
+
+def test_parameterized_cache_is_bounded() -> None:
+    session = SessionInfo(get_parsed_battle("1.csv"))
+    for i in range(200):
+        session.get_ships(f"nobody-{i}")
+    stats = session.cache_stats()["get_ships"]
+    assert stats.stores == 200
+    assert stats.evictions == 200 - 128
+
+
+def test_filters_read_through_lazily_built_helpers() -> None:
+    session = SessionInfo(get_parsed_battle("1.csv"))
+    assert "combatant_filter" not in vars(session)
+    assert isinstance(session.get_combat_df_filtered_by_attackers([]), pd.DataFrame)
+    assert "combatant_filter" in vars(session)
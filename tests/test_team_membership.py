@@ -0,0 +1,67 @@
+"""Tests for per-row team membership codes and team aggregates."""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from stfc_parser.ShipSpecifier import ShipSpecifier
+from stfc_parser.core.TeamMembership import NO_TEAM, TEAM_ONE, TEAM_TWO, TeamMembership
+from helpers import get_session_info
+
+
+def _membership() -> TeamMembership:
+    players_df = pd.DataFrame(
+        {
+            "Player Name": ["Alice", "Bob", "Borg Cube"],
+            "Ship Name": ["NX-01", "Defiant", "Cube"],
+            "Alliance": [pd.NA, "FED", pd.NA],
+            "Outcome": ["VICTORY", "VICTORY", "DEFEAT"],
+        }
+    )
+    combat_df = pd.DataFrame(
+        {
+            "round": [1, 1, 2, 2, 2],
+            "attacker_name": ["Alice", "Bob", "Borg Cube", "Alice", "Stranger"],
+            "attacker_alliance": ["TD", "FED", None, "TD", None],
+            "attacker_ship": ["NX-01", "Defiant", "Cube", "NX-01", "Shuttle"],
+            "target_name": ["Borg Cube", "Borg Cube", "Bob", "Borg Cube", "Alice"],
+            "target_alliance": [None, None, "FED", None, "TD"],
+            "target_ship": ["Cube", "Cube", "Defiant", "Cube", "NX-01"],
+            "applied_damage": [10.0, 5.0, 7.0, None, 1.0],
+        }
+    )
+    return TeamMembership(players_df, combat_df)
+
+
+def test_rows_are_tagged_with_attacker_and_target_teams() -> None:
+    membership = _membership()
+    # Alice has no alliance in the players section, so she also claims TD from combat.
+    assert membership.team_codes("attacker").tolist() == [TEAM_ONE, TEAM_ONE, TEAM_TWO, TEAM_ONE, NO_TEAM]
+    assert membership.team_codes("target").tolist() == [TEAM_TWO, TEAM_TWO, TEAM_ONE, TEAM_TWO, TEAM_ONE]
+
+    tagged = membership.team_combat_df
+    assert tagged["attacker_team"].tolist() == membership.team_codes("attacker").tolist()
+    assert "attacker_team" not in membership.combat_df.columns
+    assert membership.members(TEAM_TWO) == [ShipSpecifier("Borg Cube", "", "Cube")]
+
+
+def test_damage_by_round_sums_dealt_and_received_per_team() -> None:
+    damage = _membership().damage_by_round()
+    assert damage.loc[(1, TEAM_ONE)].tolist() == [15.0, 0.0]
+    assert damage.loc[(1, TEAM_TWO)].tolist() == [0.0, 15.0]
+    assert damage.loc[(2, TEAM_ONE)].tolist() == [0.0, 8.0]
+    assert damage.loc[(2, TEAM_TWO)].tolist() == [7.0, 0.0]
+    assert damage.loc[(2, NO_TEAM)].tolist() == [1.0, 0.0]
+
+
+def test_session_team_damage_matches_groupby() -> None:
+    session = get_session_info("3-armada.csv")
+    tagged = session.get_combat_df_with_teams()
+    damage = tagged["applied_damage"].fillna(0)
+
+    expected = damage.groupby([tagged["round"], tagged["attacker_team"]]).sum()
+    dealt = session.get_team_damage_by_round()["dealt"]
+    assert (dealt.loc[expected.index] - expected).abs().max() < 1e-6 * expected.abs().max()
+    assert session.team_membership.members(TEAM_TWO) == [
+        ShipSpecifier("Borg Polygon 1.2", "", "Borg Polygon 1.2")
+    ]
@@ -0,0 +1,41 @@
+"""Tests for the schema-typed combat section read."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+
+from stfc_parser.BattleSectionParser import BattleSectionParser
+from stfc_parser.StartsWhen import tokenize_sections
+
+LOGS = Path(__file__).resolve().parent / "logs"
+
+HEADER = "Round\tBattle Event\tType\tAttacker Name\tCritical Hit?\tHull Damage\tTotal Damage\n"
+
+
+def test_typed_read_parses_numbers_and_yes_no() -> None:
+    sections = tokenize_sections((LOGS / "1.csv").read_bytes())
+    df = BattleSectionParser(b"").read_typed(sections)
+    assert df["Round"].dtype == "float64"
+    assert df["Hull Damage"].dtype == "float64"
+    assert df["Critical Hit?"].dtype == "boolean"
+    assert pd.api.types.is_string_dtype(df["Attacker Name"])
+
+
+def test_thousands_and_na_tokens_at_read_time() -> None:
+    text = HEADER + "1\t2\tAttack\tAlice\tYES\t1,234\t--\n"
+    df = BattleSectionParser(b"").read_typed(tokenize_sections(text))
+    assert df.loc[0, "Hull Damage"] == 1234.0
+    assert pd.isna(df.loc[0, "Total Damage"])
+    assert df.loc[0, "Critical Hit?"]
+
+
+def test_unparseable_column_falls_back_to_string_read() -> None:
+    text = HEADER + "1\t2\tAttack\tAlice\tYES\tlots\t10\n"
+    parser = BattleSectionParser(text)
+    assert parser.read_typed(tokenize_sections(text))["Hull Damage"].tolist() == ["lots"]
+
+    combat_df, _ = parser.parse(soft=True)
+    assert pd.isna(combat_df.loc[0, "hull_damage"])
+    assert combat_df.loc[0, "total_normal"] == 10.0